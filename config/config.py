@@ -35,6 +35,53 @@ MIN_VIEW_COUNT = 5000  # 최소 조회수
 MAX_VIDEO_DURATION = 60  # 초 단위, 원본 영상 최대 길이
 SHORTS_DURATION = 30  # 초 단위, 최종 쇼츠 영상 길이
 
+# TTS 설정
+TTS_VOICE_ID = os.getenv('TTS_VOICE_ID', '21m00Tcm4TlvDq8ikWAM')  # ElevenLabs 기본 음성 ID
+DEFAULT_CHARS_PER_SECOND = 4  # 측정된 나레이션 길이가 부족할 때 사용할 말하기 속도 (초당 글자 수)
+DURATION_MODEL_MIN_SAMPLES = 3  # 음성/구간별 길이 모델을 사용하기 위한 최소 측정 수
+TTS_MODEL_ID = os.getenv('TTS_MODEL_ID', 'eleven_monolingual_v1')  # ElevenLabs 음성 합성 모델
+TTS_VOICE_SETTINGS = {'stability': 0.5, 'similarity_boost': 0.75}
+TTS_MAX_CONCURRENCY = int(os.getenv('TTS_MAX_CONCURRENCY', 4))  # 나레이션 구간 동시 합성 수 (ElevenLabs 요금제 동시 요청 한도 이내)
+TTS_RETRY_TOTAL = 3  # 나레이션 구간별 최대 재시도 횟수 (429/5xx 응답, 연결 오류)
+
+# 음성 인식(ASR) 설정
+ASR_BACKEND = os.getenv('ASR_BACKEND', 'openai')  # 'openai' (Whisper API) 또는 'local' (CPU 로컬 모델)
+LOCAL_ASR_MODEL = os.getenv('LOCAL_ASR_MODEL', 'small')  # faster-whisper 모델 크기 또는 경로
+LOCAL_ASR_COMPUTE_TYPE = 'int8'  # CPU용 int8 양자화
+LOCAL_ASR_WORKERS = int(os.getenv('LOCAL_ASR_WORKERS', max(1, (os.cpu_count() or 2) // 2)))  # 프로세스 풀 크기
+LOCAL_ASR_CHUNK_SECONDS = 120  # 프로세스별로 나누어 처리할 오디오 구간 길이 (초)
+
+# 요약 설정
+SUMMARY_TOKEN_BUDGET = 1500  # 요약 요청 전 추출 요약으로 줄일 최대 입력 토큰 수 (None이면 사용 안 함)
+
+# 콘텐츠 생성 설정
+CONTENT_GENERATION_MODE = os.getenv('CONTENT_GENERATION_MODE', 'one_shot')  # 'one_shot' (스크립트/제목/태그 단일 요청) 또는 'staged' (단계별 요청)
+
+# 후보 생성 설정 (Hook/제목 후보를 한 번에 생성하고 로컬에서 점수 계산)
+CONTENT_CANDIDATES = 4  # 한 번의 요청으로 생성할 Hook/제목 후보 수
+HOOK_MAX_SECONDS = 3  # Hook 멘트 목표 길이 (초)
+TITLE_MAX_CHARS = 30  # 제목 최대 글자 수
+CANDIDATE_SCORE_WEIGHTS = {'length': 0.4, 'template': 0.2, 'history': 0.4}  # 길이 적합도, 템플릿 부합도, 과거 성과 유사도 가중치
+CANDIDATE_HISTORY_SIZE = 20  # 유사도를 비교할 과거 성과 상위 영상 수
+
+# 제목/태그 생성 제한 시간 설정
+TITLE_DEADLINE_SECONDS = 8  # 이 시간 안에 LLM 응답이 없으면 로컬에서 만든 제목/태그로 진행
+TITLE_LATE_WAIT_SECONDS = 120  # 업로드 후 늦게 도착한 LLM 제목/태그를 기다려 반영할 최대 시간
+
+# 제목/태그 일괄 생성 설정
+TITLE_BATCH_TOKEN_BUDGET = 6000  # 제목/태그 일괄 생성 요청 한 번에 담을 스크립트의 최대 추정 토큰 수
+
+# 번역 설정
+TRANSLATION_UNIT_SECONDS = 300  # 번역 단위를 나누는 자막 시간축 경계 간격 (초), 자막 갱신 시 변경된 단위만 재번역
+RETRANSLATE_SUMMARY_THRESHOLD = 0.15  # 자막 갱신 시 요약을 다시 생성할 최소 변경 비율
+
+# 일괄 처리 설정 (백엔드별 동시 요청 수)
+BATCH_MAX_WORKERS = 16  # 동시에 처리할 최대 영상 수
+CAPTION_CONCURRENCY = 8  # YouTube 자막 수집
+MEDIA_DOWNLOAD_CONCURRENCY = 3  # 원본 영상 다운로드
+ASR_CONCURRENCY = 2  # 음성 인식 (Whisper API 또는 로컬 모델)
+LLM_CONCURRENCY = 4  # GPT 번역/요약 요청
+
 # 업로드 설정
 UPLOAD_SCHEDULE = {
     'morning': '10:00',
@@ -46,5 +93,54 @@ DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__
 LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
 TEMP_DIR = os.path.join(DATA_DIR, 'temp')
 
+# 미디어 캐시 설정 (자막 처리와 영상 제작 단계가 원본 영상을 공유)
+MEDIA_CACHE_DIR = os.path.join(DATA_DIR, 'media_cache')
+MEDIA_CACHE_MAX_BYTES = int(os.getenv('MEDIA_CACHE_MAX_BYTES', 10 * 1024 ** 3))  # 기본 10GB
+SOURCE_DOWNLOAD_MODE = os.getenv('SOURCE_DOWNLOAD_MODE', 'section')  # 'section' (필요한 구간만) 또는 'full' (전체 영상)
+SECTION_PREROLL_SECONDS = 1  # 구간 다운로드 시 시작 지점 앞에 더 받을 시간 (초)
+
+# 영상 인코딩 프로필 설정 (libx264)
+# - crf: 품질 기준 (낮을수록 고화질), maxrate: 최대 비트레이트 (없으면 제한 없음)
+# - threads: 인코딩 스레드 수 (0이면 자동), gop: 키프레임 간격 (프레임 수)
+ENCODING_PROFILES = {
+    'draft': {'preset': 'ultrafast', 'crf': 30, 'maxrate': None, 'threads': 0, 'tune': 'fastdecode', 'gop': 60, 'audio_bitrate': '128k'},
+    'publish': {'preset': 'faster', 'crf': 21, 'maxrate': '8M', 'threads': 0, 'tune': None, 'gop': 60, 'audio_bitrate': '192k'},
+    'archive': {'preset': 'slow', 'crf': 18, 'maxrate': None, 'threads': 0, 'tune': 'film', 'gop': 120, 'audio_bitrate': '256k'}
+}
+ENCODING_PROFILE = os.getenv('ENCODING_PROFILE', 'publish')  # 쇼츠 영상 제작에 사용할 프로필
+ENCODING_THREADS = int(os.getenv('ENCODING_THREADS', 0))  # 0이 아니면 모든 프로필의 스레드 수를 덮어씀
+
+# 렌더링 풀 설정 (여러 영상 동시 제작)
+RENDER_THREADS_PER_JOB = int(os.getenv('RENDER_THREADS_PER_JOB', 4))  # 영상 하나에 할당할 FFmpeg 스레드 수
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', max(1, (os.cpu_count() or 1) // RENDER_THREADS_PER_JOB)))  # 동시 렌더링 프로세스 수
+
+# LLM 응답 캐시 설정
+LLM_CACHE_DB = os.path.join(DATA_DIR, 'llm_cache.db')
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 캐시 유효 기간 (초)
+LLM_CACHE_MAX_ENTRIES = 5000  # 최대 캐시 항목 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+LLM_PROMPT_VERSION = '1'  # 프롬프트를 변경하면 올려서 이전 캐시를 무효화
+
+# LLM 요청 헤징 설정 (응답이 느리면 같은 요청을 한 번 더 보내 먼저 온 응답 사용)
+LLM_HEDGING_ENABLED = os.getenv('LLM_HEDGING_ENABLED', 'false').lower() == 'true'
+LLM_HEDGE_CALL_SITES = ['summarize', 'optimize_script', 'generate_content', 'generate_feedback']  # 헤징을 적용할 호출 위치
+LLM_HEDGE_PERCENTILE = 90  # 이 백분위 응답 시간을 넘으면 중복 요청 전송
+LLM_HEDGE_MIN_SAMPLES = 20  # 백분위 계산에 필요한 호출 위치별 최소 측정 수
+LLM_HEDGE_WINDOW = 200  # 호출 위치별로 보관할 최근 응답 시간 수 (LLM 캐시 데이터베이스에 저장되어 실행 간 유지)
+LLM_HEDGE_BUDGET = 10  # LLM_HEDGE_BUDGET_SECONDS 동안 허용할 중복 요청 수 (모든 실행에서 공유)
+LLM_HEDGE_BUDGET_SECONDS = 3600  # 중복 요청 예산을 계산하는 시간 범위 (초)
+
+# 기사 아카이브 설정 (과거 자막/스크립트 전문 검색으로 배경 설명 재사용)
+STORY_ARCHIVE_DB = os.path.join(DATA_DIR, 'story_archive.db')
+STORY_ARCHIVE_MAX_AGE_DAYS = 30  # 재사용할 배경 설명의 최대 경과 일수
+STORY_ARCHIVE_MIN_SIMILARITY = 0.35  # 같은 기사로 판단할 최소 요약 유사도 (특징 겹침 비율)
+STORY_ARCHIVE_MIN_COVERAGE = 0.6  # 요약 전 원문에 포함되어야 하는 과거 요약 특징의 최소 비율 (배경 설명 재사용 판단)
+
+# 나레이션 길이 모델 저장 경로
+DURATION_MODEL_FILE = os.path.join(DATA_DIR, 'duration_model.json')
+
+# TTS 오디오 캐시 설정 (같은 문장/음성/설정의 합성 결과 재사용)
+TTS_CACHE_DIR = os.path.join(DATA_DIR, 'tts_cache')
+TTS_CACHE_MAX_BYTES = int(os.getenv('TTS_CACHE_MAX_BYTES', 500 * 1024 ** 2))  # 기본 500MB
+
 # 로그 설정
 LOG_LEVEL = 'INFO'
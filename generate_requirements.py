@@ -13,12 +13,14 @@ packages = [
     "google-auth-httplib2",
     "youtube-transcript-api",
     "openai",
+    "faster-whisper",
     "elevenlabs",
     "ffmpeg-python",
     "python-dotenv",
     "requests",
     "tqdm",
     "numpy",
+    "scipy",
     "pandas"
 ]
 
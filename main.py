@@ -19,6 +19,9 @@ from src.content_generator import ContentGenerator
 from src.video_producer import VideoProducer
 from src.youtube_uploader import YouTubeUploader
 from src.feedback_processor import FeedbackProcessor
+from src.encoding_benchmark import run_benchmark, format_report
+from src.render_pool import RenderPool
+from config.config import CONTENT_GENERATION_MODE, TITLE_LATE_WAIT_SECONDS
 
 # 로깅 설정
 logging.basicConfig(
@@ -41,6 +44,10 @@ def parse_arguments():
     parser.add_argument('--upload-only', action='store_true', help='업로드만 실행')
     parser.add_argument('--analyze', action='store_true', help='성과 분석 및 피드백 생성 실행')
     parser.add_argument('--video-id', type=str, help='처리할 특정 영상 ID')
+    parser.add_argument('--video-ids', type=str, help='일괄 자막 처리할 영상 ID 목록 (쉼표로 구분)')
+    parser.add_argument('--refresh-transcript', action='store_true', help='수정된 자막을 다시 가져와 변경된 부분만 재번역')
+    parser.add_argument('--render-ids', type=str, help='저장된 스크립트로 여러 영상을 동시에 제작할 영상 ID 목록 (쉼표로 구분)')
+    parser.add_argument('--benchmark-encoding', type=str, metavar='CLIP', help='클립 파일로 인코딩 프로필별 속도/품질 비교')
     parser.add_argument('--debug', action='store_true', help='디버그 모드 활성화')
     return parser.parse_args()
 
@@ -64,6 +71,12 @@ def main():
     os.makedirs(os.path.join('data', 'feedback'), exist_ok=True)
     os.makedirs(os.path.join('data', 'reports'), exist_ok=True)
     
+    # 인코딩 프로필 벤치마크 모드
+    if args.benchmark_encoding:
+        report = run_benchmark(args.benchmark_encoding)
+        logger.info(f"인코딩 프로필 벤치마크 결과 (CPU {report['cpu_count']}개):\n{format_report(report)}")
+        return
+    
     # 성과 분석 및 피드백 생성 모드
     if args.analyze:
         if not args.video_id:
@@ -104,6 +117,50 @@ def main():
         
         return
     
+    # 여러 영상 일괄 자막 처리 모드
+    if args.video_ids:
+        video_ids = [v.strip() for v in args.video_ids.split(',') if v.strip()]
+        logger.info(f"일괄 자막 처리 시작: {len(video_ids)}개 영상")
+        
+        processor = TranscriptProcessor()
+        failed = []
+        
+        for video_id, transcript_data in processor.process_videos(video_ids):
+            if transcript_data:
+                logger.info(f"자막 추출 및 번역 완료: {video_id}")
+            else:
+                failed.append(video_id)
+        
+        logger.info(f"일괄 자막 처리 완료: 성공 {len(video_ids) - len(failed)}개, 실패 {len(failed)}개")
+        if failed:
+            logger.error(f"실패한 영상: {', '.join(failed)}")
+        
+        return
+    
+    # 여러 영상 동시 제작 모드 (저장된 스크립트 사용)
+    if args.render_ids:
+        video_ids = [v.strip() for v in args.render_ids.split(',') if v.strip()]
+        generator = ContentGenerator()
+        pool = RenderPool()
+        
+        job_ids = {}
+        for video_id in video_ids:
+            script = generator.load_script(video_id)
+            if not script:
+                logger.error(f"스크립트 파일을 찾을 수 없습니다: {video_id}")
+                continue
+            job_ids[pool.submit(script, video_id)] = video_id
+        
+        results = pool.wait(list(job_ids))
+        pool.shutdown()
+        
+        failed = [job_ids[job_id] for job_id, output_path in results.items() if not output_path]
+        logger.info(f"일괄 영상 제작 완료: 성공 {len(results) - len(failed)}개, 실패 {len(failed)}개")
+        if failed:
+            logger.error(f"실패한 영상: {', '.join(failed)}")
+        
+        return
+    
     # 1. YouTube 데이터 수집
     if not args.process_only and not args.generate_only and not args.produce_only and not args.upload_only:
         logger.info("YouTube 데이터 수집 시작")
@@ -141,7 +198,14 @@ def main():
     if not args.generate_only and not args.produce_only and not args.upload_only:
         logger.info(f"자막 추출 및 번역 시작: {video_id}")
         processor = TranscriptProcessor()
-        transcript_data = processor.process_video(video_id)
+        
+        if args.refresh_transcript:
+            transcript_data = processor.refresh_video(video_id)
+        else:
+            transcript_data = processor.process_video(
+                video_id,
+                language_hint=top_video['snippet'].get('defaultAudioLanguage') or top_video['snippet'].get('defaultLanguage')
+            )
         
         if not transcript_data:
             logger.error(f"자막 처리 실패: {video_id}")
@@ -164,20 +228,50 @@ def main():
             transcript_data = json.load(f)
     
     # 3. 콘텐츠 생성
+    generator = None
+    producer = None
+    hook_prefetch = {}
+    
     if not args.produce_only and not args.upload_only:
         logger.info(f"콘텐츠 생성 시작: {video_id}")
         generator = ContentGenerator()
-        script = generator.generate_script(top_video, transcript_data)
-        
-        if not script:
-            logger.error(f"스크립트 생성 실패: {video_id}")
-            return
-        
-        # 스크립트 최적화
-        optimized_script = generator.optimize_script_for_shorts(script)
         
-        # 제목 및 태그 생성
-        title_and_tags = generator.generate_title_and_tags(optimized_script)
+        if CONTENT_GENERATION_MODE == 'one_shot':
+            # 스크립트, 길이 최적화, 제목 및 태그를 한 번의 요청으로 생성
+            # 영상 제작까지 진행하면 응답을 스트리밍으로 받아 Hook 멘트가 완성되는 즉시 TTS 시작
+            on_field = None
+            if not args.generate_only:
+                producer = VideoProducer()
+                
+                def on_field(name, value):
+                    if name == 'hook' and 'hook' not in hook_prefetch:
+                        hook_prefetch['hook'] = value
+                        hook_prefetch['audio'] = producer.start_hook_audio(value, video_id)
+            
+            optimized_script = generator.generate_content(top_video, transcript_data, on_field=on_field)
+            
+            if not optimized_script:
+                logger.error(f"스크립트 생성 실패: {video_id}")
+                return
+            
+            # 단계별 생성으로 전환되어 제한 시간 대체 제목을 사용했으면 source가 'fallback' (늦은 제목 반영 대상)
+            title_and_tags = {
+                'title': optimized_script.get('youtube_title', optimized_script['title']),
+                'tags': optimized_script.get('youtube_tags', []),
+                'source': optimized_script.get('youtube_title_source', 'llm')
+            }
+        else:
+            script = generator.generate_script(top_video, transcript_data)
+            
+            if not script:
+                logger.error(f"스크립트 생성 실패: {video_id}")
+                return
+            
+            # 스크립트 최적화
+            optimized_script = generator.optimize_script_for_shorts(script)
+            
+            # 제목 및 태그 생성
+            title_and_tags = generator.generate_title_and_tags(optimized_script)
         
         logger.info(f"콘텐츠 생성 완료: {video_id}")
         logger.info(f"생성된 제목: {title_and_tags['title']}")
@@ -185,26 +279,30 @@ def main():
         if args.generate_only:
             return
     else:
-        # 저장된 스크립트 로드
-        script_file = os.path.join('data', 'scripts', f"{video_id}_final.json")
+        # 저장된 스크립트 로드 (단일 요청 생성 결과 또는 단계별 생성 결과)
+        optimized_script = ContentGenerator().load_script(video_id)
         
-        if not os.path.exists(script_file):
-            logger.error(f"스크립트 파일을 찾을 수 없습니다: {script_file}")
+        if not optimized_script:
+            logger.error(f"스크립트 파일을 찾을 수 없습니다: {video_id}")
             return
         
-        import json
-        with open(script_file, 'r', encoding='utf-8') as f:
-            optimized_script = json.load(f)
-            title_and_tags = {
-                'title': optimized_script.get('youtube_title', optimized_script.get('title', '')),
-                'tags': optimized_script.get('youtube_tags', [])
-            }
+        title_and_tags = {
+            'title': optimized_script.get('youtube_title', optimized_script.get('title', '')),
+            'tags': optimized_script.get('youtube_tags', [])
+        }
     
     # 4. 영상 제작
     if not args.upload_only:
         logger.info(f"영상 제작 시작: {video_id}")
-        producer = VideoProducer()
-        output_path = producer.create_shorts_video(optimized_script, video_id)
+        if producer is None:
+            producer = VideoProducer()
+        
+        # 스트리밍 중 미리 생성한 Hook 오디오 (최종 Hook 멘트와 같을 때만 사용)
+        hook_audio_path = None
+        if hook_prefetch.get('hook') == optimized_script['hook']:
+            hook_audio_path = hook_prefetch['audio'].result()
+        
+        output_path = producer.create_shorts_video(optimized_script, video_id, hook_audio_path=hook_audio_path)
         
         if not output_path:
             logger.error(f"영상 제작 실패: {video_id}")
@@ -230,6 +328,17 @@ def main():
         logger.error("YouTube API 인증 실패")
         return
     
+    # 렌더링하는 동안 늦은 LLM 제목/태그가 도착했으면 업로드 전에 바로 사용 (업로드 후 제목 변경 방지)
+    late_title = generator.pending_titles.get(video_id) if generator is not None else None
+    if title_and_tags.get('source') == 'fallback' and late_title is not None and late_title.done():
+        late_title_and_tags = generator.wait_for_late_title(video_id, 0)
+        
+        if late_title_and_tags:
+            title_and_tags = late_title_and_tags
+            optimized_script['youtube_title'] = title_and_tags['title']
+            optimized_script['youtube_tags'] = title_and_tags['tags']
+            logger.info(f"업로드 전에 도착한 제목 사용: {title_and_tags['title']}")
+    
     uploaded_video_id = uploader.upload_video(
         video_path=output_path,
         title=title_and_tags['title'],
@@ -244,6 +353,18 @@ def main():
     logger.info(f"영상 업로드 성공: {uploaded_video_id}")
     logger.info(f"YouTube URL: https://www.youtube.com/watch?v={uploaded_video_id}")
     
+    # 제한 시간 초과로 로컬 제목/태그를 사용했으면 늦게 도착한 LLM 결과로 메타데이터 변경
+    if generator is not None and title_and_tags.get('source') == 'fallback':
+        late_title_and_tags = generator.wait_for_late_title(video_id, TITLE_LATE_WAIT_SECONDS)
+        
+        if late_title_and_tags and uploader.update_video_metadata(
+            uploaded_video_id, late_title_and_tags['title'], late_title_and_tags['tags']
+        ):
+            title_and_tags = late_title_and_tags
+            optimized_script['youtube_title'] = title_and_tags['title']
+            optimized_script['youtube_tags'] = title_and_tags['tags']
+            logger.info(f"늦게 도착한 제목으로 변경: {title_and_tags['title']}")
+    
     # 피드백 처리를 위한 메타데이터 저장
     processor = FeedbackProcessor()
     processor.store_video_metadata(
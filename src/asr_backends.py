@@ -0,0 +1,307 @@
+"""
+음성 인식(ASR) 백엔드 모듈
+- 자막이 없는 영상의 음성을 텍스트로 변환하는 백엔드를 제공합니다.
+- OpenAI Whisper API(원격)와 int8 양자화 Whisper 계열 모델(로컬 CPU)을 지원합니다.
+- 설정(ASR_BACKEND)으로 백엔드를 선택하고, 두 백엔드의 속도를 비교할 수 있습니다.
+"""
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+import subprocess
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import openai
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    OPENAI_API_KEY, LOGS_DIR, TEMP_DIR, ASR_BACKEND, LOCAL_ASR_MODEL,
+    LOCAL_ASR_COMPUTE_TYPE, LOCAL_ASR_WORKERS, LOCAL_ASR_CHUNK_SECONDS
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'asr_backends.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('asr_backends')
+
+# OpenAI API 키 설정
+openai.api_key = OPENAI_API_KEY
+
+
+def probe_duration(media_file):
+    """
+    ffprobe로 미디어 파일 길이 조회
+
+    Args:
+        media_file (str): 미디어 파일 경로
+
+    Returns:
+        float: 길이 (초), 실패 시 0.0
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', media_file],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        return float(result.stdout.strip())
+    except Exception as e:
+        logger.warning(f"미디어 길이 조회 실패: {media_file}, 오류: {e}")
+        return 0.0
+
+
+class ASRBackend(ABC):
+    """음성 인식 백엔드 기본 클래스"""
+
+    name = 'base'
+
+    @abstractmethod
+    def transcribe(self, audio_file, language=None):
+        """
+        오디오 파일을 텍스트로 변환
+
+        Args:
+            audio_file (str): 오디오 파일 경로
+            language (str): 언어 힌트 (ISO 639-1, 없으면 자동 감지)
+
+        Returns:
+            dict: 변환 결과 (text, segments, language)
+        """
+
+
+class OpenAIWhisperBackend(ASRBackend):
+    """OpenAI Whisper API 백엔드"""
+
+    name = 'openai'
+
+    def __init__(self, model='whisper-1'):
+        """
+        초기화 함수
+
+        Args:
+            model (str): Whisper API 모델 이름
+        """
+        self.model = model
+
+    def transcribe(self, audio_file, language=None):
+        options = {'model': self.model, 'response_format': 'verbose_json'}
+        if language:
+            options['language'] = language
+
+        with open(audio_file, "rb") as audio:
+            response = openai.audio.transcriptions.create(file=audio, **options)
+
+        segments = []
+        for segment in getattr(response, 'segments', None) or []:
+            if isinstance(segment, dict):
+                start, end, text = segment['start'], segment['end'], segment['text']
+            else:
+                start, end, text = segment.start, segment.end, segment.text
+            segments.append({'text': text.strip(), 'start': start, 'duration': end - start})
+
+        return {
+            'text': response.text,
+            'segments': segments,
+            'language': getattr(response, 'language', None) or language
+        }
+
+
+# 프로세스별로 한 번만 로드되는 로컬 모델
+_worker_model = None
+
+
+def _init_local_worker(model_name, compute_type, cpu_threads):
+    """프로세스 풀 워커 초기화 (모델 로드)"""
+    global _worker_model
+    from faster_whisper import WhisperModel
+    _worker_model = WhisperModel(model_name, device='cpu', compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def _transcribe_chunk(chunk_file, language):
+    """프로세스 풀 워커에서 오디오 구간 하나를 변환"""
+    segments, info = _worker_model.transcribe(chunk_file, language=language, beam_size=1, vad_filter=True)
+    segments = [
+        {'text': s.text.strip(), 'start': s.start, 'duration': s.end - s.start}
+        for s in segments
+    ]
+    return segments, info.language
+
+
+class LocalWhisperBackend(ASRBackend):
+    """로컬 CPU Whisper 백엔드 (faster-whisper, int8 양자화)"""
+
+    name = 'local'
+
+    def __init__(self, model=LOCAL_ASR_MODEL, compute_type=LOCAL_ASR_COMPUTE_TYPE,
+                 workers=LOCAL_ASR_WORKERS, chunk_seconds=LOCAL_ASR_CHUNK_SECONDS):
+        """
+        초기화 함수
+
+        Args:
+            model (str): faster-whisper 모델 크기 또는 경로
+            compute_type (str): 양자화 방식
+            workers (int): 프로세스 풀 크기
+            chunk_seconds (int): 워커별 처리 구간 길이 (초)
+        """
+        self.model = model
+        self.compute_type = compute_type
+        self.workers = max(1, workers)
+        self.chunk_seconds = chunk_seconds
+        self._pool = None
+
+    def _get_pool(self):
+        """프로세스 풀 생성 (최초 1회)"""
+        if self._pool is None:
+            cpu_threads = max(1, (os.cpu_count() or 1) // self.workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_local_worker,
+                initargs=(self.model, self.compute_type, cpu_threads)
+            )
+        return self._pool
+
+    def _split_audio(self, audio_file, work_dir):
+        """
+        오디오를 16kHz 모노 구간 파일로 분할
+
+        Args:
+            audio_file (str): 오디오 파일 경로
+            work_dir (str): 구간 파일을 저장할 디렉토리
+
+        Returns:
+            list: (구간 파일 경로, 시작 시간) 목록
+        """
+        pattern = os.path.join(work_dir, 'chunk_%04d.wav')
+        command = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-i', audio_file,
+            '-ac', '1', '-ar', '16000',
+            '-f', 'segment', '-segment_time', str(self.chunk_seconds),
+            '-reset_timestamps', '1',
+            pattern
+        ]
+        subprocess.run(command, check=True)
+
+        chunks = []
+        offset = 0.0
+        for name in sorted(os.listdir(work_dir)):
+            chunk_file = os.path.join(work_dir, name)
+            chunks.append((chunk_file, offset))
+            offset += probe_duration(chunk_file)
+        return chunks
+
+    def transcribe(self, audio_file, language=None):
+        work_dir = tempfile.mkdtemp(prefix='asr_', dir=TEMP_DIR)
+        try:
+            chunks = self._split_audio(audio_file, work_dir)
+            pool = self._get_pool()
+            futures = [pool.submit(_transcribe_chunk, chunk_file, language) for chunk_file, _ in chunks]
+
+            segments = []
+            detected = []
+            for (_, offset), future in zip(chunks, futures):
+                chunk_segments, chunk_language = future.result()
+                detected.append(chunk_language)
+                for segment in chunk_segments:
+                    segment['start'] += offset
+                    segments.append(segment)
+
+            return {
+                'text': ' '.join(s['text'] for s in segments),
+                'segments': segments,
+                'language': language or (max(set(detected), key=detected.count) if detected else None)
+            }
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+ASR_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    LocalWhisperBackend.name: LocalWhisperBackend
+}
+
+# 백엔드 인스턴스 캐시 (로컬 모델 프로세스 풀 재사용)
+_backend_instances = {}
+
+
+def get_asr_backend(name=ASR_BACKEND):
+    """
+    이름으로 ASR 백엔드 인스턴스 조회
+
+    Args:
+        name (str): 백엔드 이름 ('openai', 'local')
+
+    Returns:
+        ASRBackend: 백엔드 인스턴스
+    """
+    if name not in ASR_BACKENDS:
+        raise ValueError(f"지원하지 않는 ASR 백엔드: {name} (사용 가능: {', '.join(ASR_BACKENDS)})")
+
+    if name not in _backend_instances:
+        _backend_instances[name] = ASR_BACKENDS[name]()
+    return _backend_instances[name]
+
+
+def benchmark_backends(audio_file, backend_names=None, language=None, repeat=1):
+    """
+    ASR 백엔드별 변환 속도 비교
+
+    Args:
+        audio_file (str): 테스트용 오디오 파일 경로
+        backend_names (list): 비교할 백엔드 이름 목록 (없으면 전체)
+        language (str): 언어 힌트
+        repeat (int): 백엔드별 반복 횟수
+
+    Returns:
+        list: 백엔드별 측정 결과
+    """
+    audio_duration = probe_duration(audio_file)
+    results = []
+
+    for name in backend_names or list(ASR_BACKENDS):
+        backend = get_asr_backend(name)
+        timings = []
+        output = None
+
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                output = backend.transcribe(audio_file, language=language)
+                timings.append(time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"ASR 벤치마크 실패: {name}, 오류: {e}")
+            results.append({'backend': name, 'error': str(e)})
+            continue
+
+        best = min(timings)
+        results.append({
+            'backend': name,
+            'audio_duration': audio_duration,
+            'wall_time': best,
+            'mean_wall_time': sum(timings) / len(timings),
+            'real_time_factor': best / audio_duration if audio_duration else None,
+            'chars': len(output['text']) if output else 0
+        })
+        logger.info(f"ASR 벤치마크: {name} - {best:.2f}초 (오디오 {audio_duration:.1f}초)")
+
+    return results
+
+
+# 벤치마크 실행
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python src/asr_backends.py AUDIO_FILE [BACKEND ...]")
+        sys.exit(1)
+
+    benchmark_results = benchmark_backends(sys.argv[1], sys.argv[2:] or None)
+    print(json.dumps(benchmark_results, ensure_ascii=False, indent=2))
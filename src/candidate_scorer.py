@@ -0,0 +1,196 @@
+"""
+후보 점수 모듈
+- 한 번의 요청으로 생성한 Hook 멘트/제목 후보를 로컬에서 점수화하여 가장 좋은 후보를 고릅니다.
+- 점수는 길이 적합도, 템플릿 스타일 부합도, 과거 성과 상위 영상(feedback.db)과의 유사도를 가중 합산합니다.
+"""
+import os
+import re
+import logging
+import sqlite3
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    DATA_DIR, LOGS_DIR, HOOK_MAX_SECONDS, TITLE_MAX_CHARS, CANDIDATE_SCORE_WEIGHTS,
+    CANDIDATE_HISTORY_SIZE
+)
+from src.text_utils import term_features
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'candidate_scorer.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('candidate_scorer')
+
+# 이모지 패턴 (제목의 이모지 수 확인)
+EMOJI_PATTERN = re.compile('[\U0001F300-\U0001FAFF☀-➿]')
+
+
+def classify_hook_style(hook):
+    """
+    Hook 멘트의 템플릿 스타일 분류
+    
+    Args:
+        hook (str): Hook 멘트
+    
+    Returns:
+        str: 스타일 (question, warning, shocking, interesting, normal)
+    """
+    return 'question' if hook.endswith('?') else \
+           'warning' if hook.startswith('주의') else \
+           'shocking' if hook.startswith('충격') else \
+           'interesting' if hook.startswith('놀라운') else \
+           'normal'
+
+
+def _similarity(features, other):
+    """특징 집합 겹침 비율 (Dice 계수)"""
+    if not features or not other:
+        return 0.0
+    return 2 * len(features & other) / (len(features) + len(other))
+
+
+def load_performance_history(db_path=None, limit=CANDIDATE_HISTORY_SIZE):
+    """
+    feedback.db에서 성과 상위 영상의 Hook 멘트/제목과 스타일별 평균 성과 조회
+    
+    Args:
+        db_path (str): 피드백 데이터베이스 경로 (없으면 data/feedback.db)
+        limit (int): 조회할 상위 영상 수
+    
+    Returns:
+        dict: hooks (상위 Hook 멘트 목록), titles (상위 제목 목록), style_scores (스타일별 평균 시청 지속률)
+    """
+    history = {'hooks': [], 'titles': [], 'style_scores': {}}
+    db_path = db_path or os.path.join(DATA_DIR, 'feedback.db')
+    
+    if not os.path.exists(db_path):
+        return history
+    
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+        
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(videos)')}
+        hook_column = 'v.hook_text' if 'hook_text' in columns else 'NULL'
+        
+        # 영상별 최고 시청 지속률 기준 상위 영상
+        rows = cursor.execute(f'''
+        SELECT {hook_column}, v.title, v.hook_style, MAX(p.avg_view_percentage) AS score
+        FROM videos v JOIN performance p ON p.video_id = v.video_id
+        GROUP BY v.video_id
+        ORDER BY score DESC
+        ''').fetchall()
+        conn.close()
+    except Exception as e:
+        logger.warning(f"과거 성과 조회 실패: {e}")
+        return history
+    
+    style_totals = {}
+    for hook_text, title, hook_style, score in rows:
+        if score is None:
+            continue
+        total, count = style_totals.get(hook_style, (0.0, 0))
+        style_totals[hook_style] = (total + score, count + 1)
+    
+    for hook_text, title, hook_style, score in rows[:limit]:
+        if hook_text:
+            history['hooks'].append(set(term_features(hook_text)))
+        if title:
+            history['titles'].append(set(term_features(title)))
+    
+    history['style_scores'] = {
+        style: total / count for style, (total, count) in style_totals.items() if count
+    }
+    return history
+
+
+def score_hook(hook, duration_model, history, max_seconds=HOOK_MAX_SECONDS):
+    """
+    Hook 멘트 후보 점수 계산
+    
+    Args:
+        hook (str): Hook 멘트 후보
+        duration_model (DurationModel): 나레이션 길이 모델
+        history (dict): 과거 성과 (load_performance_history 결과)
+        max_seconds (float): Hook 멘트 목표 길이 (초)
+    
+    Returns:
+        dict: 항목별 점수와 종합 점수
+    """
+    # 목표 길이 이내면 1점, 넘는 만큼 감점
+    seconds = duration_model.estimate(hook, section='hook')
+    length = 1.0 if seconds <= max_seconds else max(0.0, 1 - (seconds - max_seconds) / max_seconds)
+    
+    # 템플릿 스타일에 맞으면 스타일별 과거 성과에 비례한 점수
+    style = classify_hook_style(hook)
+    template = 0.0
+    if style != 'normal':
+        style_scores = history['style_scores']
+        best = max(style_scores.values(), default=0)
+        template = 0.5 + 0.5 * style_scores.get(style, 0) / best if best > 0 else 1.0
+    
+    features = set(term_features(hook))
+    similarity = max((_similarity(features, other) for other in history['hooks']), default=0.0)
+    
+    total = (
+        CANDIDATE_SCORE_WEIGHTS['length'] * length
+        + CANDIDATE_SCORE_WEIGHTS['template'] * template
+        + CANDIDATE_SCORE_WEIGHTS['history'] * similarity
+    )
+    return {
+        'text': hook, 'style': style, 'seconds': round(seconds, 2),
+        'length': round(length, 4), 'template': round(template, 4), 'history': round(similarity, 4),
+        'score': round(total, 4)
+    }
+
+
+def score_title(title, history, max_chars=TITLE_MAX_CHARS):
+    """
+    제목 후보 점수 계산
+    
+    Args:
+        title (str): 제목 후보
+        history (dict): 과거 성과 (load_performance_history 결과)
+        max_chars (int): 제목 최대 글자 수
+    
+    Returns:
+        dict: 항목별 점수와 종합 점수
+    """
+    length = 1.0 if len(title) <= max_chars else max(0.0, 1 - (len(title) - max_chars) / max_chars)
+    
+    # 제목 형식 (이모지 1-2개)
+    emojis = len(EMOJI_PATTERN.findall(title))
+    template = 1.0 if 1 <= emojis <= 2 else 0.0
+    
+    features = set(term_features(title))
+    similarity = max((_similarity(features, other) for other in history['titles']), default=0.0)
+    
+    total = (
+        CANDIDATE_SCORE_WEIGHTS['length'] * length
+        + CANDIDATE_SCORE_WEIGHTS['template'] * template
+        + CANDIDATE_SCORE_WEIGHTS['history'] * similarity
+    )
+    return {
+        'text': title, 'length': round(length, 4), 'template': template,
+        'history': round(similarity, 4), 'score': round(total, 4)
+    }
+
+
+def rank_candidates(scored):
+    """
+    점수 높은 순 정렬 (같은 점수는 원래 순서 유지)
+    
+    Args:
+        scored (list): 점수 계산 결과 목록
+    
+    Returns:
+        list: 정렬된 목록
+    """
+    return sorted(scored, key=lambda candidate: -candidate['score'])
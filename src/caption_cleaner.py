@@ -0,0 +1,131 @@
+"""
+자막 정리 모듈
+- 자동 생성 자막의 효과음 태그([Music], [Applause] 등), 군말, 말더듬 반복을 제거합니다.
+- 롤링 자막에서 이전 구간과 겹치는 중복 단어열을 합칩니다.
+- 정리 전후 추정 토큰 수를 집계하여 이후 번역/요약 호출에서 줄어든 양을 보고합니다.
+"""
+import re
+
+from src.text_utils import estimate_tokens
+
+# 효과음/비언어 태그 ([Music], (applause), ♪ 등) 및 화자 전환 표시
+SOUND_TAG_PATTERN = re.compile(
+    r'\[[^\]]*\]|\((?:music|applause|laughter|laughs|inaudible|crosstalk|cheering|silence)[^)]*\)|[♪♫]+|>>+',
+    re.IGNORECASE
+)
+
+# 군말 (문장 중간의 쉼표까지 함께 제거)
+FILLER_PATTERN = re.compile(
+    r'\b(?:um+|uh+|uhm+|erm+|ah+|hmm+|mhm)\b,?\s*',
+    re.IGNORECASE
+)
+
+# 쉼표로 끊긴 삽입구일 때만 군말로 보는 표현 ("It was, you know, huge" / "I mean, ...")
+# "Did you know ..."나 "I mean it."처럼 문장 성분으로 쓰인 경우는 유지
+INTERJECTION_PATTERN = re.compile(
+    r'(?:^|(?<=[.!?])\s+|\s*,\s*)(?:you know|i mean)\s*(?:,\s*|(?=[.!?]|$))',
+    re.IGNORECASE
+)
+
+# 같은 단어의 연속 반복 ("the the", "we we we")
+STUTTER_PATTERN = re.compile(r'\b(\w+)((?:\s+\1\b)+)', re.IGNORECASE)
+
+# 두 번 반복만으로 말더듬으로 보는 짧은 기능어 (그 밖의 단어는 세 번 이상 반복될 때만 합침)
+# "that that plan", "had had", "Bora Bora"처럼 의미가 있는 두 번 반복은 유지
+STUTTER_WORDS = {
+    'i', 'a', 'an', 'the', 'and', 'but', 'so', 'or', 'we', 'you', 'he', 'she', 'they',
+    'it', 'my', 'our', 'of', 'to', 'in', 'on', 'at', 'for', 'with'
+}
+
+# 공백 정리
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPACE_BEFORE_PUNCT_PATTERN = re.compile(r'\s+([,.!?])')
+
+# 롤링 중복으로 판단할 최소/최대 겹침 단어 수
+MIN_OVERLAP_WORDS = 2
+MAX_OVERLAP_WORDS = 15
+
+
+def _replace_interjection(match):
+    """삽입구 군말 제거 (앞뒤 단어가 붙지 않도록 공백 하나 유지)"""
+    return ' ' if match.start() > 0 else ''
+
+
+def _collapse_stutter(match):
+    """기능어 반복이나 세 번 이상 반복된 단어만 하나로 합침"""
+    word = match.group(1)
+    repeats = 1 + len(match.group(2).split())
+    if word.lower() in STUTTER_WORDS or repeats >= 3:
+        return word
+    return match.group(0)
+
+
+def clean_text(text):
+    """
+    자막 한 구간의 효과음 태그, 군말, 말더듬 반복 제거
+    
+    Args:
+        text (str): 자막 텍스트
+    
+    Returns:
+        str: 정리된 텍스트
+    """
+    text = SOUND_TAG_PATTERN.sub(' ', text)
+    text = FILLER_PATTERN.sub('', text)
+    text = INTERJECTION_PATTERN.sub(_replace_interjection, text)
+    text = STUTTER_PATTERN.sub(_collapse_stutter, text)
+    text = SPACE_BEFORE_PUNCT_PATTERN.sub(r'\1', text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip(' ,')
+
+
+def _overlap_length(previous_words, words):
+    """이전 구간 끝과 현재 구간 앞이 겹치는 단어 수"""
+    limit = min(MAX_OVERLAP_WORDS, len(previous_words), len(words))
+    previous_lower = [w.lower().strip('.,!?') for w in previous_words[-limit:]]
+    current_lower = [w.lower().strip('.,!?') for w in words[:limit]]
+    
+    for size in range(limit, MIN_OVERLAP_WORDS - 1, -1):
+        if previous_lower[-size:] == current_lower[:size]:
+            return size
+    return 0
+
+
+def clean_caption_segments(segments):
+    """
+    자막 구간 목록 정리
+    
+    Args:
+        segments (list): 자막 구간 목록 (text, start, duration, ...)
+    
+    Returns:
+        tuple: (정리된 구간 목록, 정리 통계)
+    """
+    cleaned = []
+    previous_words = []
+    tokens_before = 0
+    
+    for segment in segments:
+        tokens_before += estimate_tokens(segment['text'])
+        words = clean_text(segment['text']).split()
+        
+        # 롤링 자막 중복 제거
+        overlap = _overlap_length(previous_words, words)
+        if overlap:
+            words = words[overlap:]
+        
+        if not words:
+            continue
+        
+        previous_words = words
+        cleaned.append(dict(segment, text=' '.join(words)))
+    
+    tokens_after = sum(estimate_tokens(segment['text']) for segment in cleaned)
+    stats = {
+        'segments_before': len(segments),
+        'segments_after': len(cleaned),
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'token_reduction': round(1 - tokens_after / tokens_before, 4) if tokens_before else 0.0
+    }
+    
+    return cleaned, stats
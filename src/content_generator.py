@@ -7,15 +7,23 @@
 import os
 import json
 import logging
-import openai
 from datetime import datetime
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # 설정 파일 임포트
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
-    OPENAI_API_KEY, DATA_DIR, LOGS_DIR, SHORTS_DURATION
+    DATA_DIR, LOGS_DIR, SHORTS_DURATION, TITLE_BATCH_TOKEN_BUDGET, STORY_ARCHIVE_MIN_SIMILARITY,
+    CONTENT_CANDIDATES, HOOK_MAX_SECONDS, TITLE_MAX_CHARS, TITLE_DEADLINE_SECONDS
 )
+from src.llm_client import get_llm_client
+from src.text_utils import estimate_tokens, content_features
+from src.duration_model import get_duration_model
+from src.template_store import get_template_store
+from src.story_archive import get_story_archive
+from src.candidate_scorer import load_performance_history, score_hook, score_title, rank_candidates
+from src.metadata_fallback import build_title_and_tags
 
 # 로깅 설정
 logging.basicConfig(
@@ -28,8 +36,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger('content_generator')
 
-# OpenAI API 키 설정
-openai.api_key = OPENAI_API_KEY
+# 나레이션 스크립트 구간
+SCRIPT_SECTIONS = ('hook', 'transition', 'summary', 'background', 'ending')
+
+# 단일 요청 생성 결과 파일 형식 버전
+SCRIPT_SCHEMA_VERSION = 2
+
+# 단일 요청 생성 응답 JSON 스키마 (Hook 후보 + 스크립트 구간 + 제목 후보/태그)
+CONTENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "hooks": {"type": "array", "items": {"type": "string"}},
+        "transition": {"type": "string"},
+        "summary": {"type": "string"},
+        "background": {"type": "string"},
+        "ending": {"type": "string"},
+        "titles": {"type": "array", "items": {"type": "string"}},
+        "tags": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["hooks", "transition", "summary", "background", "ending", "titles", "tags"],
+    "additionalProperties": False
+}
 
 class ContentGenerator:
     """콘텐츠 생성 클래스"""
@@ -39,78 +66,42 @@ class ContentGenerator:
         # 스크립트 저장 디렉토리 생성
         os.makedirs(os.path.join(DATA_DIR, 'scripts'), exist_ok=True)
         
-        # 스크립트 템플릿 로드
-        self.templates = self._load_templates()
+        # 피드백 모듈과 공유하는 스크립트 템플릿 저장소
+        self.template_store = get_template_store()
         
-        logger.info("ContentGenerator 초기화 완료")
-    
-    def _load_templates(self):
-        """
-        스크립트 템플릿 로드
+        # 캐시를 공유하는 LLM 클라이언트
+        self.llm = get_llm_client()
         
-        Returns:
-            dict: 템플릿 사전
-        """
-        # 기본 템플릿
-        default_templates = {
-            'hook': {
-                'question': "{}?",
-                'warning': "주의하세요! {}",
-                'shocking': "충격! {}",
-                'interesting': "놀라운 사실! {}"
-            },
-            'transition': [
-                "자세히 알아보겠습니다.",
-                "지금 바로 알려드립니다.",
-                "함께 살펴보겠습니다.",
-                "이것이 전체 내용입니다."
-            ],
-            'ending': [
-                "이상 글로벌 뉴스 단신이었습니다.",
-                "더 자세한 내용은 링크를 참고하세요.",
-                "구독과 좋아요 부탁드립니다.",
-                "다음 소식에서 다시 만나요."
-            ]
-        }
+        # 측정된 TTS 길이로 보정한 나레이션 길이 모델
+        self.duration_model = get_duration_model()
         
-        # 템플릿 파일 경로
-        template_file = os.path.join(DATA_DIR, 'templates.json')
+        # 과거 자막/스크립트 전문 검색 (배경 설명 재사용)
+        self.story_archive = get_story_archive()
         
-        # 템플릿 파일이 있으면 로드
-        if os.path.exists(template_file):
-            try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    templates = json.load(f)
-                logger.info("템플릿 파일 로드 성공")
-                return templates
-            except Exception as e:
-                logger.error(f"템플릿 파일 로드 실패: {e}")
-                return default_templates
-        else:
-            # 템플릿 파일이 없으면 기본 템플릿 저장
-            try:
-                with open(template_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_templates, f, ensure_ascii=False, indent=2)
-                logger.info("기본 템플릿 파일 생성 완료")
-                return default_templates
-            except Exception as e:
-                logger.error(f"기본 템플릿 파일 생성 실패: {e}")
-                return default_templates
+        # 제한 시간을 넘겨 아직 진행 중인 제목/태그 생성 요청 (영상 ID별)
+        self.pending_titles = {}
+        
+        logger.info("ContentGenerator 초기화 완료")
     
-    def save_templates(self, templates):
+    @property
+    def templates(self):
+        """현재 스크립트 템플릿 (파일이 변경되면 자동으로 다시 로드)"""
+        return self.template_store.get()
+    
+    def save_templates(self, templates, base_templates=None, base_version=None):
         """
         스크립트 템플릿 저장
         
         Args:
             templates (dict): 템플릿 사전
+            base_templates (dict): 수정의 기준이 된 템플릿 (template_store.snapshot() 결과)
+            base_version (int): 기준 템플릿의 버전 (지정하면 그 사이 다른 변경과 병합하여 저장)
         """
-        template_file = os.path.join(DATA_DIR, 'templates.json')
-        
         try:
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(templates, f, ensure_ascii=False, indent=2)
-            logger.info("템플릿 파일 저장 완료")
-            self.templates = templates
+            if base_version is None:
+                self.template_store.save(templates)
+            else:
+                self.template_store.update(templates, base_templates, base_version)
         except Exception as e:
             logger.error(f"템플릿 파일 저장 실패: {e}")
     
@@ -151,6 +142,62 @@ class ContentGenerator:
             logger.error(f"Hook 멘트 강화 실패: {e}")
             return hook_text
     
+    def _build_script(self, video_data, transcript_data):
+        """
+        자막 요약과 템플릿으로 스크립트 구성 (저장하지 않음)
+        
+        Args:
+            video_data (dict): 영상 정보
+            transcript_data (dict): 자막 정보
+        
+        Returns:
+            dict: 구성된 스크립트
+        """
+        # 영상 정보 추출
+        video_id = video_data['id']
+        video_title = video_data['snippet']['title']
+        channel_title = video_data['snippet']['channelTitle']
+        
+        # 자막 정보 추출
+        summary = transcript_data['summary']
+        hook = summary['hook']
+        summary_text = summary['summary']
+        background = summary['background']
+        
+        # 요약과 관련된 원본 영상 구간
+        clip_window = transcript_data.get('clip_window') or {}
+        
+        # Hook 멘트 강화 (템플릿 스타일별 후보 중 길이/스타일 성과/과거 상위 Hook 유사도 점수가 가장 높은 것)
+        import random
+        history = load_performance_history()
+        hook_candidates = rank_candidates([
+            dict(score_hook(self.enhance_hook(hook, style=style), self.duration_model, history), template_style=style)
+            for style in self.templates['hook']
+        ])
+        enhanced_hook = hook_candidates[0]['text']
+        
+        # 전환 문구 선택
+        transition = random.choice(self.templates['transition'])
+        
+        # 마무리 문구 선택
+        ending = random.choice(self.templates['ending'])
+        
+        # 스크립트 구성
+        return {
+            'video_id': video_id,
+            'title': video_title,
+            'channel': channel_title,
+            'hook': enhanced_hook,
+            'transition': transition,
+            'summary': summary_text,
+            'background': background,
+            'background_source': summary.get('background_source'),
+            'ending': ending,
+            'clip_start': clip_window.get('start', 0),
+            'hook_candidates': hook_candidates,
+            'created_at': datetime.now().isoformat()
+        }
+    
     def generate_script(self, video_data, transcript_data):
         """
         스크립트 생성
@@ -163,41 +210,8 @@ class ContentGenerator:
             dict: 생성된 스크립트
         """
         try:
-            # 영상 정보 추출
-            video_id = video_data['id']
-            video_title = video_data['snippet']['title']
-            channel_title = video_data['snippet']['channelTitle']
-            
-            # 자막 정보 추출
-            summary = transcript_data['summary']
-            hook = summary['hook']
-            summary_text = summary['summary']
-            background = summary['background']
-            
-            # Hook 멘트 강화 (랜덤 스타일 또는 피드백 기반 선택)
-            import random
-            hook_styles = list(self.templates['hook'].keys())
-            selected_style = random.choice(hook_styles)
-            enhanced_hook = self.enhance_hook(hook, style=selected_style)
-            
-            # 전환 문구 선택
-            transition = random.choice(self.templates['transition'])
-            
-            # 마무리 문구 선택
-            ending = random.choice(self.templates['ending'])
-            
-            # 스크립트 구성
-            script = {
-                'video_id': video_id,
-                'title': video_title,
-                'channel': channel_title,
-                'hook': enhanced_hook,
-                'transition': transition,
-                'summary': summary_text,
-                'background': background,
-                'ending': ending,
-                'created_at': datetime.now().isoformat()
-            }
+            script = self._build_script(video_data, transcript_data)
+            video_id = script['video_id']
             
             # 스크립트 저장
             script_file = os.path.join(DATA_DIR, 'scripts', f"{video_id}.json")
@@ -210,6 +224,79 @@ class ContentGenerator:
             logger.error(f"스크립트 생성 실패: {e}")
             return None
     
+    def _estimate_duration(self, script):
+        """스크립트 전체 나레이션 예상 길이 (초)"""
+        return sum(
+            self.duration_model.estimate(script[section], section=section)
+            for section in SCRIPT_SECTIONS
+        )
+    
+    def _archived_backgrounds(self, script):
+        """
+        같은 기사를 다룬 최근 영상의 배경 설명 후보 조회 (요약 유사도 높은 순)
+        
+        Args:
+            script (dict): 스크립트
+        
+        Returns:
+            list: 배경 설명 후보 목록 (background, video_id, similarity)
+        """
+        try:
+            self.story_archive.sync()
+            features = set(content_features(script['summary']))
+            if not features:
+                return []
+            
+            candidates = {}
+            for row in self.story_archive.search(script['summary'], exclude_video_id=script['video_id']):
+                background = row['background']
+                if not background or background == script['background']:
+                    continue
+                
+                # 요약 특징 겹침 비율 (IDF 가중 Dice 계수)
+                other = set(content_features(row['summary']))
+                shared, own, total = self.story_archive.weighted_overlap(features, other)
+                if not own + total:
+                    continue
+                similarity = 2 * shared / (own + total)
+                
+                if similarity >= STORY_ARCHIVE_MIN_SIMILARITY and similarity > candidates.get(background, {}).get('similarity', 0):
+                    candidates[background] = {
+                        'background': background,
+                        'video_id': row['video_id'],
+                        'similarity': round(similarity, 4)
+                    }
+            
+            return sorted(candidates.values(), key=lambda candidate: -candidate['similarity'])
+        except Exception as e:
+            logger.warning(f"과거 배경 설명 조회 실패: {e}")
+            return []
+    
+    def _apply_archived_background(self, script, candidates, target_duration):
+        """
+        목표 길이를 넘는 스크립트의 배경 설명을 더 짧은 과거 배경 설명으로 교체
+        
+        Args:
+            script (dict): 스크립트 (교체 시 직접 수정)
+            candidates (list): 배경 설명 후보 목록
+            target_duration (int): 목표 영상 길이 (초)
+        
+        Returns:
+            bool: 교체하여 목표 길이 이내가 되었는지 여부
+        """
+        total_length = self._estimate_duration(script)
+        current = self.duration_model.estimate(script['background'], section='background')
+        
+        for candidate in candidates:
+            saved = current - self.duration_model.estimate(candidate['background'], section='background')
+            if saved > 0 and total_length - saved <= target_duration:
+                script['background'] = candidate['background']
+                script['background_source'] = candidate['video_id']
+                logger.info(f"과거 배경 설명 재사용: {candidate['video_id']} (유사도 {candidate['similarity']}, {saved:.1f}초 단축)")
+                return True
+        
+        return False
+    
     def optimize_script_for_shorts(self, script, target_duration=SHORTS_DURATION):
         """
         쇼츠용 스크립트 최적화
@@ -222,17 +309,8 @@ class ContentGenerator:
             dict: 최적화된 스크립트
         """
         try:
-            # 평균 말하기 속도 (초당 글자 수)
-            chars_per_second = 4
-            
-            # 현재 스크립트 길이 계산
-            hook_length = len(script['hook']) / chars_per_second
-            summary_length = len(script['summary']) / chars_per_second
-            background_length = len(script['background']) / chars_per_second
-            transition_length = len(script['transition']) / chars_per_second
-            ending_length = len(script['ending']) / chars_per_second
-            
-            total_length = hook_length + summary_length + background_length + transition_length + ending_length
+            # 현재 스크립트 길이 계산 (구간별 나레이션 길이 모델)
+            total_length = self._estimate_duration(script)
             
             # 길이가 적절하면 그대로 반환
             if total_length <= target_duration:
@@ -241,9 +319,22 @@ class ContentGenerator:
             # 길이가 너무 길면 최적화
             logger.info(f"스크립트 길이 최적화 필요: {total_length}초 -> {target_duration}초")
             
+            # 같은 기사의 더 짧은 과거 배경 설명으로 충분하면 재작성 요청 생략
+            candidates = self._archived_backgrounds(script)
+            reference_note = ""
+            
+            if candidates:
+                if self._apply_archived_background(script, candidates, target_duration):
+                    self._save_optimized(script)
+                    return script
+                
+                reference_note = f"5. 배경 설명은 같은 기사를 다룬 다음 과거 배경 설명을 참고하여 짧게 다듬어도 됩니다: {candidates[0]['background']}"
+            
             # OpenAI API를 사용하여 요약 최적화
-            response = openai.chat.completions.create(
+            content = self.llm.chat(
                 model="gpt-4o",
+                call_site='optimize_script',
+                use_cache=False,
                 messages=[
                     {"role": "system", "content": "You are an expert editor for short-form video content."},
                     {"role": "user", "content": f"""
@@ -254,6 +345,7 @@ class ContentGenerator:
                     2. 핵심 요약은 가장 중요한 내용만 남기고 축약해주세요.
                     3. 배경 설명은 필요시 축약하거나 생략할 수 있습니다.
                     4. 전환 문구와 마무리 문구는 더 짧은 것으로 대체할 수 있습니다.
+                    {reference_note}
                     
                     원본 스크립트:
                     - Hook: {script['hook']}
@@ -277,35 +369,47 @@ class ContentGenerator:
                 response_format={"type": "json_object"}
             )
             
-            optimized_content = json.loads(response.choices[0].message.content)
+            optimized_content = json.loads(content)
             
             # 최적화된 내용으로 스크립트 업데이트
             script.update(optimized_content)
             
             # 최적화된 스크립트 저장
-            script_file = os.path.join(DATA_DIR, 'scripts', f"{script['video_id']}_optimized.json")
-            with open(script_file, 'w', encoding='utf-8') as f:
-                json.dump(script, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"스크립트 최적화 완료: {script['video_id']}")
+            self._save_optimized(script)
             return script
         except Exception as e:
             logger.error(f"스크립트 최적화 실패: {e}")
             return script
     
-    def generate_title_and_tags(self, script):
+    def _save_optimized(self, script):
+        """최적화된 스크립트 저장"""
+        script_file = os.path.join(DATA_DIR, 'scripts', f"{script['video_id']}_optimized.json")
+        with open(script_file, 'w', encoding='utf-8') as f:
+            json.dump(script, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"스크립트 최적화 완료: {script['video_id']}")
+    
+    def generate_title_and_tags(self, script, deadline=TITLE_DEADLINE_SECONDS):
         """
         제목 및 태그 생성
+        - 제한 시간 안에 LLM 응답이 없으면 로컬에서 만든 제목/태그를 반환하고,
+          늦게 도착한 LLM 결과는 최종 스크립트에 저장해 두었다가 wait_for_late_title()로 가져갑니다.
         
         Args:
             script (dict): 스크립트
+            deadline (float): LLM 응답 제한 시간 (초, None이면 제한 없음)
             
         Returns:
-            dict: 제목 및 태그
+            dict: 제목 및 태그 (로컬 대체 결과이면 source가 'fallback')
         """
+        video_id = script['video_id']
+        late = None
+        
         try:
-            response = openai.chat.completions.create(
+            future = self.llm.submit(
                 model="gpt-4o",
+                call_site='title_and_tags',
+                use_cache=False,
                 messages=[
                     {"role": "system", "content": "You are an expert in creating engaging titles and tags for YouTube Shorts."},
                     {"role": "user", "content": f"""
@@ -334,22 +438,398 @@ class ContentGenerator:
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(future.result(timeout=deadline))
+            if not self._is_valid_title_result(result):
+                raise ValueError(f"잘못된 제목/태그 응답: {result}")
             
             # 결과 저장
-            script['youtube_title'] = result['title']
-            script['youtube_tags'] = result['tags']
-            
-            # 업데이트된 스크립트 저장
-            script_file = os.path.join(DATA_DIR, 'scripts', f"{script['video_id']}_final.json")
-            with open(script_file, 'w', encoding='utf-8') as f:
-                json.dump(script, f, ensure_ascii=False, indent=2)
+            self._save_title_and_tags(script, result)
             
-            logger.info(f"제목 및 태그 생성 완료: {script['video_id']}")
+            logger.info(f"제목 및 태그 생성 완료: {video_id}")
             return result
+        except FutureTimeoutError:
+            logger.warning(f"제목 및 태그 생성 제한 시간 초과 ({deadline}초), 로컬 생성 결과 사용: {video_id}")
+            late = future
         except Exception as e:
             logger.error(f"제목 및 태그 생성 실패: {e}")
-            return {"title": script['title'], "tags": ["글로벌뉴스", "해외소식", "뉴스요약"]}
+        
+        try:
+            result = build_title_and_tags(script, load_performance_history())
+        except Exception as e:
+            logger.error(f"로컬 제목 및 태그 생성 실패: {e}")
+            result = {"title": script['title'], "tags": ["글로벌뉴스", "해외소식", "뉴스요약"]}
+        
+        result['source'] = 'fallback'
+        self._save_title_and_tags(script, result)
+        
+        # 늦게 도착한 LLM 결과는 대체 결과를 저장한 뒤 최종 스크립트에 덮어씀
+        if late is not None:
+            self.pending_titles[video_id] = late
+            late.add_done_callback(lambda done: self._save_late_title_and_tags(dict(script), done))
+        return result
+    
+    def _save_late_title_and_tags(self, script, future):
+        """
+        제한 시간 이후 도착한 LLM 제목/태그를 최종 스크립트에 저장
+        
+        Args:
+            script (dict): 스크립트 (복사본)
+            future (concurrent.futures.Future): 제목/태그 생성 작업
+        """
+        try:
+            result = json.loads(future.result())
+            if not self._is_valid_title_result(result):
+                raise ValueError(f"잘못된 제목/태그 응답: {result}")
+            self._save_title_and_tags(script, result)
+            logger.info(f"늦게 도착한 제목 및 태그 저장 완료: {script['video_id']}")
+        except Exception as e:
+            logger.error(f"늦게 도착한 제목 및 태그 처리 실패: {e}")
+    
+    def wait_for_late_title(self, video_id, timeout):
+        """
+        제한 시간을 넘긴 제목/태그 생성 요청의 결과 대기
+        
+        Args:
+            video_id (str): 영상 ID
+            timeout (float): 최대 대기 시간 (초)
+        
+        Returns:
+            dict: LLM이 생성한 제목 및 태그 (대기 중인 요청이 없거나 실패/시간 초과이면 None)
+        """
+        future = self.pending_titles.get(video_id)
+        if future is None:
+            return None
+        
+        try:
+            result = json.loads(future.result(timeout=timeout))
+        except FutureTimeoutError:
+            logger.warning(f"늦은 제목 및 태그 대기 시간 초과: {video_id}")
+            return None
+        except Exception as e:
+            logger.error(f"늦은 제목 및 태그 생성 실패: {e}")
+            self.pending_titles.pop(video_id, None)
+            return None
+        
+        self.pending_titles.pop(video_id, None)
+        return result if self._is_valid_title_result(result) else None
+    
+    def _save_title_and_tags(self, script, result):
+        """
+        제목 및 태그를 스크립트에 반영하고 최종 스크립트 저장
+        
+        Args:
+            script (dict): 스크립트
+            result (dict): 제목 및 태그 (로컬 대체 결과이면 source가 'fallback')
+        """
+        script['youtube_title'] = result['title']
+        script['youtube_tags'] = result['tags']
+        script['youtube_title_source'] = result.get('source', 'llm')
+        
+        script_file = os.path.join(DATA_DIR, 'scripts', f"{script['video_id']}_final.json")
+        with open(script_file, 'w', encoding='utf-8') as f:
+            json.dump(script, f, ensure_ascii=False, indent=2)
+    
+    def _is_valid_title_result(self, result):
+        """일괄 생성 결과 항목 검증 (제목 문자열과 태그 목록)"""
+        return (
+            isinstance(result, dict)
+            and isinstance(result.get('title'), str) and result['title'].strip()
+            and isinstance(result.get('tags'), list) and result['tags']
+            and all(isinstance(tag, str) for tag in result['tags'])
+        )
+    
+    def _chunk_scripts_for_titles(self, scripts, token_budget):
+        """
+        토큰 예산에 맞춰 제목 생성 요청 항목을 묶음으로 나눔
+        
+        Args:
+            scripts (list): 스크립트 목록
+            token_budget (int): 요청 한 번의 최대 추정 토큰 수
+        
+        Returns:
+            list: 요청 항목 묶음 목록
+        """
+        chunks = []
+        current = []
+        used = 0
+        
+        for script in scripts:
+            item = {
+                'video_id': script['video_id'],
+                'hook': script['hook'],
+                'summary': script['summary'],
+                'background': script['background'],
+                'original_title': script['title']
+            }
+            cost = estimate_tokens(json.dumps(item, ensure_ascii=False))
+            
+            if current and used + cost > token_budget:
+                chunks.append(current)
+                current = []
+                used = 0
+            
+            current.append(item)
+            used += cost
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def generate_titles_and_tags_batch(self, scripts, token_budget=TITLE_BATCH_TOKEN_BUDGET):
+        """
+        여러 스크립트의 제목 및 태그를 묶음 요청으로 생성
+        
+        Args:
+            scripts (list): 스크립트 목록
+            token_budget (int): 요청 한 번에 담을 스크립트의 최대 추정 토큰 수
+        
+        Returns:
+            dict: 영상 ID별 제목 및 태그
+        """
+        scripts_by_id = {script['video_id']: script for script in scripts}
+        chunks = self._chunk_scripts_for_titles(list(scripts_by_id.values()), token_budget)
+        results = {}
+        
+        for chunk in chunks:
+            try:
+                content = self.llm.chat(
+                    model="gpt-4o",
+                    call_site='title_and_tags_batch',
+                    use_cache=False,
+                    messages=[
+                        {"role": "system", "content": "You are an expert in creating engaging titles and tags for YouTube Shorts."},
+                        {"role": "user", "content": f"""
+                        다음은 여러 쇼츠 영상 스크립트 목록입니다. 각 스크립트마다 매력적인 제목과 해시태그를 생성해주세요.
+                        
+                        스크립트 목록 (JSON):
+                        {json.dumps(chunk, ensure_ascii=False)}
+                        
+                        각 항목은 다음 조건을 만족해야 합니다:
+                        1. 제목은 30자 이내로 짧고 강렬하게 작성
+                        2. 해시태그는 5-7개 정도로 관련성 높은 것만 선택
+                        3. 제목에는 이모지를 1-2개 포함
+                        4. video_id는 입력 값을 그대로 사용
+                        
+                        모든 스크립트에 대해 다음 JSON 형식으로 반환해주세요:
+                        {{
+                            "results": [
+                                {{"video_id": "영상 ID", "title": "생성된 제목", "tags": ["태그1", "태그2", "태그3", "태그4", "태그5"]}}
+                            ]
+                        }}
+                        """
+                        }
+                    ],
+                    temperature=0.8,
+                    response_format={"type": "json_object"}
+                )
+                
+                entries = json.loads(content).get('results', [])
+            except Exception as e:
+                logger.error(f"제목 및 태그 일괄 생성 실패 ({len(chunk)}개 항목): {e}")
+                entries = []
+            
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                video_id = entry.get('video_id')
+                if video_id in scripts_by_id and video_id not in results and self._is_valid_title_result(entry):
+                    results[video_id] = {'title': entry['title'], 'tags': entry['tags']}
+        
+        # 결과가 없거나 형식이 잘못된 항목만 개별 생성
+        missing = [video_id for video_id in scripts_by_id if video_id not in results]
+        if missing:
+            logger.warning(f"일괄 생성 결과가 없거나 잘못된 항목 개별 생성: {', '.join(missing)}")
+        
+        for video_id, script in scripts_by_id.items():
+            if video_id in results:
+                try:
+                    self._save_title_and_tags(script, results[video_id])
+                except Exception as e:
+                    logger.error(f"최종 스크립트 저장 실패: {video_id}, 오류: {e}")
+            else:
+                results[video_id] = self.generate_title_and_tags(script)
+        
+        logger.info(f"제목 및 태그 일괄 생성 완료: {len(scripts_by_id)}개 스크립트, {len(chunks)}회 요청")
+        return results
+
+    def generate_content(self, video_data, transcript_data, target_duration=SHORTS_DURATION, on_field=None):
+        """
+        스크립트, 길이 최적화, 제목 및 태그를 한 번의 JSON 스키마 요청으로 생성
+        
+        Args:
+            video_data (dict): 영상 정보
+            transcript_data (dict): 자막 정보
+            target_duration (int): 목표 영상 길이 (초)
+            on_field (callable): 지정하면 응답을 스트리밍으로 받으며 필드가 완성될 때마다 호출 (필드 이름, 값)
+        
+        Returns:
+            dict: 제목과 태그를 포함한 최종 스크립트 (실패 시 단계별 생성 결과)
+        """
+        try:
+            script = self._build_script(video_data, transcript_data)
+            video_id = script['video_id']
+            
+            # 목표 길이를 넘으면 같은 기사의 더 짧은 과거 배경 설명으로 먼저 교체
+            if self._estimate_duration(script) > target_duration:
+                candidates = self._archived_backgrounds(script)
+                if candidates:
+                    self._apply_archived_background(script, candidates, target_duration)
+            
+            total_length = self._estimate_duration(script)
+            draft = {section: script[section] for section in SCRIPT_SECTIONS}
+            
+            request = dict(
+                model="gpt-4o",
+                call_site='generate_content',
+                use_cache=False,
+                messages=[
+                    {"role": "system", "content": "You are an expert editor and title writer for short-form news videos."},
+                    {"role": "user", "content": f"""
+                    다음 쇼츠 영상 스크립트 초안을 완성하고 Hook 멘트 후보, 제목 후보, 해시태그를 생성해주세요.
+                    
+                    스크립트 초안 (JSON):
+                    {json.dumps(draft, ensure_ascii=False)}
+                    
+                    원본 영상 제목: {script['title']}
+                    
+                    현재 예상 나레이션 길이는 약 {total_length:.1f}초이고, 목표 길이는 {target_duration}초 이내입니다.
+                    
+                    1. 예상 길이가 목표 이내이면 스크립트 문장을 그대로 유지해주세요.
+                    2. 목표를 넘으면 핵심 요약은 가장 중요한 내용만 남기고, 배경 설명은 필요시 축약하거나 생략하고, 전환/마무리 문구는 더 짧은 것으로 대체해주세요.
+                    3. Hook 멘트 후보는 초안의 Hook 멘트를 바탕으로 {CONTENT_CANDIDATES}개를 서로 다른 스타일(질문형 "...?", 경고형 "주의하세요! ...", 충격형 "충격! ...", 놀라운 사실형 "놀라운 사실! ...")로 {HOOK_MAX_SECONDS}초 이내로 작성해주세요.
+                    4. 제목 후보는 {CONTENT_CANDIDATES}개를 {TITLE_MAX_CHARS}자 이내로 짧고 강렬하게 작성하고, 각각 이모지를 1-2개 포함해주세요.
+                    5. 해시태그는 5-7개 정도로 관련성 높은 것만 선택해주세요.
+                    """
+                    }
+                ],
+                temperature=0.7,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": "shorts_content", "strict": True, "schema": CONTENT_SCHEMA}
+                }
+            )
+            
+            # Hook 후보는 로컬 점수로 고름 (초안의 Hook 멘트도 후보에 포함)
+            history = load_performance_history()
+            chosen = {}
+            
+            def choose_hook(hooks):
+                candidates = [hook for hook in hooks if isinstance(hook, str) and hook.strip()]
+                candidates.append(script['hook'])
+                chosen['hooks'] = rank_candidates([
+                    score_hook(hook, self.duration_model, history) for hook in dict.fromkeys(candidates)
+                ])
+                return chosen['hooks'][0]['text']
+            
+            # 스키마의 필드 순서대로 생성되므로 Hook 후보가 가장 먼저 완성됨 (고른 Hook 멘트를 바로 전달)
+            if on_field:
+                def on_stream_field(name, value):
+                    if name == 'hooks':
+                        on_field('hook', choose_hook(value))
+                    else:
+                        on_field(name, value)
+                
+                content = self.llm.chat_stream(on_field=on_stream_field, **request)
+            else:
+                content = self.llm.chat(**request)
+            
+            result = json.loads(content)
+            
+            titles = [title for title in result.get('titles') or [] if isinstance(title, str) and title.strip()]
+            if not titles or not self._is_valid_title_result({'title': titles[0], 'tags': result.get('tags')}) or not all(
+                isinstance(result.get(section), str) for section in SCRIPT_SECTIONS if section != 'hook'
+            ):
+                raise ValueError("응답이 스키마와 일치하지 않습니다")
+            
+            if 'hooks' not in chosen:
+                choose_hook(result.get('hooks') or [])
+            
+            title_candidates = rank_candidates([score_title(title, history) for title in dict.fromkeys(titles)])
+            
+            for section in SCRIPT_SECTIONS:
+                if section != 'hook':
+                    script[section] = result[section]
+            script['hook'] = chosen['hooks'][0]['text']
+            script['hook_candidates'] = chosen['hooks']
+            script['youtube_title'] = title_candidates[0]['text']
+            script['title_candidates'] = title_candidates
+            script['youtube_tags'] = result['tags']
+            
+            optimized_length = self._estimate_duration(script)
+            if optimized_length > target_duration:
+                logger.warning(f"생성된 스크립트가 목표 길이를 초과합니다: {optimized_length:.1f}초 > {target_duration}초")
+            
+            self._save_artifact(script)
+            
+            logger.info(f"콘텐츠 단일 요청 생성 완료: {video_id} (예상 길이 {total_length:.1f}초 -> {optimized_length:.1f}초)")
+            return script
+        except Exception as e:
+            logger.error(f"콘텐츠 단일 요청 생성 실패, 단계별 생성으로 전환: {e}")
+            
+            script = self.generate_script(video_data, transcript_data)
+            if not script:
+                return None
+            
+            script = self.optimize_script_for_shorts(script, target_duration)
+            self.generate_title_and_tags(script)
+            return script
+    
+    def _save_artifact(self, script):
+        """
+        단일 요청 생성 스크립트를 하나의 파일로 저장 (다시 생성하면 버전 증가)
+        
+        Args:
+            script (dict): 최종 스크립트
+        """
+        script_file = os.path.join(DATA_DIR, 'scripts', f"{script['video_id']}.json")
+        
+        revision = 0
+        if os.path.exists(script_file):
+            try:
+                with open(script_file, 'r', encoding='utf-8') as f:
+                    revision = json.load(f).get('revision', 0)
+            except Exception:
+                revision = 0
+        
+        script['schema_version'] = SCRIPT_SCHEMA_VERSION
+        script['revision'] = revision + 1
+        script['generation_mode'] = 'one_shot'
+        
+        temp_file = f"{script_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(script, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, script_file)
+    
+    def load_script(self, video_id):
+        """
+        저장된 최종 스크립트 로드
+        
+        단일 요청 생성 결과({video_id}.json)에 제목이 있으면 그것을, 아니면 단계별 생성 결과({video_id}_final.json)를 사용합니다.
+        
+        Args:
+            video_id (str): 영상 ID
+        
+        Returns:
+            dict: 최종 스크립트 (없으면 None)
+        """
+        for filename in (f"{video_id}.json", f"{video_id}_final.json"):
+            script_file = os.path.join(DATA_DIR, 'scripts', filename)
+            
+            if not os.path.exists(script_file):
+                continue
+            
+            try:
+                with open(script_file, 'r', encoding='utf-8') as f:
+                    script = json.load(f)
+            except Exception as e:
+                logger.error(f"스크립트 파일 로드 실패: {script_file}, 오류: {e}")
+                continue
+            
+            if 'youtube_title' in script:
+                return script
+        
+        return None
 
 # 테스트 코드
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+"""
+나레이션 길이 모델 모듈
+- 생성된 TTS 오디오의 실제 길이(ffprobe)를 측정하여 음성/스크립트 구간별 말하기 속도를 학습합니다.
+- 글자 수에 대한 선형 모델(길이 = 절편 + 기울기 x 글자 수)을 누적 통계로 갱신하고 JSON 파일로 저장합니다.
+- 측정값이 부족하면 같은 음성의 전체 구간 모델, 그다음 기본 말하기 속도(초당 글자 수)를 사용합니다.
+"""
+import os
+import re
+import json
+import fcntl
+import logging
+import threading
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    LOGS_DIR, TTS_VOICE_ID, DEFAULT_CHARS_PER_SECOND, DURATION_MODEL_FILE,
+    DURATION_MODEL_MIN_SAMPLES
+)
+from src.asr_backends import probe_duration
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'duration_model.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('duration_model')
+
+# 발화 길이에 영향이 없는 공백/문장부호
+NON_SPOKEN_PATTERN = re.compile(r'[\s.,!?~…·"\'“”‘’()\[\]-]+')
+
+# 음성의 전체 구간 통계를 나타내는 구간 이름
+ALL_SECTIONS = '*'
+
+# 누적 통계 항목 (모두 합으로 누적되어 여러 프로세스의 측정값을 더해 합칠 수 있음)
+STAT_FIELDS = ('n', 'sum_x', 'sum_y', 'sum_xx', 'sum_xy')
+
+
+def spoken_length(text):
+    """
+    발화되는 글자 수 (공백과 문장부호 제외)
+    
+    Args:
+        text (str): 텍스트
+    
+    Returns:
+        int: 글자 수
+    """
+    return len(NON_SPOKEN_PATTERN.sub('', text or ''))
+
+
+class DurationModel:
+    """나레이션 길이 추정 모델 클래스"""
+    
+    def __init__(self, model_file=DURATION_MODEL_FILE, min_samples=DURATION_MODEL_MIN_SAMPLES):
+        """
+        초기화 함수
+        
+        Args:
+            model_file (str): 모델 저장 파일 경로
+            min_samples (int): 음성/구간별 모델을 사용하기 위한 최소 측정 수
+        """
+        self.model_file = model_file
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self.stats = self._load()
+        
+        # 마지막 저장 이후 이 프로세스에서 추가한 측정값 (저장 시 파일의 통계에 더함)
+        self._pending = {}
+    
+    def _load(self):
+        """저장된 누적 통계 로드"""
+        try:
+            if os.path.exists(self.model_file):
+                with open(self.model_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('stats', {})
+        except Exception as e:
+            logger.warning(f"나레이션 길이 모델 로드 실패: {e}")
+        return {}
+    
+    def save(self):
+        """
+        누적 통계 저장 (임시 파일에 쓴 뒤 원자적으로 교체)
+        - 렌더링 풀의 여러 프로세스가 같은 파일을 갱신하므로, 파일 잠금 안에서 저장된 통계를 다시 읽고
+          이 프로세스가 추가한 측정값만 더해 저장합니다.
+        """
+        lock_file = f"{self.model_file}.lock"
+        
+        try:
+            os.makedirs(os.path.dirname(self.model_file), exist_ok=True)
+            with self._lock, open(lock_file, 'w') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    stats = self._load()
+                    for key, delta in self._pending.items():
+                        entry = stats.setdefault(key, {field: 0 for field in STAT_FIELDS})
+                        for field in STAT_FIELDS:
+                            entry[field] = entry.get(field, 0) + delta[field]
+                    
+                    payload = {'version': 1, 'stats': stats}
+                    temp_file = f"{self.model_file}.{os.getpid()}.tmp"
+                    with open(temp_file, 'w', encoding='utf-8') as f:
+                        json.dump(payload, f, ensure_ascii=False, indent=2)
+                    os.replace(temp_file, self.model_file)
+                    
+                    self.stats, self._pending = stats, {}
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+        except Exception as e:
+            logger.error(f"나레이션 길이 모델 저장 중 오류 발생: {e}")
+    
+    def _key(self, voice_id, section):
+        """통계 키 (음성 ID|구간)"""
+        return f"{voice_id}|{section}"
+    
+    def add_sample(self, text, seconds, voice_id=TTS_VOICE_ID, section=ALL_SECTIONS):
+        """
+        측정값 추가 (구간별 통계와 음성 전체 통계를 함께 갱신)
+        
+        Args:
+            text (str): 나레이션 텍스트
+            seconds (float): 측정된 오디오 길이 (초)
+            voice_id (str): TTS 음성 ID
+            section (str): 스크립트 구간 ('hook', 'summary', 'background', 'transition', 'ending')
+        """
+        length = spoken_length(text)
+        if length == 0 or seconds <= 0:
+            return
+        
+        sections = {section, ALL_SECTIONS}
+        sample = {'n': 1, 'sum_x': length, 'sum_y': seconds, 'sum_xx': length * length, 'sum_xy': length * seconds}
+        with self._lock:
+            for name in sections:
+                for table in (self.stats, self._pending):
+                    entry = table.setdefault(self._key(voice_id, name), {field: 0 for field in STAT_FIELDS})
+                    for field in STAT_FIELDS:
+                        entry[field] += sample[field]
+    
+    def observe(self, text, audio_path, voice_id=TTS_VOICE_ID, section=ALL_SECTIONS):
+        """
+        생성된 TTS 오디오 길이를 측정하여 모델 갱신 및 저장
+        
+        Args:
+            text (str): 나레이션 텍스트
+            audio_path (str): TTS 오디오 파일 경로
+            voice_id (str): TTS 음성 ID
+            section (str): 스크립트 구간
+        
+        Returns:
+            float: 측정된 오디오 길이 (초), 실패 시 0.0
+        """
+        seconds = probe_duration(audio_path)
+        if seconds > 0:
+            self.add_sample(text, seconds, voice_id, section)
+            self.save()
+            logger.info(f"나레이션 길이 측정: {section}, {spoken_length(text)}자, {seconds:.2f}초")
+        return seconds
+    
+    def _coefficients(self, voice_id, section):
+        """
+        (절편, 기울기) 계산 (측정 수가 부족하면 None)
+        
+        Args:
+            voice_id (str): TTS 음성 ID
+            section (str): 스크립트 구간
+        
+        Returns:
+            tuple: (절편, 기울기) 또는 None
+        """
+        entry = self.stats.get(self._key(voice_id, section))
+        if not entry or entry['n'] < self.min_samples:
+            return None
+        
+        n = entry['n']
+        denominator = n * entry['sum_xx'] - entry['sum_x'] ** 2
+        
+        if denominator > 0:
+            slope = (n * entry['sum_xy'] - entry['sum_x'] * entry['sum_y']) / denominator
+            intercept = (entry['sum_y'] - slope * entry['sum_x']) / n
+            if slope > 0 and intercept >= 0:
+                return intercept, slope
+        
+        # 글자 수 변화가 없거나 적합 결과가 비정상이면 원점을 지나는 속도만 사용
+        return 0.0, entry['sum_y'] / entry['sum_x']
+    
+    def estimate(self, text, voice_id=TTS_VOICE_ID, section=ALL_SECTIONS):
+        """
+        나레이션 길이 추정
+        
+        Args:
+            text (str): 나레이션 텍스트
+            voice_id (str): TTS 음성 ID
+            section (str): 스크립트 구간
+        
+        Returns:
+            float: 추정 길이 (초)
+        """
+        length = spoken_length(text)
+        if length == 0:
+            return 0.0
+        
+        coefficients = self._coefficients(voice_id, section) or self._coefficients(voice_id, ALL_SECTIONS)
+        if coefficients is None:
+            return len(text) / DEFAULT_CHARS_PER_SECOND
+        
+        intercept, slope = coefficients
+        return intercept + slope * length
+
+
+# 프로세스 공용 모델 인스턴스
+_shared_model = None
+
+
+def get_duration_model():
+    """
+    공용 나레이션 길이 모델 인스턴스 조회
+    
+    Returns:
+        DurationModel: 모델 인스턴스
+    """
+    global _shared_model
+    if _shared_model is None:
+        _shared_model = DurationModel()
+    return _shared_model
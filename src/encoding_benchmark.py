@@ -0,0 +1,196 @@
+"""
+인코딩 프로필 벤치마크 모듈
+- 고정된 클립을 인코딩 프로필별로 쇼츠 형식(9:16)으로 렌더링합니다.
+- 프로필별 소요 시간, CPU 시간, 출력 크기, 원본 대비 SSIM/PSNR을 측정하여 보고서로 저장합니다.
+- 품질 기준을 만족하는 가장 빠른 프로필을 고르는 데 사용합니다.
+"""
+import os
+import re
+import json
+import time
+import logging
+import resource
+import subprocess
+from datetime import datetime
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    DATA_DIR, LOGS_DIR, TEMP_DIR, SHORTS_DURATION, ENCODING_PROFILES
+)
+from src.ffmpeg_utils import encoding_args
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'encoding_benchmark.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('encoding_benchmark')
+
+# 쇼츠 영상과 같은 크기 조정 필터
+SHORTS_FILTER = 'scale=-1:1920,crop=1080:1920'
+
+# FFmpeg 품질 측정 결과 패턴
+SSIM_PATTERN = re.compile(r'SSIM .*All:([\d.]+)')
+PSNR_PATTERN = re.compile(r'PSNR .*average:([\d.]+|inf)')
+
+
+def _cpu_seconds():
+    """종료된 자식 프로세스의 누적 CPU 시간 (초)"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure_quality(encoded_file, reference_file, duration):
+    """
+    원본 대비 SSIM/PSNR 측정 (원본에 같은 크기 조정 필터를 적용하여 비교)
+    
+    Args:
+        encoded_file (str): 인코딩된 영상 경로
+        reference_file (str): 원본 클립 경로
+        duration (float): 비교할 길이 (초)
+    
+    Returns:
+        dict: ssim, psnr (측정 실패 시 None)
+    """
+    command = [
+        'ffmpeg', '-hide_banner', '-nostats',
+        '-t', str(duration), '-i', encoded_file,
+        '-t', str(duration), '-i', reference_file,
+        '-lavfi', f"[1:v]{SHORTS_FILTER},split[r1][r2];[0:v]split[a][b];[a][r1]ssim;[b][r2]psnr",
+        '-f', 'null', '-'
+    ]
+    
+    try:
+        result = subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"품질 측정 실패: {encoded_file}, 오류: {e.stderr[-500:] if e.stderr else e}")
+        return {'ssim': None, 'psnr': None}
+    
+    ssim = SSIM_PATTERN.search(result.stderr)
+    psnr = PSNR_PATTERN.search(result.stderr)
+    return {
+        'ssim': float(ssim.group(1)) if ssim else None,
+        'psnr': float(psnr.group(1)) if psnr else None
+    }
+
+
+def run_benchmark(clip_path, profiles=None, duration=SHORTS_DURATION, keep_outputs=False):
+    """
+    인코딩 프로필별 렌더링 벤치마크
+    
+    Args:
+        clip_path (str): 벤치마크에 사용할 고정 클립 경로
+        profiles (list): 측정할 프로필 이름 목록 (없으면 전체)
+        duration (float): 렌더링할 길이 (초)
+        keep_outputs (bool): 렌더링 결과 파일 보존 여부
+    
+    Returns:
+        dict: 벤치마크 보고서 (프로필별 결과 포함)
+    
+    Raises:
+        ValueError: 없는 프로필 이름이 포함된 경우 (렌더링 전에 확인)
+    """
+    profiles = list(profiles or ENCODING_PROFILES)
+    unknown = [name for name in profiles if name not in ENCODING_PROFILES]
+    if unknown:
+        raise ValueError(f"지원하지 않는 인코딩 프로필: {', '.join(unknown)} (사용 가능: {', '.join(ENCODING_PROFILES)})")
+    
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    os.makedirs(os.path.join(DATA_DIR, 'reports'), exist_ok=True)
+    
+    results = []
+    for profile in profiles:
+        output_path = os.path.join(TEMP_DIR, f"benchmark_{profile}.mp4")
+        command = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-t', str(duration), '-i', clip_path,
+            '-vf', SHORTS_FILTER,
+            *encoding_args(profile),
+            output_path
+        ]
+        
+        logger.info(f"인코딩 프로필 벤치마크 시작: {profile}")
+        cpu_started = _cpu_seconds()
+        started = time.perf_counter()
+        
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"인코딩 프로필 렌더링 실패: {profile}, 오류: {e}")
+            results.append({'profile': profile, 'error': str(e)})
+            continue
+        
+        wall_seconds = time.perf_counter() - started
+        cpu_seconds = _cpu_seconds() - cpu_started
+        
+        result = {
+            'profile': profile,
+            'wall_seconds': round(wall_seconds, 2),
+            'cpu_seconds': round(cpu_seconds, 2),
+            'size_bytes': os.path.getsize(output_path),
+            **measure_quality(output_path, clip_path, duration)
+        }
+        results.append(result)
+        logger.info(
+            f"{profile}: {result['wall_seconds']}초, CPU {result['cpu_seconds']}초, "
+            f"{result['size_bytes'] / 1024 ** 2:.1f}MB, SSIM {result['ssim']}, PSNR {result['psnr']}"
+        )
+        
+        if not keep_outputs and os.path.exists(output_path):
+            os.remove(output_path)
+    
+    report = {
+        'clip': os.path.abspath(clip_path),
+        'duration': duration,
+        'cpu_count': os.cpu_count(),
+        'created_at': datetime.now().isoformat(),
+        'profiles': {name: ENCODING_PROFILES[name] for name in profiles},
+        'results': results
+    }
+    
+    report_file = os.path.join(DATA_DIR, 'reports', f"encoding_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    logger.info(f"인코딩 프로필 벤치마크 보고서 저장: {report_file}")
+    return report
+
+
+def format_report(report):
+    """
+    벤치마크 결과 표 형식 문자열
+    
+    Args:
+        report (dict): run_benchmark 결과
+    
+    Returns:
+        str: 표 형식 문자열
+    """
+    lines = [f"{'profile':<10}{'wall(s)':>10}{'cpu(s)':>10}{'size(MB)':>10}{'SSIM':>10}{'PSNR':>10}"]
+    for result in report['results']:
+        if 'error' in result:
+            lines.append(f"{result['profile']:<10}  실패: {result['error']}")
+            continue
+        ssim = f"{result['ssim']:.4f}" if result['ssim'] is not None else '-'
+        psnr = f"{result['psnr']:.2f}" if result['psnr'] is not None else '-'
+        lines.append(
+            f"{result['profile']:<10}{result['wall_seconds']:>10.2f}{result['cpu_seconds']:>10.2f}"
+            f"{result['size_bytes'] / 1024 ** 2:>10.1f}{ssim:>10}{psnr:>10}"
+        )
+    return '\n'.join(lines)
+
+
+# 테스트 코드
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python src/encoding_benchmark.py <클립 경로> [프로필 ...]")
+        sys.exit(1)
+    
+    report = run_benchmark(sys.argv[1], profiles=sys.argv[2:] or None)
+    print(format_report(report))
@@ -0,0 +1,108 @@
+"""
+추출 요약 모듈
+- LLM 요약 요청 전에 긴 텍스트에서 핵심 문장만 추려 프롬프트 토큰을 줄입니다.
+- TF-IDF 문장 벡터의 코사인 유사도 그래프에서 TextRank 점수를 계산합니다 (NumPy/SciPy 희소 행렬).
+"""
+import numpy as np
+from scipy import sparse
+
+from src.text_utils import term_features, split_sentences, estimate_tokens
+
+# TextRank 감쇠 계수 및 반복 설정
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+
+
+def rank_sentences(sentences):
+    """
+    TextRank로 문장 중요도 계산
+    
+    Args:
+        sentences (list): 문장 목록
+    
+    Returns:
+        numpy.ndarray: 문장별 점수
+    """
+    n = len(sentences)
+    if n == 0:
+        return np.zeros(0)
+    
+    # 문장 x 특징 빈도 희소 행렬 구성
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for i, sentence in enumerate(sentences):
+        for feature in term_features(sentence):
+            rows.append(i)
+            cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+            counts.append(1.0)
+    
+    if not vocabulary:
+        return np.full(n, 1.0 / n)
+    
+    tf = sparse.csr_matrix((counts, (rows, cols)), shape=(n, len(vocabulary)))
+    tf.sum_duplicates()
+    
+    # TF-IDF 가중치 및 행 정규화
+    document_frequency = np.bincount(tf.indices, minlength=len(vocabulary))
+    idf = np.log((1 + n) / (1 + document_frequency)) + 1.0
+    tfidf = tf.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    tfidf = sparse.diags(1.0 / norms) @ tfidf
+    
+    # 코사인 유사도 그래프 (자기 자신 제외) 및 전이 행렬
+    similarity = (tfidf @ tfidf.T).tolil()
+    similarity.setdiag(0)
+    similarity = similarity.tocsr()
+    out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    out_weight[dangling] = 1.0
+    transition = (sparse.diags(1.0 / out_weight) @ similarity).T.tocsr()
+    
+    # 거듭제곱법으로 TextRank 점수 계산
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        dangling_mass = scores[dangling].sum() / n
+        updated = (1 - DAMPING) / n + DAMPING * (transition @ scores + dangling_mass)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            scores = updated
+            break
+        scores = updated
+    
+    return scores
+
+
+def reduce_text(text, token_budget):
+    """
+    토큰 예산 안에서 중요도가 높은 문장만 원래 순서대로 남김
+    
+    Args:
+        text (str): 원본 텍스트
+        token_budget (int): 최대 토큰 수
+    
+    Returns:
+        str: 축약된 텍스트 (예산 이내면 원본 그대로)
+    """
+    if not text or estimate_tokens(text) <= token_budget:
+        return text
+    
+    sentences = split_sentences(text)
+    if len(sentences) < 2:
+        return text
+    
+    scores = rank_sentences(sentences)
+    
+    selected = []
+    used = 0
+    for index in np.argsort(-scores, kind='stable'):
+        cost = estimate_tokens(sentences[index])
+        if used + cost > token_budget:
+            continue
+        selected.append(index)
+        used += cost
+    
+    if not selected:
+        return text
+    
+    return ' '.join(sentences[i] for i in sorted(selected))
@@ -9,7 +9,6 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
-import openai
 import requests
 import random
 import sqlite3
@@ -18,8 +17,11 @@ import sqlite3
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
-    OPENAI_API_KEY, DATA_DIR, LOGS_DIR
+    DATA_DIR, LOGS_DIR
 )
+from src.llm_client import get_llm_client
+from src.template_store import get_template_store
+from src.candidate_scorer import classify_hook_style
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,9 +34,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger('feedback_processor')
 
-# OpenAI API 키 설정
-openai.api_key = OPENAI_API_KEY
-
 class FeedbackProcessor:
     """피드백 및 강화학습 클래스"""
     
@@ -56,8 +55,11 @@ class FeedbackProcessor:
         self.db_path = db_path
         self._init_database()
         
-        # 템플릿 로드
-        self.templates = self._load_templates()
+        # 콘텐츠 생성 모듈과 공유하는 템플릿 저장소
+        self.template_store = get_template_store()
+        
+        # 캐시를 공유하는 LLM 클라이언트
+        self.llm = get_llm_client()
         
         logger.info("FeedbackProcessor 초기화 완료")
     
@@ -79,10 +81,16 @@ class FeedbackProcessor:
                 background_included BOOLEAN,
                 subtitle_size TEXT,
                 subtitle_speed TEXT,
-                video_length INTEGER
+                video_length INTEGER,
+                hook_text TEXT
             )
             ''')
             
+            # 이전 버전 데이터베이스에 Hook 멘트 열 추가 (후보 점수 계산용)
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(videos)')}
+            if 'hook_text' not in columns:
+                cursor.execute('ALTER TABLE videos ADD COLUMN hook_text TEXT')
+            
             # 성과 테이블 생성
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS performance (
@@ -133,71 +141,25 @@ class FeedbackProcessor:
         except Exception as e:
             logger.error(f"데이터베이스 초기화 중 오류 발생: {e}")
     
-    def _load_templates(self):
-        """
-        템플릿 로드
-        
-        Returns:
-            dict: 템플릿 사전
-        """
-        template_file = os.path.join(DATA_DIR, 'templates.json')
-        
-        if os.path.exists(template_file):
-            try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    templates = json.load(f)
-                logger.info("템플릿 파일 로드 성공")
-                return templates
-            except Exception as e:
-                logger.error(f"템플릿 파일 로드 실패: {e}")
-                return self._get_default_templates()
-        else:
-            logger.warning("템플릿 파일이 없습니다. 기본 템플릿을 사용합니다.")
-            return self._get_default_templates()
-    
-    def _get_default_templates(self):
-        """
-        기본 템플릿 반환
-        
-        Returns:
-            dict: 기본 템플릿 사전
-        """
-        return {
-            'hook': {
-                'question': "{}?",
-                'warning': "주의하세요! {}",
-                'shocking': "충격! {}",
-                'interesting': "놀라운 사실! {}"
-            },
-            'transition': [
-                "자세히 알아보겠습니다.",
-                "지금 바로 알려드립니다.",
-                "함께 살펴보겠습니다.",
-                "이것이 전체 내용입니다."
-            ],
-            'ending': [
-                "이상 글로벌 뉴스 단신이었습니다.",
-                "더 자세한 내용은 링크를 참고하세요.",
-                "구독과 좋아요 부탁드립니다.",
-                "다음 소식에서 다시 만나요."
-            ]
-        }
+    @property
+    def templates(self):
+        """현재 템플릿 (파일이 변경되면 자동으로 다시 로드)"""
+        return self.template_store.get()
     
-    def save_templates(self, templates):
+    def save_templates(self, templates, base_templates=None, base_version=None):
         """
         템플릿 저장
         
         Args:
             templates (dict): 템플릿 사전
+            base_templates (dict): 수정의 기준이 된 템플릿 (template_store.snapshot() 결과)
+            base_version (int): 기준 템플릿의 버전 (지정하면 그 사이 다른 변경과 병합하여 저장)
         """
-        template_file = os.path.join(DATA_DIR, 'templates.json')
-        
         try:
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(templates, f, ensure_ascii=False, indent=2)
-            
-            self.templates = templates
-            logger.info("템플릿 파일 저장 완료")
+            if base_version is None:
+                self.template_store.save(templates)
+            else:
+                self.template_store.update(templates, base_templates, base_version)
         except Exception as e:
             logger.error(f"템플릿 파일 저장 실패: {e}")
     
@@ -216,11 +178,7 @@ class FeedbackProcessor:
         try:
             # Hook 스타일 추출
             hook = script['hook']
-            hook_style = 'question' if hook.endswith('?') else \
-                         'warning' if hook.startswith('주의') else \
-                         'shocking' if hook.startswith('충격') else \
-                         'interesting' if hook.startswith('놀라운') else \
-                         'normal'
+            hook_style = classify_hook_style(hook)
             
             # 요약 길이 계산
             summary_length = len(script['summary'].split())
@@ -242,11 +200,11 @@ class FeedbackProcessor:
             cursor.execute('''
             INSERT INTO videos (
                 video_id, title, upload_time, hook_style, summary_length,
-                background_included, subtitle_size, subtitle_speed, video_length
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                background_included, subtitle_size, subtitle_speed, video_length, hook_text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 video_id, title, datetime.now().isoformat(), hook_style, summary_length,
-                background_included, subtitle_size, subtitle_speed, video_length
+                background_included, subtitle_size, subtitle_speed, video_length, hook
             ))
             
             conn.commit()
@@ -347,8 +305,10 @@ class FeedbackProcessor:
             comment_texts = [comment.get('text', '') for comment in comments]
             
             # OpenAI API를 사용하여 피드백 생성
-            response = openai.chat.completions.create(
+            content = self.llm.chat(
                 model="gpt-4o",
+                call_site='generate_feedback',
+                use_cache=False,
                 messages=[
                     {"role": "system", "content": "You are an expert YouTube Shorts analytics consultant specializing in optimizing content for maximum engagement."},
                     {"role": "user", "content": f"""
@@ -400,7 +360,7 @@ class FeedbackProcessor:
                 response_format={"type": "json_object"}
             )
             
-            feedback = json.loads(response.choices[0].message.content)
+            feedback = json.loads(content)
             
             # 피드백 저장
             conn = sqlite3.connect(self.db_path)
@@ -445,10 +405,13 @@ class FeedbackProcessor:
             dict: 업데이트된 템플릿
         """
         try:
+            # 제안의 기준이 된 템플릿과 버전 (저장 시 그 사이 다른 변경과 병합)
+            base_templates, base_version = self.template_store.snapshot()
+            
             # 피드백이 충분하지 않으면 업데이트하지 않음
             if len(feedback_list) < 3:
                 logger.info("피드백이 충분하지 않아 템플릿을 업데이트하지 않습니다.")
-                return self.templates
+                return base_templates
             
             # 피드백 분석
             hook_feedbacks = [f.get('hook_feedback', '') for f in feedback_list]
@@ -457,15 +420,17 @@ class FeedbackProcessor:
             length_feedbacks = [f.get('length_feedback', '') for f in feedback_list]
             
             # OpenAI API를 사용하여 템플릿 업데이트 제안 생성
-            response = openai.chat.completions.create(
+            content = self.llm.chat(
                 model="gpt-4o",
+                call_site='update_templates',
+                use_cache=False,
                 messages=[
                     {"role": "system", "content": "You are an expert in content optimization and template design for short-form videos."},
                     {"role": "user", "content": f"""
                     다음은 YouTube Shorts 영상에 대한 여러 피드백입니다. 이를 바탕으로 템플릿 업데이트 제안을 해주세요.
                     
                     현재 템플릿:
-                    {json.dumps(self.templates, ensure_ascii=False, indent=2)}
+                    {json.dumps(base_templates, ensure_ascii=False, indent=2)}
                     
                    
 (Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+FFmpeg 유틸리티 모듈
+- ffprobe로 스트림 복사한 구간 파일에서 구간 시작 지점의 실제 위치를 조회합니다.
+- 이름 붙인 인코딩 프로필(draft, publish, archive)을 FFmpeg 출력 인자로 변환합니다.
+"""
+import os
+import json
+import logging
+import subprocess
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    LOGS_DIR, ENCODING_PROFILES, ENCODING_PROFILE, ENCODING_THREADS
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'ffmpeg_utils.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('ffmpeg_utils')
+
+def encoding_args(profile=ENCODING_PROFILE, threads=None):
+    """
+    인코딩 프로필을 FFmpeg 출력 인자로 변환
+    
+    Args:
+        profile (str): 프로필 이름 (ENCODING_PROFILES의 키)
+        threads (int): 인코딩 스레드 수 (지정하면 프로필/환경 설정보다 우선, 렌더링 풀의 작업별 할당량)
+    
+    Returns:
+        list: 영상/오디오 코덱 및 출력 옵션 인자
+    """
+    if profile not in ENCODING_PROFILES:
+        logger.warning(f"알 수 없는 인코딩 프로필: {profile}, publish 프로필을 사용합니다.")
+        profile = 'publish'
+    
+    options = ENCODING_PROFILES[profile]
+    args = [
+        '-c:v', 'libx264',
+        '-preset', options['preset'],
+        '-crf', str(options['crf']),
+        '-g', str(options['gop']),
+        '-pix_fmt', 'yuv420p',
+        '-threads', str(threads or ENCODING_THREADS or options['threads'])
+    ]
+    
+    if options.get('tune'):
+        args += ['-tune', options['tune']]
+    
+    # CRF 품질을 유지하되 최대 비트레이트 제한 (버퍼는 2배)
+    if options.get('maxrate'):
+        bufsize = f"{int(options['maxrate'][:-1]) * 2}{options['maxrate'][-1]}"
+        args += ['-maxrate', options['maxrate'], '-bufsize', bufsize]
+    
+    args += [
+        '-c:a', 'aac',
+        '-b:a', options['audio_bitrate'],
+        '-movflags', '+faststart'
+    ]
+    return args
+
+
+def run_ffmpeg(command, duration=None, on_progress=None):
+    """
+    FFmpeg 명령 실행 (진행률 콜백 지원)
+    
+    Args:
+        command (list): 'ffmpeg'으로 시작하는 명령
+        duration (float): 출력 길이 (초, 진행률 계산용)
+        on_progress (callable): 진행률(0-100)을 받을 함수 (없으면 진행률을 읽지 않음)
+    
+    Raises:
+        subprocess.CalledProcessError: FFmpeg가 실패한 경우
+    """
+    if not on_progress or not duration:
+        subprocess.run(command, check=True)
+        return
+    
+    # -progress 출력의 out_time_us(마이크로초)로 진행률 계산
+    command = [command[0], '-progress', 'pipe:1', '-nostats', *command[1:]]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    
+    last_percent = -1
+    for line in process.stdout:
+        key, _, value = line.strip().partition('=')
+        if key != 'out_time_us' or not value.isdigit():
+            continue
+        percent = min(100, int(int(value) / 1e6 / duration * 100))
+        if percent != last_percent:
+            last_percent = percent
+            on_progress(percent)
+    
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+def probe_section_start(video_file):
+    """
+    스트림 복사로 잘라 받은 구간 파일에서 요청한 구간 시작 지점의 위치 조회
+    - 영상은 구간 시작 이전 키프레임부터 복사되며, 그 앞부분은 음수 타임스탬프(편집 목록)로 남거나
+      타임스탬프가 0부터 시작하도록 밀려 저장됩니다.
+    - 오디오는 프레임 단위(수십 ms)로 잘리므로 첫 오디오 패킷 시각을 구간 시작 지점으로 보고,
+      FFmpeg 입력 탐색(-ss)의 기준인 파일 시작 시각과의 차이를 반환합니다.
+    
+    Args:
+        video_file (str): 구간 영상 파일 경로
+    
+    Returns:
+        float: 파일 시작부터 구간 시작 지점까지의 시간 (초), 조회 실패 시 None
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0', '-read_intervals', '%+#1',
+             '-show_entries', 'format=start_time:packet=pts_time', '-of', 'json', video_file],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        info = json.loads(result.stdout)
+        file_start = float(info.get('format', {}).get('start_time', 0))
+        packets = info.get('packets') or [{}]
+        section_start = float(packets[0].get('pts_time', 0))
+        return max(0.0, section_start - file_start)
+    except Exception as e:
+        logger.warning(f"구간 시작 위치 조회 실패: {video_file}, 오류: {e}")
+        return None
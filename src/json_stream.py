@@ -0,0 +1,87 @@
+"""
+스트리밍 JSON 파서 모듈
+- 스트리밍 응답으로 조금씩 도착하는 JSON 객체에서 최상위 필드가 완성되는 즉시 꺼냅니다.
+- 문자열 값은 닫는 따옴표가 도착하면 바로, 그 밖의 값은 다음 쉼표나 닫는 괄호가 도착하면 반환합니다.
+"""
+import json
+
+
+class JSONFieldParser:
+    """최상위 JSON 객체 필드 점진적 파서"""
+    
+    def __init__(self):
+        """초기화 함수"""
+        self.buffer = ''
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = None
+        self.key = None
+        self.value_start = None
+        self.emitted = False
+    
+    def _complete_value(self, end):
+        """value_start부터 end 직전까지의 값 해석"""
+        raw = self.buffer[self.value_start:end].strip()
+        self.value_start = None
+        if self.emitted or not raw:
+            return None
+        return json.loads(raw)
+    
+    def feed(self, text):
+        """
+        응답 조각 추가
+        
+        Args:
+            text (str): 새로 도착한 응답 조각
+        
+        Returns:
+            list: 이번 조각으로 완성된 (필드 이름, 값) 목록
+        """
+        self.buffer += text
+        fields = []
+        
+        while self.position < len(self.buffer):
+            i = self.position
+            char = self.buffer[i]
+            self.position += 1
+            
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                    
+                    # 최상위 객체의 키 또는 문자열 값
+                    if self.depth == 1:
+                        literal = json.loads(self.buffer[self.string_start:i + 1])
+                        if self.value_start is None:
+                            self.key = literal
+                        else:
+                            fields.append((self.key, literal))
+                            self.emitted = True
+                continue
+            
+            if char == '"':
+                self.in_string = True
+                self.string_start = i
+            elif char in '{[':
+                self.depth += 1
+            elif char in '}]':
+                if self.depth == 1 and self.value_start is not None:
+                    value = self._complete_value(i)
+                    if not self.emitted:
+                        fields.append((self.key, value))
+                self.depth -= 1
+            elif char == ':' and self.depth == 1:
+                self.value_start = i + 1
+                self.emitted = False
+            elif char == ',' and self.depth == 1 and self.value_start is not None:
+                value = self._complete_value(i)
+                if not self.emitted:
+                    fields.append((self.key, value))
+        
+        return fields
@@ -0,0 +1,217 @@
+"""
+언어 감지 및 라우팅 모듈
+- 자막 샘플의 문자 체계와 불용어 분포로 언어를 빠르게 감지합니다 (외부 모델 불필요).
+- 자막 구간별 언어를 표시하고, 번역이 필요한 구간만 묶어 번역 단위를 만듭니다.
+"""
+import re
+from collections import Counter
+
+# 한국어 코드
+KOREAN = 'ko'
+
+# 문자 체계별 언어 (유니코드 범위)
+SCRIPT_RANGES = [
+    ('ko', re.compile(r'[가-힣ᄀ-ᇿ㄰-㆏]')),
+    ('ja', re.compile(r'[぀-ヿ]')),
+    ('zh', re.compile(r'[一-鿿]')),
+    ('ru', re.compile(r'[Ѐ-ӿ]')),
+    ('ar', re.compile(r'[؀-ۿ]')),
+    ('he', re.compile(r'[֐-׿]')),
+    ('hi', re.compile(r'[ऀ-ॿ]')),
+    ('th', re.compile(r'[฀-๿]')),
+    ('el', re.compile(r'[Ͱ-Ͽ]')),
+]
+LATIN_PATTERN = re.compile(r'[A-Za-zÀ-ɏ]')
+WORD_PATTERN = re.compile(r"[a-zÀ-ɏ']+")
+
+# 라틴 문자 언어별 고빈도 불용어
+LATIN_STOPWORDS = {
+    'en': {'the', 'and', 'is', 'are', 'of', 'to', 'in', 'that', 'it', 'was', 'for', 'on', 'with', 'this', 'have', 'you'},
+    'es': {'el', 'la', 'los', 'las', 'de', 'que', 'y', 'en', 'un', 'una', 'es', 'por', 'con', 'para', 'del', 'se'},
+    'fr': {'le', 'la', 'les', 'de', 'des', 'et', 'est', 'un', 'une', 'que', 'qui', 'dans', 'pour', 'pas', 'du', 'sur'},
+    'de': {'der', 'die', 'das', 'und', 'ist', 'nicht', 'ein', 'eine', 'zu', 'den', 'mit', 'von', 'sich', 'auf', 'für', 'dem'},
+    'pt': {'o', 'os', 'as', 'de', 'que', 'e', 'do', 'da', 'em', 'um', 'uma', 'para', 'com', 'não', 'no', 'na'},
+    'it': {'il', 'lo', 'gli', 'di', 'che', 'e', 'è', 'un', 'una', 'per', 'con', 'non', 'del', 'della', 'sono', 'nel'},
+}
+
+# 언어 코드별 이름 (번역 프롬프트용)
+LANGUAGE_NAMES = {
+    'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German', 'pt': 'Portuguese',
+    'it': 'Italian', 'ja': 'Japanese', 'zh': 'Chinese', 'ru': 'Russian', 'ar': 'Arabic',
+    'he': 'Hebrew', 'hi': 'Hindi', 'th': 'Thai', 'el': 'Greek', 'ko': 'Korean'
+}
+
+# 구간 언어 판정에 필요한 최소 문자 수
+MIN_DETECT_CHARS = 12
+
+# 외국어 구간 사이에 낀 짧은 한국어 구간은 번역 단위에 포함 (글자 수)
+MIN_KOREAN_RUN_CHARS = 40
+
+
+def normalize_language_code(code):
+    """
+    언어 코드 정규화 ('en-US' -> 'en')
+    
+    Args:
+        code (str): 언어 코드
+    
+    Returns:
+        str: ISO 639-1 언어 코드 (없으면 None)
+    """
+    if not code:
+        return None
+    return code.replace('_', '-').split('-')[0].lower() or None
+
+
+def sample_text(texts, max_chars=2000, samples=5):
+    """
+    텍스트 목록 전체에서 고르게 샘플 추출
+    
+    Args:
+        texts (list): 텍스트 목록
+        max_chars (int): 최대 글자 수
+        samples (int): 샘플 위치 수
+    
+    Returns:
+        str: 샘플 텍스트
+    """
+    if not texts:
+        return ''
+    
+    per_sample = max(1, max_chars // samples)
+    step = max(1, len(texts) // samples)
+    parts = []
+    
+    for start in range(0, len(texts), step):
+        chunk = ''
+        for text in texts[start:start + step]:
+            if len(chunk) >= per_sample:
+                break
+            chunk += text + ' '
+        parts.append(chunk[:per_sample])
+    
+    return ' '.join(parts)[:max_chars]
+
+
+def detect_language(text, default=None):
+    """
+    텍스트 언어 감지
+    
+    Args:
+        text (str): 텍스트 (샘플)
+        default (str): 판정할 수 없을 때 반환할 언어 코드
+    
+    Returns:
+        str: ISO 639-1 언어 코드
+    """
+    if not text:
+        return default
+    
+    script_counts = {code: len(pattern.findall(text)) for code, pattern in SCRIPT_RANGES}
+    latin_count = len(LATIN_PATTERN.findall(text))
+    
+    # 가나가 있으면 한자가 섞여 있어도 일본어
+    if script_counts['ja']:
+        script_counts['ja'] += script_counts['zh']
+    
+    best_script, best_count = max(script_counts.items(), key=lambda item: item[1])
+    
+    if best_count + latin_count < MIN_DETECT_CHARS:
+        return default
+    
+    if best_count >= latin_count:
+        return best_script
+    
+    # 라틴 문자 언어는 불용어 분포로 구분
+    words = Counter(WORD_PATTERN.findall(text.lower()))
+    scores = {
+        code: sum(words[word] for word in stopwords)
+        for code, stopwords in LATIN_STOPWORDS.items()
+    }
+    best_language, best_score = max(scores.items(), key=lambda item: item[1])
+    
+    if best_score == 0:
+        return default if default and default not in dict(SCRIPT_RANGES) else 'en'
+    return best_language
+
+
+def label_segment_languages(segments, default=None):
+    """
+    자막 구간별 언어 표시 (판정 불가한 짧은 구간은 주변/기본 언어 사용)
+    
+    Args:
+        segments (list): 자막 구간 목록 (text, start, duration, [language])
+        default (str): 기본 언어 코드 (자막 트랙 언어 등)
+    
+    Returns:
+        str: 전체 자막의 대표 언어 코드
+    """
+    overall = detect_language(sample_text([s['text'] for s in segments]), default=default) or default
+    
+    previous = overall
+    for segment in segments:
+        language = detect_language(segment['text'], default=None)
+        segment['language'] = language or previous or overall
+        previous = segment['language']
+    
+    return overall
+
+
+def build_translation_runs(segments, unit_seconds=None):
+    """
+    같은 번역 여부(한국어/외국어)를 가진 연속 구간을 하나의 실행 단위로 묶기
+    
+    외국어 구간 사이의 짧은 한국어 구간은 별도 호출을 만들지 않도록 외국어 단위에 합칩니다.
+    unit_seconds를 지정하면 자막 시간축의 고정 경계에서도 단위를 나누므로,
+    자막이 일부 수정되어도 나머지 단위의 원문이 그대로 유지됩니다.
+    
+    Args:
+        segments (list): 언어가 표시된 자막 구간 목록
+        unit_seconds (int): 시간축 단위 경계 간격 (초)
+    
+    Returns:
+        list: 실행 단위 목록 (language, needs_translation, text, start, segments)
+    """
+    runs = []
+    
+    for segment in segments:
+        language = segment.get('language') or 'en'
+        needs_translation = language != KOREAN
+        bucket = int(segment.get('start', 0) // unit_seconds) if unit_seconds else 0
+        
+        if runs and runs[-1]['needs_translation'] == needs_translation and runs[-1]['bucket'] == bucket:
+            run = runs[-1]
+            run['segments'].append(segment)
+            run['text'] += ' ' + segment['text']
+            run['languages'][language] += len(segment['text'])
+        else:
+            runs.append({
+                'needs_translation': needs_translation,
+                'bucket': bucket,
+                'start': segment.get('start', 0),
+                'text': segment['text'],
+                'segments': [segment],
+                'languages': Counter({language: len(segment['text'])})
+            })
+    
+    # 짧은 한국어 단위를 앞의 외국어 단위에 병합 (뒤따르는 외국어 단위도 이어서 병합됨)
+    merged = []
+    for run in runs:
+        is_short_korean = not run['needs_translation'] and len(run['text']) < MIN_KOREAN_RUN_CHARS
+        same_bucket = merged and merged[-1]['bucket'] == run['bucket']
+        if same_bucket and merged[-1]['needs_translation'] and (run['needs_translation'] or is_short_korean):
+            previous = merged[-1]
+            previous['segments'].extend(run['segments'])
+            previous['text'] += ' ' + run['text']
+            previous['languages'].update(run['languages'])
+            continue
+        merged.append(run)
+    
+    for run in merged:
+        del run['bucket']
+        languages = run.pop('languages')
+        run['language'] = languages.most_common(1)[0][0] if run['needs_translation'] else KOREAN
+        if run['needs_translation'] and run['language'] == KOREAN:
+            run['language'] = next((code for code, _ in languages.most_common() if code != KOREAN), 'en')
+    
+    return merged
@@ -0,0 +1,597 @@
+"""
+LLM 클라이언트 모듈
+- 모든 모듈의 OpenAI Chat API 호출을 하나의 클라이언트로 통합합니다.
+- (모델, 메시지, temperature, response_format, 프롬프트 버전)을 키로 하는 SQLite 응답 캐시를 제공합니다.
+- 캐시는 유효 기간(TTL)과 최대 항목 수로 정리하며, 적중/미적중 지표를 집계합니다.
+- 호출 위치별 최근 응답 시간 백분위를 넘긴 요청은 한 번 더 보내(헤징) 먼저 온 응답을 사용합니다.
+  응답 시간 기록과 중복 요청 예산은 캐시 데이터베이스에 저장하여 실행이 바뀌어도 이어서 사용합니다.
+- JSON 응답을 스트리밍으로 받아 최상위 필드가 완성되는 즉시 전달할 수 있습니다.
+"""
+import os
+import json
+import math
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+import openai
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    OPENAI_API_KEY, LOGS_DIR, LLM_CACHE_DB, LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES, LLM_PROMPT_VERSION, LLM_HEDGING_ENABLED, LLM_HEDGE_CALL_SITES,
+    LLM_HEDGE_PERCENTILE, LLM_HEDGE_MIN_SAMPLES, LLM_HEDGE_WINDOW, LLM_HEDGE_BUDGET,
+    LLM_HEDGE_BUDGET_SECONDS
+)
+from src.json_stream import JSONFieldParser
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'llm_client.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('llm_client')
+
+# OpenAI API 키 설정
+openai.api_key = OPENAI_API_KEY
+
+
+class LLMClient:
+    """OpenAI Chat API 클라이언트 (응답 캐시 포함)"""
+    
+    def __init__(self, db_path=LLM_CACHE_DB, ttl=LLM_CACHE_TTL_SECONDS, max_entries=LLM_CACHE_MAX_ENTRIES):
+        """
+        초기화 함수
+        
+        Args:
+            db_path (str): 캐시 데이터베이스 파일 경로
+            ttl (int): 캐시 유효 기간 (초)
+            max_entries (int): 최대 캐시 항목 수
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        self._metrics = {
+            'hits': 0, 'misses': 0, 'bypassed': 0, 'stores': 0, 'evictions': 0,
+            'requests': 0, 'hedges': 0, 'hedge_wins': 0, 'hedges_skipped': 0
+        }
+        self._metrics_lock = threading.Lock()
+        
+        # 호출 위치별 최근 응답 시간 및 헤징 요청용 스레드 풀
+        self._latencies = {}
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix='llm')
+        
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._init_database()
+        self._load_latencies()
+    
+    def _connect(self):
+        """데이터베이스 연결 (호출마다 새 연결, 스레드 간 공유하지 않음)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+    
+    def _init_database(self):
+        """캐시 테이블 초기화"""
+        try:
+            conn = self._connect()
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT,
+                created_at REAL,
+                last_access REAL,
+                hits INTEGER DEFAULT 0
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+            
+            # 헤징 판단용 호출 위치별 응답 시간 (호출 위치마다 최근 LLM_HEDGE_WINDOW개 유지)과 중복 요청 기록
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS latencies (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                call_site TEXT,
+                seconds REAL,
+                recorded_at REAL
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_latencies_call_site ON latencies (call_site, id)')
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS hedges (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                call_site TEXT,
+                sent_at REAL
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_hedges_sent_at ON hedges (sent_at)')
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"LLM 캐시 데이터베이스 초기화 중 오류 발생: {e}")
+    
+    def _count(self, name, amount=1):
+        """지표 집계"""
+        with self._metrics_lock:
+            self._metrics[name] += amount
+    
+    def cache_key(self, model, messages, temperature, response_format, prompt_version):
+        """
+        캐시 키 생성
+        
+        Args:
+            model (str): 모델 이름
+            messages (list): 메시지 목록
+            temperature (float): 샘플링 온도
+            response_format (dict): 응답 형식
+            prompt_version (str): 프롬프트 버전
+        
+        Returns:
+            str: 캐시 키 (SHA-256)
+        """
+        payload = json.dumps(
+            {
+                'model': model,
+                'messages': messages,
+                'temperature': temperature,
+                'response_format': response_format,
+                'prompt_version': prompt_version
+            },
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _get(self, key):
+        """캐시 조회 (만료된 항목은 무시)"""
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT response, created_at FROM responses WHERE cache_key = ?', (key,)
+            ).fetchone()
+            
+            if row and time.time() - row[1] <= self.ttl:
+                conn.execute(
+                    'UPDATE responses SET last_access = ?, hits = hits + 1 WHERE cache_key = ?',
+                    (time.time(), key)
+                )
+                conn.commit()
+                conn.close()
+                return row[0]
+            
+            conn.close()
+        except Exception as e:
+            logger.warning(f"LLM 캐시 조회 실패: {e}")
+        return None
+    
+    def _put(self, key, model, response):
+        """캐시 저장"""
+        try:
+            now = time.time()
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO responses (cache_key, model, response, created_at, last_access, hits) '
+                'VALUES (?, ?, ?, ?, ?, 0)',
+                (key, model, response, now, now)
+            )
+            conn.commit()
+            conn.close()
+            self._count('stores')
+        except Exception as e:
+            logger.warning(f"LLM 캐시 저장 실패: {e}")
+    
+    def evict(self):
+        """
+        만료된 항목과 최대 항목 수를 넘는 오래 사용하지 않은 항목 삭제
+        
+        Returns:
+            int: 삭제한 항목 수
+        """
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            
+            cursor.execute('DELETE FROM responses WHERE created_at < ?', (time.time() - self.ttl,))
+            removed = cursor.rowcount
+            
+            cursor.execute('''
+            DELETE FROM responses WHERE cache_key IN (
+                SELECT cache_key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+            ''', (self.max_entries,))
+            removed += cursor.rowcount
+            
+            conn.commit()
+            conn.close()
+            
+            if removed:
+                self._count('evictions', removed)
+                logger.info(f"LLM 캐시 정리: {removed}개 항목 삭제")
+            return removed
+        except Exception as e:
+            logger.warning(f"LLM 캐시 정리 실패: {e}")
+            return 0
+    
+    def _load_latencies(self):
+        """저장된 호출 위치별 최근 응답 시간 로드"""
+        try:
+            conn = self._connect()
+            rows = conn.execute('SELECT call_site, seconds FROM latencies ORDER BY id').fetchall()
+            conn.close()
+        except Exception as e:
+            logger.warning(f"LLM 응답 시간 기록 로드 실패: {e}")
+            return
+        
+        for call_site, seconds in rows:
+            self._latencies.setdefault(call_site, deque(maxlen=LLM_HEDGE_WINDOW)).append(seconds)
+    
+    def _record_latency(self, call_site, seconds):
+        """호출 위치별 응답 시간 기록 (데이터베이스에도 저장하여 다음 실행에서 이어서 사용)"""
+        with self._metrics_lock:
+            self._latencies.setdefault(call_site, deque(maxlen=LLM_HEDGE_WINDOW)).append(seconds)
+        
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT INTO latencies (call_site, seconds, recorded_at) VALUES (?, ?, ?)',
+                (call_site, seconds, time.time())
+            )
+            conn.execute('''
+            DELETE FROM latencies WHERE call_site = ? AND id <= (
+                SELECT id FROM latencies WHERE call_site = ? ORDER BY id DESC LIMIT 1 OFFSET ?
+            )
+            ''', (call_site, call_site, LLM_HEDGE_WINDOW))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.warning(f"LLM 응답 시간 기록 저장 실패: {e}")
+    
+    def latency_percentile(self, call_site, percentile=LLM_HEDGE_PERCENTILE):
+        """
+        호출 위치별 최근 응답 시간 백분위
+        
+        Args:
+            call_site (str): 호출 위치 이름
+            percentile (float): 백분위 (0-100)
+        
+        Returns:
+            float: 응답 시간 (초), 측정 수가 부족하면 None
+        """
+        with self._metrics_lock:
+            samples = sorted(self._latencies.get(call_site, ()))
+        
+        if len(samples) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        
+        index = min(len(samples) - 1, max(0, math.ceil(percentile / 100 * len(samples)) - 1))
+        return samples[index]
+    
+    def _take_hedge_budget(self, call_site):
+        """
+        중복 요청 예산 확인 (최근 LLM_HEDGE_BUDGET_SECONDS초 동안 LLM_HEDGE_BUDGET개까지, 실행 간 공유)
+        
+        Args:
+            call_site (str): 호출 위치 이름
+        
+        Returns:
+            bool: 예산이 남아 중복 요청을 기록했으면 True
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            conn.execute('BEGIN IMMEDIATE')
+            used = conn.execute(
+                'SELECT COUNT(*) FROM hedges WHERE sent_at > ?', (now - LLM_HEDGE_BUDGET_SECONDS,)
+            ).fetchone()[0]
+            
+            if used >= LLM_HEDGE_BUDGET:
+                conn.rollback()
+                conn.close()
+                return False
+            
+            conn.execute('INSERT INTO hedges (call_site, sent_at) VALUES (?, ?)', (call_site, now))
+            conn.execute('DELETE FROM hedges WHERE sent_at <= ?', (now - LLM_HEDGE_BUDGET_SECONDS,))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.warning(f"LLM 헤징 예산 확인 실패: {e}")
+            return False
+        
+        self._count('hedges')
+        return True
+    
+    def _send(self, options, call_site):
+        """API 요청 한 번 (응답 시간 기록)"""
+        started = time.monotonic()
+        response = openai.chat.completions.create(**options)
+        self._record_latency(call_site, time.monotonic() - started)
+        return response.choices[0].message.content
+    
+    def _send_cancellable(self, options, call_site, cancelled):
+        """
+        API 요청 한 번 (스트리밍으로 받다가 cancelled가 설정되면 HTTP 연결을 닫고 중단)
+        
+        첫 응답 조각이 오기 전에는 연결을 닫을 수 없으므로, 생성이 시작된 요청부터 중단됩니다.
+        
+        Args:
+            options (dict): 요청 옵션
+            call_site (str): 호출 위치 이름
+            cancelled (threading.Event): 중단 요청 표시
+        
+        Returns:
+            str: 응답 메시지 내용 (중단된 경우 None)
+        """
+        started = time.monotonic()
+        stream = openai.chat.completions.create(**options, stream=True)
+        parts = []
+        try:
+            for chunk in stream:
+                if cancelled.is_set():
+                    return None
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        finally:
+            stream.close()
+        
+        self._record_latency(call_site, time.monotonic() - started)
+        return ''.join(parts)
+    
+    def _request(self, options, call_site, limiter=None, hedge=False):
+        """
+        API 요청 (헤징 사용 시 백분위 응답 시간을 넘기면 중복 요청 후 먼저 온 응답 사용)
+        
+        Args:
+            options (dict): 요청 옵션
+            call_site (str): 호출 위치 이름
+            limiter (threading.Semaphore): 동시 요청 제한
+            hedge (bool): 헤징 사용 여부
+        
+        Returns:
+            str: 응답 메시지 내용
+        """
+        self._count('requests')
+        threshold = self.latency_percentile(call_site) if hedge else None
+        
+        if threshold is None:
+            if limiter:
+                with limiter:
+                    return self._send(options, call_site)
+            return self._send(options, call_site)
+        
+        # 제한은 요청이 실제로 끝날 때 해제 (먼저 온 응답을 반환한 뒤에도 유지)
+        # 응답을 스트리밍으로 받아, 먼저 온 응답을 사용한 뒤 남은 요청은 HTTP 연결을 닫아 중단
+        if limiter:
+            limiter.acquire()
+        cancelled = threading.Event()
+        primary = self._executor.submit(self._send_cancellable, options, call_site, cancelled)
+        if limiter:
+            primary.add_done_callback(lambda _: limiter.release())
+        
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+        
+        # 동시 요청 제한에 여유가 없거나 예산을 넘으면 원래 요청을 기다림
+        if limiter and not limiter.acquire(blocking=False):
+            self._count('hedges_skipped')
+            return primary.result()
+        
+        if not self._take_hedge_budget(call_site):
+            if limiter:
+                limiter.release()
+            self._count('hedges_skipped')
+            return primary.result()
+        
+        logger.info(f"LLM 헤징 요청: {call_site} (p{LLM_HEDGE_PERCENTILE} {threshold:.1f}초 초과)")
+        backup = self._executor.submit(self._send_cancellable, options, call_site, cancelled)
+        if limiter:
+            backup.add_done_callback(lambda _: limiter.release())
+        
+        pending = {primary, backup}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # 남은 요청은 아직 시작 전이면 취소하고, 진행 중이면 연결을 닫도록 표시
+                    for other in pending:
+                        other.cancel()
+                    cancelled.set()
+                    if future is backup:
+                        self._count('hedge_wins')
+                    return future.result()
+                error = future.exception()
+        
+        raise error
+    
+    def chat(self, messages, model="gpt-4o", temperature=0.7, response_format=None,
+             prompt_version=LLM_PROMPT_VERSION, use_cache=True, limiter=None, call_site=None):
+        """
+        Chat API 호출 (캐시 적중 시 API를 호출하지 않음)
+        
+        Args:
+            messages (list): 메시지 목록
+            model (str): 모델 이름
+            temperature (float): 샘플링 온도
+            response_format (dict): 응답 형식 (예: {"type": "json_object"})
+            prompt_version (str): 프롬프트 버전 (캐시 키에 포함)
+            use_cache (bool): 캐시 사용 여부 (다양한 결과가 필요한 샘플링 호출은 False)
+            limiter (threading.Semaphore): 실제 API 요청 시에만 적용할 동시 요청 제한
+            call_site (str): 호출 위치 이름 (응답 시간 집계 및 헤징 적용 대상 판단)
+        
+        Returns:
+            str: 응답 메시지 내용
+        """
+        key, cached = self._lookup(use_cache, model, messages, temperature, response_format, prompt_version)
+        if cached is not None:
+            return cached
+        
+        options = {'model': model, 'messages': messages, 'temperature': temperature}
+        if response_format:
+            options['response_format'] = response_format
+        
+        call_site = call_site or model
+        hedge = LLM_HEDGING_ENABLED and call_site in LLM_HEDGE_CALL_SITES
+        content = self._request(options, call_site, limiter, hedge)
+        
+        self._store(key, model, content)
+        return content
+    
+    def submit(self, **kwargs):
+        """
+        Chat API 호출을 백그라운드에서 시작 (호출자가 제한 시간을 두고 기다릴 수 있음)
+        
+        Args:
+            **kwargs: chat()과 같은 인자
+        
+        Returns:
+            concurrent.futures.Future: 응답 메시지 내용을 반환하는 작업
+        """
+        return self._executor.submit(self.chat, **kwargs)
+    
+    def chat_stream(self, messages, on_field, model="gpt-4o", temperature=0.7, response_format=None,
+                    prompt_version=LLM_PROMPT_VERSION, use_cache=True, limiter=None, call_site=None):
+        """
+        JSON 응답을 스트리밍으로 받으며 최상위 필드가 완성될 때마다 콜백 호출
+        
+        캐시 적중 시에는 저장된 응답의 필드를 순서대로 바로 전달합니다. 스트리밍 호출에는 헤징을 적용하지 않습니다.
+        
+        Args:
+            messages (list): 메시지 목록
+            on_field (callable): 필드가 완성될 때 호출할 함수 (필드 이름, 값)
+            model (str): 모델 이름
+            temperature (float): 샘플링 온도
+            response_format (dict): 응답 형식 (JSON 응답이어야 함)
+            prompt_version (str): 프롬프트 버전 (캐시 키에 포함)
+            use_cache (bool): 캐시 사용 여부
+            limiter (threading.Semaphore): 실제 API 요청 시에만 적용할 동시 요청 제한
+            call_site (str): 호출 위치 이름 (응답 시간 집계)
+        
+        Returns:
+            str: 전체 응답 메시지 내용
+        """
+        parser = JSONFieldParser()
+        
+        def emit(text):
+            for name, value in parser.feed(text):
+                try:
+                    on_field(name, value)
+                except Exception as e:
+                    logger.warning(f"스트리밍 필드 처리 실패: {name}, 오류: {e}")
+        
+        key, cached = self._lookup(use_cache, model, messages, temperature, response_format, prompt_version)
+        if cached is not None:
+            emit(cached)
+            return cached
+        
+        options = {'model': model, 'messages': messages, 'temperature': temperature, 'stream': True}
+        if response_format:
+            options['response_format'] = response_format
+        
+        call_site = call_site or model
+        self._count('requests')
+        
+        def consume():
+            started = time.monotonic()
+            parts = []
+            for chunk in openai.chat.completions.create(**options):
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    emit(delta)
+            self._record_latency(call_site, time.monotonic() - started)
+            return ''.join(parts)
+        
+        if limiter:
+            with limiter:
+                content = consume()
+        else:
+            content = consume()
+        
+        self._store(key, model, content)
+        return content
+    
+    def _lookup(self, use_cache, model, messages, temperature, response_format, prompt_version):
+        """
+        캐시 조회 및 지표 집계
+        
+        Returns:
+            tuple: (캐시 키, 캐시된 응답) - 캐시를 사용하지 않으면 키가 None, 미적중이면 응답이 None
+        """
+        if not use_cache:
+            self._count('bypassed')
+            return None, None
+        
+        key = self.cache_key(model, messages, temperature, response_format, prompt_version)
+        cached = self._get(key)
+        
+        if cached is not None:
+            self._count('hits')
+            logger.debug(f"LLM 캐시 적중: {key[:12]}")
+        else:
+            self._count('misses')
+        
+        return key, cached
+    
+    def _store(self, key, model, content):
+        """응답 캐시 저장 (캐시를 사용하지 않는 호출이면 무시)"""
+        if key is None or content is None:
+            return
+        
+        self._put(key, model, content)
+        
+        # 저장 일부 시점에서만 정리 (매 호출마다 전체 스캔하지 않음)
+        if self._metrics['stores'] % 100 == 1:
+            self.evict()
+    
+    def metrics(self):
+        """
+        캐시 지표 조회
+        
+        Returns:
+            dict: 적중/미적중/우회/저장/삭제 수, 적중률, 저장된 항목 수, API 요청/헤징 수
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        
+        lookups = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = round(metrics['hits'] / lookups, 4) if lookups else 0.0
+        
+        try:
+            conn = self._connect()
+            metrics['entries'] = conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            conn.close()
+        except Exception:
+            metrics['entries'] = None
+        
+        return metrics
+
+
+# 프로세스 공용 클라이언트 인스턴스
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_llm_client():
+    """
+    공용 LLM 클라이언트 인스턴스 조회
+    
+    Returns:
+        LLMClient: 클라이언트 인스턴스
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = LLMClient()
+        return _shared_client
@@ -0,0 +1,315 @@
+"""
+미디어 캐시 모듈
+- 자막 처리(음성 인식)와 영상 제작 단계가 같은 원본 영상을 한 번만 다운로드하도록 공유 캐시를 제공합니다.
+- 캐시 항목은 (영상 ID, 다운로드 포맷)의 해시로 식별하며, 용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+- 음성 인식용 오디오는 캐시된 원본에서 16kHz 모노로 로컬 추출합니다.
+- 영상 제작에 필요한 구간만 내려받는 구간 다운로드를 지원합니다 (전체 원본이 캐시에 있으면 그대로 사용).
+"""
+import os
+import time
+import hashlib
+import logging
+import threading
+import subprocess
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    LOGS_DIR, MEDIA_CACHE_DIR, MEDIA_CACHE_MAX_BYTES, SOURCE_DOWNLOAD_MODE, SECTION_PREROLL_SECONDS
+)
+from src.ffmpeg_utils import probe_section_start
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'media_cache.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('media_cache')
+
+# 원본 영상 다운로드 포맷 (쇼츠 제작에 필요한 최대 720p)
+SOURCE_FORMAT = 'bestvideo[height<=720]+bestaudio/best[height<=720]'
+
+
+class MediaCache:
+    """원본 미디어 공유 캐시 클래스"""
+    
+    def __init__(self, cache_dir=MEDIA_CACHE_DIR, max_bytes=MEDIA_CACHE_MAX_BYTES):
+        """
+        초기화 함수
+        
+        Args:
+            cache_dir (str): 캐시 디렉토리
+            max_bytes (int): 캐시 최대 용량 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._yt_dlp_checked = False
+    
+    def _ensure_yt_dlp(self):
+        """yt-dlp 설치 확인 및 설치"""
+        if self._yt_dlp_checked:
+            return
+        
+        try:
+            subprocess.run(['yt-dlp', '--version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.info("yt-dlp 설치 중...")
+            subprocess.run(['pip', 'install', 'yt-dlp'], check=True)
+        
+        self._yt_dlp_checked = True
+    
+    def _lock_for(self, key):
+        """캐시 키별 잠금 (같은 영상의 동시 다운로드 방지)"""
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def cache_key(self, video_id, format_spec=SOURCE_FORMAT):
+        """
+        캐시 키 생성
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            format_spec (str): yt-dlp 포맷 지정자
+        
+        Returns:
+            str: 캐시 키
+        """
+        digest = hashlib.sha1(f"{video_id}|{format_spec}".encode('utf-8')).hexdigest()[:16]
+        return f"{video_id}_{digest}"
+    
+    def _download(self, video_id, format_spec, path, extra_args=None):
+        """
+        yt-dlp로 다운로드 (임시 이름으로 받은 뒤 원자적으로 이동)
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            format_spec (str): yt-dlp 포맷 지정자
+            path (str): 저장할 파일 경로
+            extra_args (list): 추가 yt-dlp 인자
+        
+        Returns:
+            bool: 다운로드 성공 여부
+        """
+        self._ensure_yt_dlp()
+        
+        partial_path = f"{path[:-len('.mp4')]}.download.mp4"
+        command = [
+            'yt-dlp',
+            '-f', format_spec,
+            '--merge-output-format', 'mp4',
+            *(extra_args or []),
+            '-o', partial_path,
+            f"https://www.youtube.com/watch?v={video_id}"
+        ]
+        
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"원본 영상 다운로드 실패: {video_id}, 오류: {e}")
+            return False
+        
+        if not os.path.exists(partial_path):
+            logger.error(f"원본 영상 다운로드 실패: {video_id}")
+            return False
+        
+        os.replace(partial_path, path)
+        return True
+    
+    def get_source(self, video_id, format_spec=SOURCE_FORMAT):
+        """
+        원본 영상 경로 조회 (캐시에 없으면 한 번만 다운로드)
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            format_spec (str): yt-dlp 포맷 지정자
+        
+        Returns:
+            str: 캐시된 원본 영상 경로 (실패 시 None)
+        """
+        key = self.cache_key(video_id, format_spec)
+        path = os.path.join(self.cache_dir, f"{key}.mp4")
+        
+        with self._lock_for(key):
+            if os.path.exists(path):
+                os.utime(path)
+                logger.info(f"미디어 캐시 적중: {video_id}")
+                return path
+            
+            if not self._download(video_id, format_spec, path):
+                return None
+            logger.info(f"원본 영상 다운로드 및 캐시 저장: {video_id} ({os.path.getsize(path) / 1024 ** 2:.1f}MB)")
+        
+        self.evict(keep=path)
+        return path
+    
+    def get_clip(self, video_id, start_time, duration, format_spec=SOURCE_FORMAT,
+                 mode=SOURCE_DOWNLOAD_MODE, preroll=SECTION_PREROLL_SECONDS):
+        """
+        영상 제작에 필요한 구간이 포함된 영상 조회
+        - 전체 원본이 이미 캐시에 있거나 mode가 'full'이면 전체 원본을 사용합니다.
+        - 그 밖에는 시작 지점보다 preroll초 앞부터 필요한 구간만 내려받습니다.
+          구간은 재인코딩 없이 스트림 복사로 받으므로 파일 앞에 구간 시작 이전 키프레임부터의 영상이 붙을 수 있어,
+          ffprobe로 파일 안에서 구간 시작 지점의 실제 위치를 측정해 반환 위치에 반영합니다.
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            start_time (float): 필요한 구간 시작 시간 (원본 기준, 초)
+            duration (float): 필요한 구간 길이 (초)
+            format_spec (str): yt-dlp 포맷 지정자
+            mode (str): 'section' 또는 'full'
+            preroll (float): 시작 지점 앞에 더 받을 시간 (초)
+        
+        Returns:
+            tuple: (영상 경로, 반환된 영상 안에서 구간이 시작하는 위치(초)), 실패 시 (None, 0)
+        """
+        full_path = os.path.join(self.cache_dir, f"{self.cache_key(video_id, format_spec)}.mp4")
+        
+        if mode != 'section' or os.path.exists(full_path):
+            return self.get_source(video_id, format_spec), start_time
+        
+        section_start = max(0, int(start_time - preroll))
+        section_end = int(start_time + duration + 1)
+        key = self.cache_key(video_id, f"{format_spec}|{section_start}-{section_end}")
+        path = os.path.join(self.cache_dir, f"{key}.mp4")
+        
+        with self._lock_for(key):
+            if os.path.exists(path):
+                os.utime(path)
+                logger.info(f"미디어 캐시 적중 (구간 {section_start}-{section_end}초): {video_id}")
+            else:
+                started = time.time()
+                if not self._download(video_id, format_spec, path, ['--download-sections', f"*{section_start}-{section_end}"]):
+                    return None, 0
+                logger.info(
+                    f"구간 다운로드 및 캐시 저장: {video_id} ({section_start}-{section_end}초, "
+                    f"{os.path.getsize(path) / 1024 ** 2:.1f}MB, {time.time() - started:.1f}초)"
+                )
+        
+        self.evict(keep=path)
+        
+        # 스트림 복사로 받은 파일은 section_start 이전 키프레임부터 시작할 수 있으므로 실제 위치를 측정
+        lead = probe_section_start(path) or 0.0
+        if lead:
+            logger.info(f"구간 시작 앞 키프레임 여유: {video_id} {lead:.2f}초")
+        
+        return path, start_time - section_start + lead
+    
+    def extract_asr_audio(self, video_id, output_path):
+        """
+        캐시된 원본에서 음성 인식용 오디오 추출 (16kHz 모노 Opus)
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            output_path (str): 저장할 오디오 파일 경로 (.ogg)
+        
+        Returns:
+            str: 추출된 오디오 파일 경로 (실패 시 None)
+        """
+        source_path = self.get_source(video_id)
+        
+        if not source_path:
+            return None
+        
+        command = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-i', source_path,
+            '-vn',
+            '-ac', '1',
+            '-ar', '16000',
+            '-c:a', 'libopus',
+            '-b:a', '24k',
+            output_path
+        ]
+        
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"음성 인식용 오디오 추출 실패: {video_id}, 오류: {e}")
+            return None
+        
+        return output_path if os.path.exists(output_path) else None
+    
+    def _entries(self):
+        """캐시 항목 목록 (경로, 크기, 최근 사용 시각)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.download.mp4'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # 다른 프로세스가 목록 조회 후 삭제한 항목
+                continue
+            if os.path.isfile(path):
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def evict(self, keep=None):
+        """
+        용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+        
+        Args:
+            keep (str): 삭제하지 않을 경로 (방금 사용한 항목)
+        
+        Returns:
+            int: 삭제한 바이트 수
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                freed += size
+                logger.info(f"미디어 캐시 삭제: {os.path.basename(path)}")
+            except OSError as e:
+                logger.warning(f"미디어 캐시 삭제 실패: {path}, 오류: {e}")
+        
+        return freed
+    
+    def stats(self):
+        """
+        캐시 사용 현황
+        
+        Returns:
+            dict: 항목 수, 사용 용량, 최대 용량
+        """
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes
+        }
+
+
+# 프로세스 공용 캐시 인스턴스
+_shared_cache = None
+
+
+def get_media_cache():
+    """
+    공용 미디어 캐시 인스턴스 조회
+    
+    Returns:
+        MediaCache: 캐시 인스턴스
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = MediaCache()
+    return _shared_cache
@@ -0,0 +1,157 @@
+"""
+제목/태그 대체 생성 모듈
+- LLM 응답이 제한 시간 안에 오지 않을 때 사용할 제목과 태그를 로컬에서 만듭니다.
+- 스크립트에서 핵심어를 추출하고, 과거 업로드 기록에서 모은 태그 어휘와 제목 템플릿을 사용합니다.
+"""
+import os
+import json
+import glob
+from collections import Counter
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    DATA_DIR, TITLE_MAX_CHARS
+)
+from src.text_utils import tokenize, HANGUL_PATTERN
+from src.candidate_scorer import score_title, rank_candidates
+
+# 핵심어 추출 시 떼어낼 한국어 조사/어미 (긴 것부터 확인)
+KOREAN_SUFFIXES = (
+    '에서는', '으로는', '에게서', '했습니다', '합니다', '입니다', '됩니다', '에서', '으로', '에게', '까지', '부터',
+    '처럼', '보다', '하고', '이며', '이다', '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만'
+)
+
+# 핵심어에서 제외할 일반 단어
+KEYWORD_STOPWORDS = {
+    '오늘', '지금', '이번', '대한', '관련', '위한', '통해', '가장', '매우', '것으로', '있습니다', '없습니다',
+    '말했습니다', '밝혔습니다', '전했습니다', '예상', '이상', '소식', '뉴스'
+}
+
+# 제목 템플릿 ({k1}, {k2}: 핵심어)
+TITLE_TEMPLATES = [
+    "🚨 {k1} {k2} 속보",
+    "📰 {k1}, 지금 무슨 일이?",
+    "⚡ {k1} {k2} 핵심 정리",
+    "🌍 {k1} 이슈 한눈에 👀"
+]
+
+# 과거 태그가 없을 때 사용할 기본 태그
+DEFAULT_TAGS = ["글로벌뉴스", "해외소식", "뉴스요약"]
+
+# 최대 태그 수
+MAX_TAGS = 7
+
+
+def _strip_suffix(token):
+    """한글 단어에서 조사/어미 제거"""
+    if not HANGUL_PATTERN.match(token):
+        return token
+    for suffix in KOREAN_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            return token[:-len(suffix)]
+    return token
+
+
+def extract_keywords(script, limit=5):
+    """
+    스크립트 핵심어 추출 (Hook/요약에 자주 나오는 단어, 앞쪽에 나올수록 우선)
+    
+    Args:
+        script (dict): 스크립트
+        limit (int): 최대 핵심어 수
+    
+    Returns:
+        list: 핵심어 목록
+    """
+    text = ' '.join([script.get('hook', ''), script.get('summary', ''), script.get('title', '')])
+    counts = Counter()
+    first_seen = {}
+    
+    for position, token in enumerate(tokenize(text)):
+        keyword = _strip_suffix(token)
+        if len(keyword) < 2 or keyword in KEYWORD_STOPWORDS or keyword.isdigit():
+            continue
+        counts[keyword] += 1
+        first_seen.setdefault(keyword, position)
+    
+    ranked = sorted(counts, key=lambda keyword: (-counts[keyword], first_seen[keyword]))
+    return ranked[:limit]
+
+
+def load_tag_vocabulary(data_dir=DATA_DIR):
+    """
+    과거 업로드 기록과 최종 스크립트에서 태그 사용 빈도 집계
+    
+    Args:
+        data_dir (str): 데이터 디렉토리
+    
+    Returns:
+        collections.Counter: 태그별 사용 횟수
+    """
+    vocabulary = Counter()
+    paths = glob.glob(os.path.join(data_dir, 'analytics', 'upload_*.json'))
+    paths += glob.glob(os.path.join(data_dir, 'scripts', '*.json'))
+    
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            continue
+        
+        if not isinstance(data, dict):
+            continue
+        tags = data.get('tags') if 'upload_' in os.path.basename(path) else data.get('youtube_tags')
+        for tag in tags or []:
+            if isinstance(tag, str) and tag.strip('# '):
+                vocabulary[tag.strip('# ')] += 1
+    
+    return vocabulary
+
+
+def build_title_and_tags(script, history=None, vocabulary=None):
+    """
+    핵심어, 과거 태그 어휘, 제목 템플릿으로 제목과 태그 생성
+    
+    Args:
+        script (dict): 스크립트
+        history (dict): 과거 성과 (candidate_scorer.load_performance_history 결과)
+        vocabulary (Counter): 태그 사용 횟수 (없으면 과거 업로드 기록에서 집계)
+    
+    Returns:
+        dict: 제목 및 태그
+    """
+    history = history or {'hooks': [], 'titles': [], 'style_scores': {}}
+    vocabulary = load_tag_vocabulary() if vocabulary is None else vocabulary
+    keywords = extract_keywords(script)
+    
+    # 제목: 템플릿 후보 중 길이/형식/과거 성과 유사도 점수가 가장 높은 것
+    title = script.get('title', '')
+    if keywords:
+        k1 = keywords[0]
+        k2 = keywords[1] if len(keywords) > 1 else ''
+        candidates = []
+        for template in TITLE_TEMPLATES:
+            candidate = ' '.join(template.format(k1=k1, k2=k2).split())
+            if len(candidate) <= TITLE_MAX_CHARS:
+                candidates.append(score_title(candidate, history))
+        if candidates:
+            title = rank_candidates(candidates)[0]['text']
+    
+    # 태그: 핵심어와 겹치는 과거 태그 -> 핵심어 -> 자주 쓴 과거 태그 순
+    tags = []
+    related = [
+        tag for tag, _ in vocabulary.most_common()
+        if any(keyword in tag or tag in keyword for keyword in keywords)
+    ]
+    frequent = [tag for tag, _ in vocabulary.most_common()] or DEFAULT_TAGS
+    
+    for tag in related + [keyword.replace(' ', '') for keyword in keywords[:3]] + frequent:
+        if tag not in tags:
+            tags.append(tag)
+        if len(tags) >= MAX_TAGS:
+            break
+    
+    return {'title': title, 'tags': tags}
@@ -0,0 +1,259 @@
+"""
+렌더링 풀 모듈
+- 여러 쇼츠 영상 제작 작업을 받아 머신 크기에 맞춘 프로세스 풀에서 동시에 렌더링합니다.
+- 작업마다 FFmpeg 스레드 수를 명시적으로 할당하여 코어를 과도하게 나눠 쓰거나 놀리지 않도록 합니다.
+- 대기 중인 작업은 우선순위 순으로 실행하고, 작업별 진행 단계와 진행률을 보고합니다.
+"""
+import os
+import time
+import heapq
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    LOGS_DIR, ENCODING_PROFILE, RENDER_WORKERS
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'render_pool.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('render_pool')
+
+# 렌더링 진행률 로그 간격 (%)
+PROGRESS_LOG_STEP = 25
+
+# 워커 프로세스별 영상 제작 인스턴스와 진행 상황 보고 큐
+_worker_producer = None
+_worker_progress = None
+
+
+def _init_render_worker(progress_queue):
+    """프로세스 풀 워커 초기화 (영상 제작 인스턴스 생성)"""
+    global _worker_producer, _worker_progress
+    from src.video_producer import VideoProducer
+    _worker_producer = VideoProducer()
+    _worker_progress = progress_queue
+
+
+def _render_job(job_id, script, video_id, hook_audio_path, profile, threads):
+    """프로세스 풀 워커에서 영상 하나를 제작"""
+    def on_progress(stage, percent):
+        _worker_progress.put((job_id, stage, percent))
+    
+    return _worker_producer.create_shorts_video(
+        script, video_id, hook_audio_path=hook_audio_path, profile=profile,
+        threads=threads, on_progress=on_progress
+    )
+
+
+class RenderPool:
+    """쇼츠 영상 렌더링 풀 클래스"""
+    
+    def __init__(self, workers=RENDER_WORKERS, threads_per_job=None, on_progress=None):
+        """
+        초기화 함수
+        
+        Args:
+            workers (int): 동시 렌더링 프로세스 수
+            threads_per_job (int): 작업별 FFmpeg 스레드 수 (없으면 CPU 수를 프로세스 수로 나눈 값)
+            on_progress (callable): (작업 ID, 작업 상태 사전)을 받을 함수 (진행 상황이 바뀔 때마다 호출)
+        """
+        self.workers = max(1, workers)
+        self.threads_per_job = threads_per_job or max(1, (os.cpu_count() or 1) // self.workers)
+        self.on_progress = on_progress
+        
+        self.jobs = {}
+        self._queue = []
+        self._sequence = 0
+        self._running = 0
+        self._lock = threading.RLock()
+        self._done = threading.Condition(self._lock)
+        
+        self._progress_queue = multiprocessing.Queue()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_render_worker,
+            initargs=(self._progress_queue,)
+        )
+        self._listener = threading.Thread(target=self._listen_progress, daemon=True)
+        self._listener.start()
+        
+        logger.info(f"RenderPool 초기화 완료 (프로세스 {self.workers}개, 작업별 스레드 {self.threads_per_job}개)")
+    
+    def submit(self, script, video_id, priority=0, hook_audio_path=None, profile=ENCODING_PROFILE):
+        """
+        렌더링 작업 추가
+        
+        Args:
+            script (dict): 스크립트
+            video_id (str): YouTube 영상 ID
+            priority (int): 우선순위 (클수록 먼저 실행, 같으면 먼저 추가한 작업부터)
+            hook_audio_path (str): 미리 생성한 Hook 오디오 경로
+            profile (str): 인코딩 프로필 이름
+        
+        Returns:
+            str: 작업 ID
+        """
+        with self._lock:
+            self._sequence += 1
+            job_id = f"{video_id}-{self._sequence}"
+            self.jobs[job_id] = {
+                'video_id': video_id,
+                'priority': priority,
+                'state': 'queued',
+                'stage': None,
+                'progress': 0,
+                'output_path': None,
+                'error': None,
+                'submitted_at': time.time(),
+                'started_at': None,
+                'finished_at': None
+            }
+            heapq.heappush(self._queue, (-priority, self._sequence, job_id, (script, video_id, hook_audio_path, profile)))
+            self._dispatch()
+        
+        logger.info(f"렌더링 작업 추가: {job_id} (우선순위 {priority}, 대기 {len(self._queue)}개)")
+        return job_id
+    
+    def _dispatch(self):
+        """여유 프로세스가 있으면 우선순위가 가장 높은 대기 작업 실행 (잠금 안에서 호출)"""
+        while self._queue and self._running < self.workers:
+            _, _, job_id, (script, video_id, hook_audio_path, profile) = heapq.heappop(self._queue)
+            job = self.jobs[job_id]
+            job['state'] = 'running'
+            job['started_at'] = time.time()
+            self._running += 1
+            
+            try:
+                future = self._pool.submit(
+                    _render_job, job_id, script, video_id, hook_audio_path, profile, self.threads_per_job
+                )
+            except Exception as e:
+                # 풀이 깨진 경우(BrokenProcessPool 등) 작업을 실패 처리해야 wait()가 끝남
+                job['state'] = 'failed'
+                job['error'] = str(e)
+                job['finished_at'] = time.time()
+                self._running -= 1
+                self._done.notify_all()
+                logger.error(f"렌더링 작업 실행 실패: {job_id} {e}")
+                continue
+            
+            future.add_done_callback(lambda done, job_id=job_id: self._finish(job_id, done))
+    
+    def _finish(self, job_id, future):
+        """작업 완료 처리 후 다음 작업 실행"""
+        with self._lock:
+            job = self.jobs[job_id]
+            job['finished_at'] = time.time()
+            self._running -= 1
+            
+            try:
+                job['output_path'] = future.result()
+                job['state'] = 'done' if job['output_path'] else 'failed'
+                if job['output_path']:
+                    job['progress'] = 100
+            except Exception as e:
+                job['state'] = 'failed'
+                job['error'] = str(e)
+            
+            elapsed = job['finished_at'] - job['started_at']
+            self._dispatch()
+            self._done.notify_all()
+            snapshot = dict(job)
+        
+        if snapshot['state'] == 'done':
+            logger.info(f"렌더링 작업 완료: {job_id} ({elapsed:.1f}초) -> {snapshot['output_path']}")
+        else:
+            logger.error(f"렌더링 작업 실패: {job_id} {snapshot['error'] or ''}")
+        
+        if self.on_progress:
+            self.on_progress(job_id, snapshot)
+    
+    def _listen_progress(self):
+        """워커 프로세스의 진행 상황 수신"""
+        while True:
+            message = self._progress_queue.get()
+            if message is None:
+                break
+            
+            job_id, stage, percent = message
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if not job or job['state'] != 'running':
+                    continue
+                previous_stage, previous_percent = job['stage'], job['progress']
+                job['stage'], job['progress'] = stage, percent
+                snapshot = dict(job)
+            
+            if stage != previous_stage or percent // PROGRESS_LOG_STEP > previous_percent // PROGRESS_LOG_STEP:
+                logger.info(f"렌더링 진행: {job_id} {stage} {percent}%")
+            
+            if self.on_progress:
+                self.on_progress(job_id, snapshot)
+    
+    def status(self, job_id=None):
+        """
+        작업 상태 조회
+        
+        Args:
+            job_id (str): 작업 ID (없으면 전체)
+        
+        Returns:
+            dict: 작업 상태 (state: queued, running, done, failed / stage, progress, output_path 등)
+        """
+        with self._lock:
+            if job_id is not None:
+                return dict(self.jobs[job_id])
+            return {key: dict(job) for key, job in self.jobs.items()}
+    
+    def wait(self, job_ids=None, timeout=None):
+        """
+        작업 완료 대기
+        
+        Args:
+            job_ids (list): 기다릴 작업 ID 목록 (없으면 전체)
+            timeout (float): 최대 대기 시간 (초)
+        
+        Returns:
+            dict: 작업 ID별 출력 영상 경로 (실패 또는 미완료 작업은 None)
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        
+        with self._lock:
+            job_ids = list(job_ids or self.jobs)
+            while any(self.jobs[job_id]['state'] in ('queued', 'running') for job_id in job_ids):
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    break
+                self._done.wait(remaining)
+            
+            return {job_id: self.jobs[job_id]['output_path'] for job_id in job_ids}
+    
+    def shutdown(self, wait=True):
+        """
+        렌더링 풀 종료
+        
+        Args:
+            wait (bool): 실행 중인 작업이 끝날 때까지 대기 여부
+        """
+        with self._lock:
+            for _, _, job_id, _ in self._queue:
+                self.jobs[job_id]['state'] = 'failed'
+                self.jobs[job_id]['error'] = '렌더링 풀 종료로 취소됨'
+            self._queue = []
+        
+        self._pool.shutdown(wait=wait)
+        self._progress_queue.put(None)
+        self._listener.join(timeout=5)
+        logger.info("RenderPool 종료")
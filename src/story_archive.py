@@ -0,0 +1,307 @@
+"""
+기사 아카이브 모듈
+- data/transcripts와 data/scripts의 과거 자막/요약/스크립트를 SQLite FTS5 전문 검색 색인으로 관리합니다.
+- 파일의 수정 시각/크기가 바뀐 항목만 다시 색인하여 점진적으로 갱신합니다.
+- 반복 보도되는 기사(금리 결정, 진행 중인 분쟁 등)의 최근 배경 설명을 찾아 재사용할 수 있도록 합니다.
+- 기사 비교에는 어미/조사를 뺀 특징과 아카이브 문서 빈도 기반 IDF 가중치를 사용합니다.
+"""
+import os
+import json
+import math
+import time
+import glob
+import logging
+import sqlite3
+import threading
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    DATA_DIR, LOGS_DIR, STORY_ARCHIVE_DB, STORY_ARCHIVE_MAX_AGE_DAYS
+)
+from src.text_utils import content_features
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'story_archive.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('story_archive')
+
+# 검색어로 사용할 최대 특징 수
+MAX_QUERY_TERMS = 64
+
+
+class StoryArchive:
+    """기사 아카이브 클래스"""
+    
+    def __init__(self, db_path=STORY_ARCHIVE_DB, source_dirs=None):
+        """
+        초기화 함수
+        
+        Args:
+            db_path (str): 색인 데이터베이스 파일 경로
+            source_dirs (list): 색인할 디렉토리 목록 (없으면 data/transcripts, data/scripts)
+        """
+        self.db_path = db_path
+        self.source_dirs = source_dirs or [
+            os.path.join(DATA_DIR, 'transcripts'),
+            os.path.join(DATA_DIR, 'scripts')
+        ]
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._init_database()
+    
+    def _connect(self):
+        """데이터베이스 연결"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+    
+    def _init_database(self):
+        """색인 테이블 초기화"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            
+            # 색인한 파일 목록 (점진적 갱신용)
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                mtime REAL,
+                size INTEGER
+            )
+            ''')
+            
+            # 전문 검색 색인 (terms 열만 검색 대상)
+            cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS stories USING fts5(
+                path UNINDEXED,
+                video_id UNINDEXED,
+                kind UNINDEXED,
+                created_at UNINDEXED,
+                title UNINDEXED,
+                summary UNINDEXED,
+                background UNINDEXED,
+                terms
+            )
+            ''')
+            
+            # 특징별 문서 빈도 조회용 (IDF 가중치)
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS stories_vocab USING fts5vocab(stories, 'row')")
+            
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"기사 아카이브 데이터베이스 초기화 중 오류 발생: {e}")
+    
+    def _parse(self, path):
+        """
+        자막/스크립트 파일에서 색인할 항목 추출
+        
+        Args:
+            path (str): JSON 파일 경로
+        
+        Returns:
+            dict: 색인 항목 (색인할 내용이 없으면 None)
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if not isinstance(data, dict) or not data.get('video_id'):
+            return None
+        
+        # 자막 처리 결과는 요약이 사전, 스크립트는 문자열
+        if isinstance(data.get('summary'), dict):
+            kind = 'transcript'
+            summary = data['summary'].get('summary', '')
+            background = data['summary'].get('background', '')
+            body = data.get('translated_text') or ''
+        else:
+            kind = 'script'
+            summary = data.get('summary') or ''
+            background = data.get('background') or ''
+            body = data.get('hook') or ''
+        
+        if not summary and not body:
+            return None
+        
+        return {
+            'video_id': data['video_id'],
+            'kind': kind,
+            'title': data.get('youtube_title') or data.get('title') or '',
+            'summary': summary,
+            'background': background,
+            'terms': ' '.join(content_features(' '.join([summary, background, body])))
+        }
+    
+    def sync(self):
+        """
+        변경된 파일만 다시 색인 (삭제된 파일은 색인에서 제거)
+        
+        Returns:
+            int: 새로 색인하거나 제거한 파일 수
+        """
+        started = time.time()
+        changed = 0
+        
+        with self._lock:
+            try:
+                conn = self._connect()
+                cursor = conn.cursor()
+                indexed = {
+                    path: (mtime, size)
+                    for path, mtime, size in cursor.execute('SELECT path, mtime, size FROM documents')
+                }
+                
+                seen = set()
+                for source_dir in self.source_dirs:
+                    for path in glob.glob(os.path.join(source_dir, '*.json')):
+                        seen.add(path)
+                        stat = os.stat(path)
+                        if indexed.get(path) == (stat.st_mtime, stat.st_size):
+                            continue
+                        
+                        try:
+                            entry = self._parse(path)
+                        except Exception as e:
+                            logger.warning(f"색인 파일 읽기 실패: {path}, 오류: {e}")
+                            continue
+                        
+                        cursor.execute('DELETE FROM stories WHERE path = ?', (path,))
+                        if entry:
+                            cursor.execute(
+                                'INSERT INTO stories (path, video_id, kind, created_at, title, summary, background, terms) '
+                                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                (path, entry['video_id'], entry['kind'], stat.st_mtime, entry['title'],
+                                 entry['summary'], entry['background'], entry['terms'])
+                            )
+                        cursor.execute(
+                            'INSERT OR REPLACE INTO documents (path, mtime, size) VALUES (?, ?, ?)',
+                            (path, stat.st_mtime, stat.st_size)
+                        )
+                        changed += 1
+                
+                for path in set(indexed) - seen:
+                    cursor.execute('DELETE FROM stories WHERE path = ?', (path,))
+                    cursor.execute('DELETE FROM documents WHERE path = ?', (path,))
+                    changed += 1
+                
+                conn.commit()
+                conn.close()
+            except Exception as e:
+                logger.error(f"기사 아카이브 색인 중 오류 발생: {e}")
+                return 0
+        
+        if changed:
+            logger.info(f"기사 아카이브 색인 갱신: {changed}개 파일 ({time.time() - started:.2f}초)")
+        return changed
+    
+    def search(self, text, limit=10, exclude_video_id=None, max_age_days=STORY_ARCHIVE_MAX_AGE_DAYS):
+        """
+        텍스트와 관련된 과거 기사 검색 (BM25 순위)
+        
+        Args:
+            text (str): 검색할 텍스트 (요약 등)
+            limit (int): 최대 결과 수
+            exclude_video_id (str): 제외할 영상 ID (현재 처리 중인 영상)
+            max_age_days (int): 최대 경과 일수 (None이면 제한 없음)
+        
+        Returns:
+            list: 검색 결과 목록 (video_id, kind, title, summary, background, created_at, rank)
+        """
+        terms = list(dict.fromkeys(content_features(text)))[:MAX_QUERY_TERMS]
+        if not terms:
+            return []
+        
+        query = ' OR '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        min_created_at = time.time() - max_age_days * 86400 if max_age_days else 0
+        
+        try:
+            started = time.perf_counter()
+            conn = self._connect()
+            rows = conn.execute(
+                'SELECT video_id, kind, title, summary, background, created_at, bm25(stories) AS rank '
+                'FROM stories WHERE stories MATCH ? AND created_at >= ? AND video_id != ? '
+                'ORDER BY rank LIMIT ?',
+                (query, min_created_at, exclude_video_id or '', limit)
+            ).fetchall()
+            conn.close()
+            logger.debug(f"기사 아카이브 검색: {len(rows)}건 ({(time.perf_counter() - started) * 1000:.2f}ms)")
+        except Exception as e:
+            logger.error(f"기사 아카이브 검색 중 오류 발생: {e}")
+            return []
+        
+        columns = ('video_id', 'kind', 'title', 'summary', 'background', 'created_at', 'rank')
+        return [dict(zip(columns, row)) for row in rows]
+    
+    def term_weights(self, terms):
+        """
+        특징별 IDF 가중치 (아카이브의 거의 모든 문서에 나오는 특징은 0에 가까움)
+        
+        Args:
+            terms (iterable): 특징 목록
+        
+        Returns:
+            dict: 특징별 가중치 (log((문서 수 + 1) / (문서 빈도 + 1)))
+        """
+        terms = list(set(terms))
+        if not terms:
+            return {}
+        
+        try:
+            conn = self._connect()
+            total = conn.execute('SELECT COUNT(*) FROM stories').fetchone()[0]
+            frequencies = {}
+            for i in range(0, len(terms), 500):
+                chunk = terms[i:i + 500]
+                frequencies.update(conn.execute(
+                    f"SELECT term, doc FROM stories_vocab WHERE term IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall())
+            conn.close()
+        except Exception as e:
+            logger.warning(f"기사 아카이브 문서 빈도 조회 실패: {e}")
+            total, frequencies = 0, {}
+        
+        return {term: math.log((total + 1) / (frequencies.get(term, 0) + 1)) for term in terms}
+    
+    def weighted_overlap(self, features, other):
+        """
+        IDF 가중 특징 겹침
+        
+        Args:
+            features (set): 현재 텍스트의 특징
+            other (set): 비교할 텍스트의 특징
+        
+        Returns:
+            tuple: (겹치는 특징 가중치 합, 현재 특징 가중치 합, 비교 특징 가중치 합)
+        """
+        weights = self.term_weights(features | other)
+        
+        def weight(terms):
+            return sum(weights.get(term, 0) for term in terms)
+        
+        return weight(features & other), weight(features), weight(other)
+
+
+# 프로세스 공용 아카이브 인스턴스
+_shared_archive = None
+
+
+def get_story_archive():
+    """
+    공용 기사 아카이브 인스턴스 조회
+    
+    Returns:
+        StoryArchive: 아카이브 인스턴스
+    """
+    global _shared_archive
+    if _shared_archive is None:
+        _shared_archive = StoryArchive()
+    return _shared_archive
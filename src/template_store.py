@@ -0,0 +1,290 @@
+"""
+템플릿 저장소 모듈
+- 콘텐츠 생성과 피드백 모듈이 함께 사용하는 스크립트 템플릿(data/templates.json)을 관리합니다.
+- 파싱한 템플릿을 캐시하고, 파일의 수정 시각/크기가 바뀐 경우에만 다시 읽습니다.
+- 저장 시 버전을 올리고 임시 파일에 쓴 뒤 원자적으로 교체하며, 기준 버전이 다르면 저장하지 않습니다.
+- 읽은 뒤 수정하여 저장하는 경우 그 사이 다른 변경이 있으면 바뀐 항목만 최신 템플릿에 합쳐 다시 저장합니다.
+"""
+import os
+import json
+import copy
+import fcntl
+import logging
+import threading
+from datetime import datetime
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    DATA_DIR, LOGS_DIR
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'template_store.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('template_store')
+
+# 기본 템플릿
+DEFAULT_TEMPLATES = {
+    'hook': {
+        'question': "{}?",
+        'warning': "주의하세요! {}",
+        'shocking': "충격! {}",
+        'interesting': "놀라운 사실! {}"
+    },
+    'transition': [
+        "자세히 알아보겠습니다.",
+        "지금 바로 알려드립니다.",
+        "함께 살펴보겠습니다.",
+        "이것이 전체 내용입니다."
+    ],
+    'ending': [
+        "이상 글로벌 뉴스 단신이었습니다.",
+        "더 자세한 내용은 링크를 참고하세요.",
+        "구독과 좋아요 부탁드립니다.",
+        "다음 소식에서 다시 만나요."
+    ]
+}
+
+
+# 저장 충돌 시 최신 템플릿에 합쳐 다시 저장하는 최대 횟수
+UPDATE_RETRIES = 3
+
+
+def merge_templates(base, changed, current):
+    """
+    기준 템플릿에서 바뀐 항목만 최신 템플릿에 반영 (3-way 병합)
+    - 사전은 항목별로 재귀 병합하고, 목록과 문자열은 통째로 바꿉니다.
+    
+    Args:
+        base (dict): 수정의 기준이 된 템플릿
+        changed (dict): 수정한 템플릿
+        current (dict): 현재 저장된 템플릿
+    
+    Returns:
+        dict: 병합한 템플릿
+    """
+    merged = copy.deepcopy(current)
+    
+    for key in set(base) | set(changed):
+        if key not in changed:
+            merged.pop(key, None)
+        elif key not in base or changed[key] != base[key]:
+            if isinstance(changed[key], dict) and isinstance(base.get(key), dict) and isinstance(merged.get(key), dict):
+                merged[key] = merge_templates(base[key], changed[key], merged[key])
+            else:
+                merged[key] = copy.deepcopy(changed[key])
+    
+    return merged
+
+
+class TemplateConflictError(Exception):
+    """기준 버전 이후 다른 프로세스가 템플릿을 변경한 경우"""
+    pass
+
+
+class TemplateStore:
+    """스크립트 템플릿 저장소 클래스"""
+    
+    def __init__(self, template_file=None):
+        """
+        초기화 함수
+        
+        Args:
+            template_file (str): 템플릿 파일 경로 (없으면 data/templates.json)
+        """
+        self.template_file = template_file or os.path.join(DATA_DIR, 'templates.json')
+        self._lock = threading.Lock()
+        self._signature = None
+        self._templates = None
+        self._version = 0
+        
+        os.makedirs(os.path.dirname(self.template_file), exist_ok=True)
+        
+        # 템플릿 파일이 없으면 기본 템플릿 저장
+        if not os.path.exists(self.template_file):
+            try:
+                self.save(copy.deepcopy(DEFAULT_TEMPLATES))
+                logger.info("기본 템플릿 파일 생성 완료")
+            except Exception as e:
+                logger.error(f"기본 템플릿 파일 생성 실패: {e}")
+    
+    def _stat_signature(self):
+        """파일 변경 확인용 (수정 시각, 크기)"""
+        try:
+            stat = os.stat(self.template_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _read(self):
+        """
+        템플릿 파일 읽기 (버전 정보가 없는 이전 형식도 지원)
+        
+        Returns:
+            tuple: (템플릿 사전, 버전)
+        """
+        with open(self.template_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if isinstance(data, dict) and 'templates' in data:
+            return data['templates'], data.get('version', 0)
+        return data, 0
+    
+    def _refresh(self):
+        """파일의 수정 시각/크기가 바뀌었으면 다시 읽음"""
+        signature = self._stat_signature()
+        
+        if signature is None:
+            if self._templates is None:
+                logger.warning("템플릿 파일이 없습니다. 기본 템플릿을 사용합니다.")
+                self._templates, self._version = copy.deepcopy(DEFAULT_TEMPLATES), 0
+            return
+        
+        if signature == self._signature and self._templates is not None:
+            return
+        
+        try:
+            templates, version = self._read()
+            self._templates, self._version, self._signature = templates, version, signature
+            logger.info(f"템플릿 파일 로드 성공 (버전 {version})")
+        except Exception as e:
+            logger.error(f"템플릿 파일 로드 실패: {e}")
+            if self._templates is None:
+                self._templates, self._version = copy.deepcopy(DEFAULT_TEMPLATES), 0
+    
+    def get(self):
+        """
+        현재 템플릿 조회 (변경된 경우에만 파일을 다시 읽음)
+        
+        Returns:
+            dict: 템플릿 사전 (복사본이므로 수정해도 저장소에 반영되지 않음)
+        """
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._templates)
+    
+    def snapshot(self):
+        """
+        현재 템플릿과 버전을 함께 조회 (수정 후 update()로 저장할 때 기준으로 사용)
+        
+        Returns:
+            tuple: (템플릿 사전 복사본, 버전)
+        """
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._templates), self._version
+    
+    @property
+    def version(self):
+        """현재 템플릿 버전"""
+        with self._lock:
+            self._refresh()
+            return self._version
+    
+    def save(self, templates, base_version=None):
+        """
+        템플릿 저장 (버전 증가, 원자적 교체)
+        
+        Args:
+            templates (dict): 템플릿 사전
+            base_version (int): 수정의 기준이 된 버전 (지정하면 그 사이 다른 변경이 있을 때 저장하지 않음)
+        
+        Returns:
+            int: 저장된 버전
+        
+        Raises:
+            TemplateConflictError: 기준 버전 이후 템플릿이 변경된 경우
+        """
+        lock_file = f"{self.template_file}.lock"
+        
+        with self._lock, open(lock_file, 'w') as lock:
+            # 프로세스 간 쓰기 직렬화
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                current_version = 0
+                if os.path.exists(self.template_file):
+                    try:
+                        current_version = self._read()[1]
+                    except Exception as e:
+                        logger.warning(f"기존 템플릿 파일 읽기 실패, 덮어씁니다: {e}")
+                
+                if base_version is not None and base_version != current_version:
+                    raise TemplateConflictError(
+                        f"템플릿이 버전 {base_version} 이후 변경되었습니다 (현재 버전 {current_version})"
+                    )
+                
+                version = current_version + 1
+                payload = {
+                    'version': version,
+                    'updated_at': datetime.now().isoformat(),
+                    'templates': templates
+                }
+                
+                temp_file = f"{self.template_file}.{os.getpid()}.tmp"
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, ensure_ascii=False, indent=2)
+                os.replace(temp_file, self.template_file)
+                
+                self._templates, self._version = templates, version
+                self._signature = self._stat_signature()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+        
+        logger.info(f"템플릿 파일 저장 완료 (버전 {version})")
+        return version
+    
+    def update(self, templates, base_templates, base_version, retries=UPDATE_RETRIES):
+        """
+        snapshot()으로 읽어 수정한 템플릿 저장
+        - 그 사이 다른 프로세스가 템플릿을 변경했으면 바뀐 항목만 최신 템플릿에 합쳐 다시 저장합니다.
+        
+        Args:
+            templates (dict): 수정한 템플릿
+            base_templates (dict): 수정의 기준이 된 템플릿 (snapshot() 결과)
+            base_version (int): 기준 템플릿의 버전 (snapshot() 결과)
+            retries (int): 충돌 시 다시 병합하여 저장하는 최대 횟수
+        
+        Returns:
+            int: 저장된 버전
+        
+        Raises:
+            TemplateConflictError: 재시도 후에도 충돌하는 경우
+        """
+        pending = templates
+        
+        for attempt in range(retries + 1):
+            try:
+                return self.save(pending, base_version=base_version)
+            except TemplateConflictError as e:
+                if attempt == retries:
+                    raise
+                current, base_version = self.snapshot()
+                pending = merge_templates(base_templates, templates, current)
+                logger.warning(f"{e}, 변경 항목을 버전 {base_version}에 병합하여 다시 저장합니다.")
+
+
+# 프로세스 공용 저장소 인스턴스
+_shared_store = None
+_shared_store_lock = threading.Lock()
+
+
+def get_template_store():
+    """
+    공용 템플릿 저장소 인스턴스 조회
+    
+    Returns:
+        TemplateStore: 저장소 인스턴스
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = TemplateStore()
+        return _shared_store
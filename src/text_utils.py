@@ -0,0 +1,114 @@
+"""
+텍스트 처리 유틸리티 모듈
+- 자막/스크립트 텍스트의 토큰화 등 여러 모듈이 공유하는 텍스트 처리 함수를 제공합니다.
+"""
+import re
+
+# 토큰 패턴 (숫자, 라틴 문자 단어, 한글 단어)
+TOKEN_PATTERN = re.compile(r"[0-9]+(?:[.,][0-9]+)*%?|[a-z]+(?:'[a-z]+)?|[가-힣]+")
+
+# 영어 불용어
+ENGLISH_STOPWORDS = {
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'of', 'to', 'in', 'on', 'at', 'by', 'for',
+    'with', 'from', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'it', 'its',
+    'this', 'that', 'these', 'those', 'he', 'she', 'they', 'we', 'you', 'i', 'his', 'her',
+    'their', 'our', 'your', 'my', 'me', 'him', 'them', 'us', 'do', 'does', 'did', 'have',
+    'has', 'had', 'not', 'no', 'so', 'just', 'about', 'what', 'which', 'who', 'there',
+    'here', 'will', 'would', 'can', 'could', 'should', 'now', 'then', 'than', 'also',
+    'into', 'out', 'up', 'down', 'over', 'more', 'very', "it's", "that's", 'going'
+}
+
+
+def tokenize(text):
+    """
+    텍스트를 소문자 토큰 목록으로 변환 (불용어 및 한 글자 단어 제외)
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        list: 토큰 목록
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return [
+        token for token in tokens
+        if token not in ENGLISH_STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+# 문장 경계 패턴 (문장 부호 뒤 공백)
+SENTENCE_PATTERN = re.compile(r'(?<=[.!?。？！])\s+')
+
+# 한글 음절 패턴
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+
+
+def term_features(text):
+    """
+    검색/유사도 계산용 특징 추출 (한글 단어는 조사 변화에 강하도록 음절 바이그램 사용)
+    
+    Args:
+        text (str): 텍스트
+    
+    Returns:
+        list: 특징 목록
+    """
+    features = []
+    for token in tokenize(text):
+        if len(token) > 2 and HANGUL_PATTERN.match(token):
+            features.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            features.append(token)
+    return features
+
+
+# 내용과 관계없이 거의 모든 문장에 나오는 한글 어미/조사 음절 바이그램 (기사 비교 시 제외)
+KOREAN_ENDING_BIGRAMS = {
+    '니다', '습니', '합니', '입니', '됩니', '했습', '었습', '았습', '였습', '있습', '없습', '겠습',
+    '됐습', '봅니', '니까', '으며', '하며', '하고', '에서', '으로', '에게', '까지', '부터', '이다',
+    '였다', '했다', '었다', '았다', '한다', '된다', '있다', '없다', '것으', '것이', '것을', '라고',
+    '다고', '이라', '하는', '되는', '있는', '하여', '해서', '지만', '는데', '에는', '에도', '이며'
+}
+
+
+def content_features(text):
+    """
+    기사 비교용 특징 추출 (term_features에서 어미/조사 바이그램 제외)
+    
+    Args:
+        text (str): 텍스트
+    
+    Returns:
+        list: 특징 목록
+    """
+    return [feature for feature in term_features(text) if feature not in KOREAN_ENDING_BIGRAMS]
+
+
+def split_sentences(text):
+    """
+    텍스트를 문장 단위로 분할
+    
+    Args:
+        text (str): 원본 텍스트
+    
+    Returns:
+        list: 문장 목록
+    """
+    return [sentence.strip() for sentence in SENTENCE_PATTERN.split(text) if sentence.strip()]
+
+
+def estimate_tokens(text):
+    """
+    LLM 토큰 수 추정 (한글은 음절당 약 1토큰, 그 외는 4글자당 1토큰)
+    
+    Args:
+        text (str): 텍스트
+    
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    
+    hangul = len(HANGUL_PATTERN.findall(text))
+    return int(hangul + (len(text) - hangul) / 4) + 1
@@ -1,23 +1,43 @@
 """
 자막 추출 및 번역 모듈
 - YouTube 영상에서 자막을 추출합니다.
-- 자막이 없는 경우 Whisper API를 사용하여 음성을 텍스트로 변환합니다.
-- 추출된 텍스트를 한국어로 번역하고 요약합니다.
+- 자막이 없는 경우 ASR 백엔드(Whisper API 또는 로컬 CPU 모델)를 사용하여 음성을 텍스트로 변환합니다.
+- 자막 언어를 감지하여 한국어 구간은 번역을 건너뛰고, 필요한 구간만 한국어로 번역한 뒤 요약합니다.
+- 타임스탬프 자막 구간에서 요약 내용과 관련된 클립 구간을 찾습니다.
 """
 import os
 import json
+import math
+import bisect
+import time
 import logging
 import tempfile
-import subprocess
+import difflib
+import threading
+from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
-import openai
 import requests
 
 # 설정 파일 임포트
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
-    OPENAI_API_KEY, DATA_DIR, LOGS_DIR, TEMP_DIR
+    DATA_DIR, LOGS_DIR, TEMP_DIR, ASR_BACKEND, SHORTS_DURATION,
+    SUMMARY_TOKEN_BUDGET, TRANSLATION_UNIT_SECONDS, RETRANSLATE_SUMMARY_THRESHOLD,
+    BATCH_MAX_WORKERS, CAPTION_CONCURRENCY, MEDIA_DOWNLOAD_CONCURRENCY, ASR_CONCURRENCY, LLM_CONCURRENCY,
+    STORY_ARCHIVE_MIN_COVERAGE
+)
+from src.asr_backends import get_asr_backend
+from src.text_utils import tokenize, estimate_tokens, content_features, split_sentences
+from src.extractive_reducer import reduce_text
+from src.caption_cleaner import clean_caption_segments
+from src.media_cache import get_media_cache
+from src.story_archive import get_story_archive
+from src.llm_client import get_llm_client
+from src.language_router import (
+    KOREAN, LANGUAGE_NAMES, normalize_language_code, label_segment_languages, build_translation_runs
 )
 
 # 로깅 설정
@@ -31,41 +51,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger('transcript_processor')
 
-# OpenAI API 키 설정
-openai.api_key = OPENAI_API_KEY
+# 요약 요청 항목 (키, 설명)
+SUMMARY_SECTIONS = [
+    ('hook', '감정적 Hook 멘트 (3초 이내, 질문형이나 경고형으로 작성)'),
+    ('summary', '핵심 요약 (3문장 이내)'),
+    ('background', '배경 설명 또는 해설 (1문장)')
+]
 
 class TranscriptProcessor:
     """자막 추출 및 번역 클래스"""
     
-    def __init__(self):
-        """초기화 함수"""
+    def __init__(self, asr_backend=ASR_BACKEND):
+        """
+        초기화 함수
+        
+        Args:
+            asr_backend (str): 음성 인식 백엔드 이름 ('openai', 'local')
+        """
         # 임시 디렉토리 생성
         os.makedirs(TEMP_DIR, exist_ok=True)
         os.makedirs(os.path.join(DATA_DIR, 'transcripts'), exist_ok=True)
         
-        logger.info("TranscriptProcessor 초기화 완료")
+        # 음성 인식 백엔드
+        self.asr_backend = get_asr_backend(asr_backend)
+        
+        # 영상 제작 단계와 공유하는 원본 미디어 캐시
+        self.media_cache = get_media_cache()
+        
+        # 캐시를 공유하는 LLM 클라이언트
+        self.llm = get_llm_client()
+        
+        # 반복 보도 기사의 배경 설명 재사용을 위한 기사 아카이브
+        self.story_archive = get_story_archive()
+        
+        # 백엔드별 동시 요청 제한 (일괄 처리 시 스레드 간 공유)
+        self._limits = {
+            'caption': threading.BoundedSemaphore(CAPTION_CONCURRENCY),
+            'download': threading.BoundedSemaphore(MEDIA_DOWNLOAD_CONCURRENCY),
+            'asr': threading.BoundedSemaphore(ASR_CONCURRENCY),
+            'llm': threading.BoundedSemaphore(LLM_CONCURRENCY)
+        }
+        
+        logger.info(f"TranscriptProcessor 초기화 완료 (ASR 백엔드: {self.asr_backend.name})")
     
-    def get_youtube_transcript(self, video_id):
+    def get_youtube_transcript_segments(self, video_id):
         """
-        YouTube 영상의 자막 추출
+        YouTube 영상의 자막을 타임스탬프가 있는 구간 단위로 추출
         
         Args:
             video_id (str): YouTube 영상 ID
             
         Returns:
-            str: 추출된 자막 텍스트
+            list: 자막 구간 목록 (text, start, duration)
         """
         try:
-            # 영어 자막 우선 시도
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+            with self._limits['caption']:
+                transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
             
-            # 영어 자막 찾기
+            # 수동 한국어 자막이 있으면 번역이 필요 없으므로 우선 사용
             transcript = None
             for t in transcript_list:
-                if t.language_code == 'en':
+                if normalize_language_code(t.language_code) == KOREAN and not t.is_generated:
                     transcript = t
                     break
             
+            # 영어 자막 찾기
+            if not transcript:
+                for t in transcript_list:
+                    if t.language_code == 'en':
+                        transcript = t
+                        break
+            
             # 영어 자막이 없으면 자동 생성된 자막 사용
             if not transcript:
                 for t in transcript_list:
@@ -79,13 +135,23 @@ class TranscriptProcessor:
             
             if transcript:
                 # 자막 가져오기
-                transcript_data = transcript.fetch()
+                with self._limits['caption']:
+                    transcript_data = transcript.fetch()
                 
-                # 자막 텍스트 추출
-                full_text = ' '.join([entry['text'] for entry in transcript_data])
+                # 자막 구간 추출 (시작 시간, 길이 및 자막 트랙 언어 유지)
+                track_language = normalize_language_code(transcript.language_code)
+                segments = [
+                    {
+                        'text': entry['text'],
+                        'start': float(entry['start']),
+                        'duration': float(entry.get('duration', 0)),
+                        'language': track_language
+                    }
+                    for entry in transcript_data
+                ]
                 
-                logger.info(f"YouTube 자막 추출 성공: {video_id}")
-                return full_text
+                logger.info(f"YouTube 자막 추출 성공: {video_id} ({len(segments)}개 구간)")
+                return segments
             else:
                 logger.warning(f"YouTube 자막을 찾을 수 없음: {video_id}")
                 return None
@@ -97,91 +163,108 @@ class TranscriptProcessor:
             logger.error(f"YouTube 자막 추출 중 오류 발생: {e}")
             return None
     
+    def get_youtube_transcript(self, video_id):
+        """
+        YouTube 영상의 자막 추출
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            
+        Returns:
+            str: 추출된 자막 텍스트
+        """
+        segments = self.get_youtube_transcript_segments(video_id)
+        
+        if not segments:
+            return None
+        
+        # 효과음 태그, 군말, 롤링 중복 제거
+        segments, _ = clean_caption_segments(segments)
+        
+        return ' '.join([segment['text'] for segment in segments])
+    
     def download_audio(self, video_id):
         """
-        YouTube 영상의 오디오 다운로드
+        음성 인식용 오디오 준비 (공유 미디어 캐시의 원본에서 16kHz 모노로 추출)
         
         Args:
             video_id (str): YouTube 영상 ID
             
         Returns:
-            str: 다운로드된 오디오 파일 경로
+            str: 추출된 오디오 파일 경로
         """
         try:
             # 임시 파일 경로
-            audio_file = os.path.join(TEMP_DIR, f"{video_id}.mp3")
-            
-            # youtube-dl 또는 yt-dlp를 사용하여 오디오 다운로드
-            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # yt-dlp 설치 확인 및 설치
-            try:
-                subprocess.run(['yt-dlp', '--version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                logger.info("yt-dlp 설치 중...")
-                subprocess.run(['pip', 'install', 'yt-dlp'], check=True)
-            
-            # 오디오 다운로드
-            command = [
-                'yt-dlp',
-                '-f', 'bestaudio',
-                '-x',
-                '--audio-format', 'mp3',
-                '--audio-quality', '0',
-                '-o', audio_file,
-                youtube_url
-            ]
-            
-            subprocess.run(command, check=True)
-            
-            if os.path.exists(audio_file):
-                logger.info(f"오디오 다운로드 성공: {video_id}")
+            audio_file = os.path.join(TEMP_DIR, f"{video_id}_asr.ogg")
+            
+            # 원본은 영상 제작 단계와 공유하는 캐시에서 가져옴 (없으면 한 번만 다운로드)
+            with self._limits['download']:
+                audio_file = self.media_cache.extract_asr_audio(video_id, audio_file)
+            
+            if audio_file:
+                logger.info(f"오디오 준비 성공: {video_id}")
                 return audio_file
             else:
-                logger.error(f"오디오 다운로드 실패: {video_id}")
+                logger.error(f"오디오 준비 실패: {video_id}")
                 return None
                 
         except Exception as e:
-            logger.error(f"오디오 다운로드 중 오류 발생: {e}")
+            logger.error(f"오디오 준비 중 오류 발생: {e}")
             return None
     
-    def transcribe_audio_with_whisper(self, audio_file):
+    def transcribe_audio(self, audio_file, language=None):
         """
-        Whisper API를 사용하여 오디오 파일을 텍스트로 변환
+        설정된 ASR 백엔드(Whisper API 또는 로컬 모델)를 사용하여 오디오 파일을 구간 단위로 변환
         
         Args:
             audio_file (str): 오디오 파일 경로
+            language (str): 언어 힌트 (없으면 백엔드가 자동 감지)
             
         Returns:
-            str: 변환된 텍스트
+            dict: 변환 결과 (text, segments, language)
         """
         try:
-            with open(audio_file, "rb") as audio:
-                response = openai.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio,
-                    language="en"
-                )
+            with self._limits['asr']:
+                result = self.asr_backend.transcribe(audio_file, language=normalize_language_code(language))
+            
+            for segment in result['segments']:
+                segment.setdefault('language', result.get('language'))
             
-            transcript = response.text
-            logger.info(f"Whisper API 변환 성공: {audio_file}")
-            return transcript
+            logger.info(f"음성 인식 성공 ({self.asr_backend.name}, 언어: {result.get('language')}): {audio_file}")
+            return result
             
         except Exception as e:
-            logger.error(f"Whisper API 변환 중 오류 발생: {e}")
+            logger.error(f"음성 인식 중 오류 발생 ({self.asr_backend.name}): {e}")
             return None
     
-    def translate_to_korean(self, text):
+    def transcribe_audio_with_whisper(self, audio_file, language=None):
+        """
+        설정된 ASR 백엔드(Whisper API 또는 로컬 모델)를 사용하여 오디오 파일을 텍스트로 변환
+        
+        Args:
+            audio_file (str): 오디오 파일 경로
+            language (str): 언어 힌트 (없으면 자동 감지)
+            
+        Returns:
+            str: 변환된 텍스트
+        """
+        result = self.transcribe_audio(audio_file, language=language)
+        return result['text'] if result else None
+    
+    def translate_to_korean(self, text, source_language='en'):
         """
         OpenAI API를 사용하여 텍스트를 한국어로 번역
         
         Args:
             text (str): 번역할 텍스트
+            source_language (str): 원문 언어 코드
             
         Returns:
             str: 번역된 텍스트
         """
         try:
+            language_name = LANGUAGE_NAMES.get(source_language, 'English')
+            
             # 텍스트가 너무 길면 분할
             max_chunk_size = 4000
             chunks = []
@@ -207,16 +290,16 @@ class TranscriptProcessor:
             translated_chunks = []
             
             for chunk in chunks:
-                response = openai.chat.completions.create(
+                translated_chunk = self.llm.chat(
                     model="gpt-4o",
+                    call_site='translate',
                     messages=[
-                        {"role": "system", "content": "You are a professional translator specializing in translating English news to Korean."},
-                        {"role": "user", "content": f"Translate the following English text to Korean. Maintain the formal tone appropriate for news content:\n\n{chunk}"}
+                        {"role": "system", "content": f"You are a professional translator specializing in translating {language_name} news to Korean."},
+                        {"role": "user", "content": f"Translate the following {language_name} text to Korean. Keep any text that is already Korean as is. Maintain the formal tone appropriate for news content:\n\n{chunk}"}
                     ],
-                    temperature=0.3
+                    temperature=0.3,
+                    limiter=self._limits['llm']
                 )
-                
-                translated_chunk = response.choices[0].message.content
                 translated_chunks.append(translated_chunk)
             
             # 번역된 청크 결합
@@ -229,35 +312,161 @@ class TranscriptProcessor:
             logger.error(f"텍스트 번역 중 오류 발생: {e}")
             return None
     
-    def summarize_content(self, text, max_sentences=3):
+    def translate_units(self, segments, previous_units=None):
+        """
+        언어가 표시된 자막 구간을 번역 단위로 묶어 한국어가 아닌 단위만 번역
+        
+        Args:
+            segments (list): 언어가 표시된 자막 구간 목록
+            previous_units (list): 이전에 저장된 번역 단위 (원문이 같으면 번역을 재사용)
+            
+        Returns:
+            list: 번역 단위 목록 (start, language, needs_translation, source, translation), 실패 시 None
+        """
+        runs = build_translation_runs(segments, unit_seconds=TRANSLATION_UNIT_SECONDS)
+        
+        # 원문이 같은 이전 번역 재사용
+        cached = {
+            unit['source']: unit['translation']
+            for unit in previous_units or []
+            if unit.get('needs_translation') and unit.get('translation')
+        }
+        
+        units = []
+        translated_count = 0
+        reused_count = 0
+        
+        for run in runs:
+            unit = {
+                'start': run['start'],
+                'language': run['language'],
+                'needs_translation': run['needs_translation'],
+                'source': run['text']
+            }
+            
+            if not run['needs_translation']:
+                unit['translation'] = run['text']
+            elif run['text'] in cached:
+                unit['translation'] = cached[run['text']]
+                reused_count += 1
+            else:
+                unit['translation'] = self.translate_to_korean(run['text'], source_language=run['language'])
+                translated_count += 1
+                
+                if not unit['translation']:
+                    return None
+            
+            units.append(unit)
+        
+        skipped = sum(len(run['text']) for run in runs if not run['needs_translation'])
+        logger.info(
+            f"번역 라우팅: {len(units)}개 단위 중 {translated_count}개 번역, "
+            f"{reused_count}개 재사용, {skipped}자 번역 생략"
+        )
+        
+        return units
+    
+    def translate_segments(self, segments):
+        """
+        언어가 표시된 자막 구간 중 한국어가 아닌 구간만 번역
+        
+        Args:
+            segments (list): 언어가 표시된 자막 구간 목록
+            
+        Returns:
+            str: 한국어 텍스트 (번역 실패 시 None)
+        """
+        units = self.translate_units(segments)
+        
+        if units is None:
+            return None
+        
+        return ' '.join(unit['translation'] for unit in units)
+    
+    def find_archived_background(self, text, video_id=None):
+        """
+        같은 기사를 다룬 최근 영상의 배경 설명 조회 (요약 요청 전, 원문 기준)
+        
+        Args:
+            text (str): 요약할 텍스트
+            video_id (str): 현재 영상 ID (검색에서 제외)
+            
+        Returns:
+            dict: 배경 설명 (background, video_id, coverage), 없으면 None
+        """
+        try:
+            self.story_archive.sync()
+            features = set(content_features(text))
+            if not features:
+                return None
+            
+            best = None
+            for row in self.story_archive.search(text, exclude_video_id=video_id):
+                if not row['background']:
+                    continue
+                
+                # 과거 요약의 특징 중 현재 원문에 포함된 비율 (IDF 가중: 흔한 특징은 거의 반영하지 않음)
+                other = set(content_features(row['summary']))
+                shared, _, total = self.story_archive.weighted_overlap(features, other)
+                if not total:
+                    continue
+                coverage = shared / total
+                
+                if coverage >= STORY_ARCHIVE_MIN_COVERAGE and (best is None or coverage > best['coverage']):
+                    best = {'background': row['background'], 'video_id': row['video_id'], 'coverage': round(coverage, 4)}
+            
+            return best
+        except Exception as e:
+            logger.warning(f"과거 배경 설명 조회 실패: {e}")
+            return None
+    
+    def summarize_content(self, text, max_sentences=3, token_budget=SUMMARY_TOKEN_BUDGET, video_id=None, use_archive=True):
         """
         OpenAI API를 사용하여 텍스트 요약
         
+        같은 기사를 다룬 최근 영상이 아카이브에 있으면 그 배경 설명을 재사용하고 배경 설명은 요청하지 않습니다.
+        
         Args:
             text (str): 요약할 텍스트
             max_sentences (int): 최대 문장 수
+            token_budget (int): 요약 요청 전 추출 요약으로 줄일 최대 토큰 수 (None이면 원문 그대로 사용)
+            video_id (str): 현재 영상 ID (아카이브 검색에서 제외)
+            use_archive (bool): 과거 배경 설명 재사용 여부
             
         Returns:
             dict: 요약 결과 (hook, summary, background)
         """
         try:
-            response = openai.chat.completions.create(
+            # 긴 텍스트는 핵심 문장만 추출하여 프롬프트 축소
+            if token_budget:
+                original_tokens = estimate_tokens(text)
+                text = reduce_text(text, token_budget)
+                reduced_tokens = estimate_tokens(text)
+                
+                if reduced_tokens < original_tokens:
+                    logger.info(f"추출 요약 적용: 약 {original_tokens} -> {reduced_tokens} 토큰")
+            
+            # 최근 같은 기사의 배경 설명이 있으면 배경 설명 항목을 빼고 요청
+            archived = self.find_archived_background(text, video_id) if use_archive else None
+            sections = [section for section in SUMMARY_SECTIONS if not (archived and section[0] == 'background')]
+            instructions = '\n                    '.join(
+                f"{number}. {description}" for number, (_, description) in enumerate(sections, 1)
+            )
+            fields = json.dumps({key: description for key, description in sections}, ensure_ascii=False, indent=4)
+            
+            content = self.llm.chat(
                 model="gpt-4o",
+                call_site='summarize',
+                use_cache=False,
                 messages=[
                     {"role": "system", "content": "You are an expert news editor specializing in creating concise summaries for short-form video content."},
                     {"role": "user", "content": f"""
                     다음 뉴스 내용을 분석하고 YouTube Shorts용 스크립트를 생성해주세요.
                     
-                    1. 감정적 Hook 멘트 (3초 이내, 질문형이나 경고형으로 작성)
-                    2. 핵심 요약 (3문장 이내)
-                    3. 배경 설명 또는 해설 (1문장)
+                    {instructions}
                     
                     JSON 형식으로 다음과 같이 반환해주세요:
-                    {{
-                        "hook": "감정적 Hook 멘트",
-                        "summary": "핵심 요약 (3문장 이내)",
-                        "background": "배경 설명 또는 해설 (1문장)"
-                    }}
+                    {fields}
                     
                     뉴스 내용:
                     {text}
@@ -265,10 +474,16 @@ class TranscriptProcessor:
                     }
                 ],
                 temperature=0.7,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                limiter=self._limits['llm']
             )
             
-            summary_result = json.loads(response.choices[0].message.content)
+            summary_result = json.loads(content)
+            
+            if archived:
+                summary_result['background'] = archived['background']
+                summary_result['background_source'] = archived['video_id']
+                logger.info(f"과거 배경 설명 재사용: {archived['video_id']} (포함 비율 {archived['coverage']})")
             
             logger.info("텍스트 요약 성공")
             return summary_result
@@ -277,62 +492,251 @@ class TranscriptProcessor:
             logger.error(f"텍스트 요약 중 오류 발생: {e}")
             return None
     
-    def process_video(self, video_id):
+    def evaluate_summary_reducer(self, text, token_budget=SUMMARY_TOKEN_BUDGET):
+        """
+        추출 요약 적용 여부에 따른 요약 결과 비교 (평가 모드)
+        
+        Args:
+            text (str): 요약할 텍스트
+            token_budget (int): 추출 요약 토큰 예산
+            
+        Returns:
+            dict: 두 방식의 요약 결과, 추정 입력 토큰 수, 소요 시간 및 요약 간 어휘 유사도
+        """
+        evaluation = {}
+        
+        for mode, budget in (('full', None), ('reduced', token_budget)):
+            start = time.perf_counter()
+            summary = self.summarize_content(text, token_budget=budget, use_archive=False)
+            elapsed = time.perf_counter() - start
+            
+            evaluation[mode] = {
+                'summary': summary,
+                'input_tokens': estimate_tokens(reduce_text(text, budget) if budget else text),
+                'latency': round(elapsed, 3)
+            }
+        
+        # 두 요약의 어휘 겹침 (Jaccard)
+        def summary_tokens(result):
+            if not result['summary']:
+                return set()
+            return set(tokenize(' '.join(str(v) for v in result['summary'].values())))
+        
+        full_tokens = summary_tokens(evaluation['full'])
+        reduced_tokens = summary_tokens(evaluation['reduced'])
+        union = full_tokens | reduced_tokens
+        evaluation['overlap'] = round(len(full_tokens & reduced_tokens) / len(union), 3) if union else 0.0
+        evaluation['token_reduction'] = evaluation['full']['input_tokens'] - evaluation['reduced']['input_tokens']
+        
+        logger.info(
+            f"추출 요약 평가: 입력 토큰 {evaluation['full']['input_tokens']} -> {evaluation['reduced']['input_tokens']}, "
+            f"요약 유사도 {evaluation['overlap']}"
+        )
+        return evaluation
+    
+    def _layout_translation_units(self, translation_units, timeline_end):
+        """
+        번역 단위의 한국어 문장을 단위의 시간 범위에 배치 (글자 위치 비율로 시작 시간 추정)
+        
+        Args:
+            translation_units (list): 번역 단위 목록 (start, needs_translation, translation)
+            timeline_end (float): 마지막 자막 끝 시간 (초)
+            
+        Returns:
+            list: 번역 문장 목록 (start, text), 시작 시간 순
+        """
+        units = sorted(translation_units or [], key=lambda unit: unit['start'])
+        placed = []
+        
+        for i, unit in enumerate(units):
+            if not unit.get('needs_translation') or not unit.get('translation'):
+                continue
+            
+            unit_end = units[i + 1]['start'] if i + 1 < len(units) else timeline_end
+            span = max(0.0, unit_end - unit['start'])
+            text = unit['translation']
+            
+            offset = 0
+            for sentence in split_sentences(text):
+                position = text.find(sentence, offset)
+                offset = position + len(sentence) if position >= 0 else offset
+                placed.append({'start': unit['start'] + span * max(0, position) / len(text), 'text': sentence})
+        
+        return sorted(placed, key=lambda sentence: sentence['start'])
+    
+    def find_clip_window(self, segments, summary, duration=SHORTS_DURATION, translation_units=None):
+        """
+        요약 내용과 가장 관련 있는 자막 구간을 찾아 클립 시작 시간 결정
+        
+        외국어 구간은 이미 번역한 translation_units의 한국어 문장을 시간축에 배치해 요약 어휘와 비교하고
+        (추가 번역 요청 없음), 요약 어휘와 일치하는 점수에 전체 자막과의 중심성 점수를 더해 구간을 고릅니다.
+        
+        Args:
+            segments (list): 자막 구간 목록 (text, start, duration)
+            summary (dict): 요약 결과 (hook, summary, background)
+            duration (int): 클립 길이 (초)
+            translation_units (list): 번역 단위 목록 (translate_units 결과)
+            
+        Returns:
+            dict: 클립 구간 (start, duration, score)
+        """
+        if not segments:
+            return {'start': 0, 'duration': duration, 'score': 0.0}
+        
+        segment_tokens = [Counter(tokenize(segment['text'])) for segment in segments]
+        
+        # 클립이 마지막 자막 끝을 넘지 않도록 시작 시간 제한
+        timeline_end = max(segment['start'] + segment.get('duration', 0) for segment in segments)
+        latest_start = max(0, timeline_end - duration)
+        
+        # 번역 문장 (원문이 외국어인 구간의 한국어 어휘)
+        translated = self._layout_translation_units(translation_units, timeline_end)
+        translated_starts = [sentence['start'] for sentence in translated]
+        translated_tokens = [Counter(tokenize(sentence['text'])) for sentence in translated]
+        
+        # 원문 구간과 번역 문장의 문서 빈도로 IDF 계산
+        document_frequency = Counter()
+        for tokens in segment_tokens + translated_tokens:
+            document_frequency.update(tokens.keys())
+        idf = {
+            token: math.log((1 + len(segments) + len(translated)) / (1 + count)) + 1
+            for token, count in document_frequency.items()
+        }
+        
+        summary_text = ' '.join(str(summary.get(key, '')) for key in ('hook', 'summary', 'background'))
+        reference_tokens = set(tokenize(summary_text))
+        
+        overall = Counter()
+        for tokens in segment_tokens:
+            overall.update(tokens)
+        overall_weights = {token: count * idf[token] for token, count in overall.items()}
+        overall_norm = math.sqrt(sum(w * w for w in overall_weights.values())) or 1.0
+        
+        best = {'start': 0, 'duration': duration, 'score': 0.0}
+        
+        starts = [segment['start'] for segment in segments]
+        
+        for window_start in sorted({min(start, latest_start) for start in starts}):
+            window_end = window_start + duration
+            
+            window = Counter()
+            for j in range(bisect.bisect_left(starts, window_start), len(segments)):
+                if starts[j] >= window_end:
+                    break
+                window.update(segment_tokens[j])
+            
+            if not window:
+                continue
+            
+            # 요약과 공유하는 어휘 점수 (원문과 같은 구간에 배치된 번역 문장 포함)
+            vocabulary = set(window)
+            for j in range(bisect.bisect_left(translated_starts, window_start), len(translated)):
+                if translated_starts[j] >= window_end:
+                    break
+                vocabulary.update(translated_tokens[j])
+            overlap_score = sum(idf[token] for token in vocabulary if token in reference_tokens)
+            
+            # 전체 자막과의 코사인 유사도 (중심성)
+            weights = {token: count * idf[token] for token, count in window.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            centrality = sum(w * overall_weights[token] for token, w in weights.items()) / (norm * overall_norm)
+            
+            score = overlap_score + centrality
+            
+            if score > best['score']:
+                best = {'start': window_start, 'duration': duration, 'score': round(score, 4)}
+        
+        logger.info(f"클립 구간 선택: {best['start']:.1f}초부터 {duration}초 (점수 {best['score']})")
+        return best
+    
+    def process_video(self, video_id, language_hint=None):
         """
         영상 처리 메인 함수
         
         Args:
             video_id (str): YouTube 영상 ID
+            language_hint (str): 원본 영상 언어 (영상 메타데이터의 defaultAudioLanguage 등, ASR 언어 힌트로 사용)
             
         Returns:
             dict: 처리 결과
         """
         try:
             # 1. YouTube 자막 추출 시도
-            transcript = self.get_youtube_transcript(video_id)
+            segments = self.get_youtube_transcript_segments(video_id)
             
-            # 2. 자막이 없으면 Whisper API 사용
-            if not transcript:
-                logger.info(f"YouTube 자막이 없어 Whisper API 사용: {video_id}")
+            # 2. 자막이 없으면 ASR 백엔드 사용
+            if not segments:
+                logger.info(f"YouTube 자막이 없어 음성 인식 사용: {video_id}")
                 audio_file = self.download_audio(video_id)
                 
                 if audio_file:
-                    transcript = self.transcribe_audio_with_whisper(audio_file)
+                    asr_result = self.transcribe_audio(audio_file, language=language_hint)
+                    
+                    if asr_result:
+                        segments = asr_result['segments'] or [
+                            {'text': asr_result['text'], 'start': 0.0, 'duration': 0.0,
+                             'language': asr_result.get('language')}
+                        ]
                     
                     # 임시 파일 삭제
                     if os.path.exists(audio_file):
                         os.remove(audio_file)
             
+            # 자동 자막의 효과음 태그, 군말, 롤링 중복 제거
+            cleanup_stats = None
+            if segments:
+                segments, cleanup_stats = clean_caption_segments(segments)
+                logger.info(
+                    f"자막 정리 완료: 약 {cleanup_stats['tokens_before']} -> {cleanup_stats['tokens_after']} 토큰 "
+                    f"({cleanup_stats['token_reduction'] * 100:.1f}% 감소)"
+                )
+            
+            transcript = ' '.join([segment['text'] for segment in segments]) if segments else None
+            
             if not transcript:
                 logger.error(f"자막 추출 실패: {video_id}")
                 return None
             
-            # 3. 한국어로 번역
-            translated_text = self.translate_to_korean(transcript)
+            # 3. 언어 감지 후 필요한 구간만 한국어로 번역
+            language = label_segment_languages(
+                segments, default=segments[0].get('language') or normalize_language_code(language_hint)
+            )
+            
+            if all(segment['language'] == KOREAN for segment in segments):
+                logger.info(f"한국어 자막이므로 번역 생략: {video_id}")
+            
+            translation_units = self.translate_units(segments)
+            translated_text = ' '.join(unit['translation'] for unit in translation_units) if translation_units else None
             
             if not translated_text:
                 logger.error(f"번역 실패: {video_id}")
                 return None
             
             # 4. 내용 요약
-            summary = self.summarize_content(translated_text)
+            summary = self.summarize_content(translated_text, video_id=video_id)
             
             if not summary:
                 logger.error(f"요약 실패: {video_id}")
                 return None
             
-            # 5. 결과 저장
+            # 5. 요약과 관련된 클립 구간 선택
+            clip_window = self.find_clip_window(segments, summary, translation_units=translation_units)
+            
+            # 6. 결과 저장
             result = {
                 'video_id': video_id,
                 'original_transcript': transcript,
+                'language': language,
+                'segments': segments,
+                'cleanup': cleanup_stats,
+                'translation_units': translation_units,
                 'translated_text': translated_text,
-                'summary': summary
+                'summary': summary,
+                'clip_window': clip_window
             }
             
             # 파일로 저장
-            result_file = os.path.join(DATA_DIR, 'transcripts', f"{video_id}.json")
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            self._save_result(result)
             
             logger.info(f"영상 처리 완료: {video_id}")
             return result
@@ -340,6 +744,158 @@ class TranscriptProcessor:
         except Exception as e:
             logger.error(f"영상 처리 중 오류 발생: {e}")
             return None
+    
+    def process_videos(self, video_ids, language_hints=None, max_workers=BATCH_MAX_WORKERS):
+        """
+        여러 영상을 동시에 처리하고 완료되는 순서대로 결과 반환
+        
+        자막 수집, 음성 인식, GPT 호출은 백엔드별 동시 요청 제한을 공유하므로
+        작업 스레드 수와 관계없이 각 백엔드에 걸리는 부하가 제한됩니다.
+        
+        Args:
+            video_ids (list): YouTube 영상 ID 목록
+            language_hints (dict): 영상 ID별 언어 힌트
+            max_workers (int): 동시에 처리할 최대 영상 수
+            
+        Yields:
+            tuple: (영상 ID, 처리 결과 또는 None)
+        """
+        language_hints = language_hints or {}
+        video_ids = list(dict.fromkeys(video_ids))
+        
+        if not video_ids:
+            return
+        
+        logger.info(f"일괄 처리 시작: {len(video_ids)}개 영상")
+        completed = 0
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids))) as executor:
+            futures = {
+                executor.submit(self.process_video, video_id, language_hints.get(video_id)): video_id
+                for video_id in video_ids
+            }
+            
+            for future in as_completed(futures):
+                video_id = futures[future]
+                completed += 1
+                
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"일괄 처리 중 오류 발생: {video_id}, {e}")
+                    result = None
+                
+                logger.info(f"일괄 처리 진행: {completed}/{len(video_ids)} ({video_id}, {'성공' if result else '실패'})")
+                yield video_id, result
+    
+    def _save_result(self, result):
+        """
+        처리 결과 저장
+        
+        Args:
+            result (dict): 처리 결과
+        """
+        result_file = os.path.join(DATA_DIR, 'transcripts', f"{result['video_id']}.json")
+        with open(result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    
+    def load_result(self, video_id):
+        """
+        저장된 처리 결과 로드
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            
+        Returns:
+            dict: 처리 결과 (없으면 None)
+        """
+        result_file = os.path.join(DATA_DIR, 'transcripts', f"{video_id}.json")
+        
+        if not os.path.exists(result_file):
+            return None
+        
+        with open(result_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def refresh_video(self, video_id, summary_threshold=RETRANSLATE_SUMMARY_THRESHOLD):
+        """
+        수정된 자막을 다시 가져와 변경된 번역 단위만 재번역
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            summary_threshold (float): 요약을 다시 생성할 최소 변경 비율 (0~1)
+            
+        Returns:
+            dict: 갱신된 처리 결과
+        """
+        try:
+            stored = self.load_result(video_id)
+            
+            # 저장된 결과가 없거나 이전 형식이면 전체 처리
+            if not stored or 'translation_units' not in stored:
+                logger.info(f"저장된 번역 단위가 없어 전체 처리: {video_id}")
+                return self.process_video(video_id)
+            
+            segments = self.get_youtube_transcript_segments(video_id)
+            
+            if not segments:
+                logger.info(f"갱신할 자막이 없어 저장된 결과 사용: {video_id}")
+                return stored
+            
+            segments, cleanup_stats = clean_caption_segments(segments)
+            transcript = ' '.join([segment['text'] for segment in segments])
+            
+            # 이전 자막과의 변경 비율
+            matcher = difflib.SequenceMatcher(
+                None, stored['original_transcript'].split(), transcript.split(), autojunk=False
+            )
+            change_ratio = round(1 - matcher.ratio(), 4)
+            
+            if change_ratio == 0:
+                logger.info(f"자막 변경 없음: {video_id}")
+                return stored
+            
+            logger.info(f"자막 변경 감지: {video_id} (변경 비율 {change_ratio * 100:.1f}%)")
+            
+            # 변경된 번역 단위만 재번역
+            language = label_segment_languages(segments, default=segments[0].get('language'))
+            translation_units = self.translate_units(segments, previous_units=stored['translation_units'])
+            
+            if translation_units is None:
+                logger.error(f"재번역 실패: {video_id}")
+                return stored
+            
+            translated_text = ' '.join(unit['translation'] for unit in translation_units)
+            
+            # 변경이 충분히 클 때만 요약 재생성
+            summary = stored['summary']
+            if change_ratio >= summary_threshold:
+                logger.info(f"변경 비율이 커서 요약 재생성: {video_id}")
+                summary = self.summarize_content(translated_text, video_id=video_id) or summary
+            
+            result = dict(stored)
+            result.update({
+                'original_transcript': transcript,
+                'language': language,
+                'segments': segments,
+                'cleanup': cleanup_stats,
+                'translation_units': translation_units,
+                'translated_text': translated_text,
+                'summary': summary,
+                'clip_window': self.find_clip_window(segments, summary, translation_units=translation_units),
+                'revision': stored.get('revision', 0) + 1,
+                'last_change_ratio': change_ratio,
+                'refreshed_at': datetime.now().isoformat()
+            })
+            
+            self._save_result(result)
+            
+            logger.info(f"자막 갱신 완료: {video_id} (리비전 {result['revision']})")
+            return result
+            
+        except Exception as e:
+            logger.error(f"자막 갱신 중 오류 발생: {e}")
+            return None
 
 # 테스트 코드
 if __name__ == "__main__":
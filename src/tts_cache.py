@@ -0,0 +1,243 @@
+"""
+TTS 오디오 캐시 모듈
+- (텍스트, 음성 ID, 모델 ID, 음성 설정)의 해시로 합성된 오디오를 저장하고 재사용합니다.
+- 템플릿의 고정 전환/마무리 멘트처럼 반복되는 문장은 ElevenLabs 호출 없이 디스크에서 바로 가져옵니다.
+- 용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제하고, 절약한 글자 수(ElevenLabs 사용량)를 집계합니다.
+"""
+import os
+import json
+import fcntl
+import shutil
+import hashlib
+import logging
+import threading
+
+# 설정 파일 임포트
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.config import (
+    LOGS_DIR, TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
+)
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(os.path.join(LOGS_DIR, 'tts_cache.log')),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger('tts_cache')
+
+# 누적 통계 파일 이름 (캐시 디렉토리 안)
+STATS_FILE = 'stats.json'
+
+
+class TTSCache:
+    """TTS 오디오 캐시 클래스"""
+    
+    def __init__(self, cache_dir=TTS_CACHE_DIR, max_bytes=TTS_CACHE_MAX_BYTES):
+        """
+        초기화 함수
+        
+        Args:
+            cache_dir (str): 캐시 디렉토리
+            max_bytes (int): 캐시 최대 용량 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.metrics = {'hits': 0, 'misses': 0, 'characters_saved': 0}
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def cache_key(self, text, voice_id, model_id, voice_settings):
+        """
+        캐시 키 생성
+        
+        Args:
+            text (str): 합성할 텍스트
+            voice_id (str): ElevenLabs 음성 ID
+            model_id (str): ElevenLabs 모델 ID
+            voice_settings (dict): 음성 설정
+        
+        Returns:
+            str: 캐시 키
+        """
+        payload = json.dumps(
+            {'text': text, 'voice_id': voice_id, 'model_id': model_id, 'voice_settings': voice_settings},
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _path(self, key):
+        """캐시 항목 경로"""
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+    
+    def get(self, key, output_path, characters=0):
+        """
+        캐시된 오디오를 output_path로 복사
+        
+        Args:
+            key (str): 캐시 키
+            output_path (str): 오디오를 복사할 경로
+            characters (int): 텍스트 글자 수 (적중 시 절약한 사용량으로 집계)
+        
+        Returns:
+            str: 복사한 오디오 경로 (없으면 None)
+        """
+        path = self._path(key)
+        
+        with self._lock:
+            # 다른 프로세스의 evict()가 확인과 복사 사이에 지울 수 있으므로 복사 실패를 미스로 처리
+            try:
+                shutil.copyfile(path, output_path)
+                os.utime(path)
+            except FileNotFoundError:
+                self.metrics['misses'] += 1
+                return None
+            
+            self.metrics['hits'] += 1
+            self.metrics['characters_saved'] += characters
+            self._add_saved_characters(characters)
+        
+        logger.info(f"TTS 캐시 적중: {key[:12]} ({characters}자 절약)")
+        return output_path
+    
+    def put(self, key, audio_path):
+        """
+        합성된 오디오를 캐시에 저장
+        
+        Args:
+            key (str): 캐시 키
+            audio_path (str): 합성된 오디오 파일 경로
+        
+        Returns:
+            str: 캐시 항목 경로 (저장 실패 시 None, 합성된 오디오는 그대로 사용 가능)
+        """
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        try:
+            shutil.copyfile(audio_path, temp_path)
+            os.replace(temp_path, path)
+            self.evict(keep=path)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 저장 실패: {key[:12]}, 오류: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+        
+        return path
+    
+    def _add_saved_characters(self, characters):
+        """누적 절약 글자 수 기록 (프로세스 재시작 후에도 유지)"""
+        stats_path = os.path.join(self.cache_dir, STATS_FILE)
+        try:
+            with open(f"{stats_path}.lock", 'w') as lock:
+                # 프로세스 간 갱신 직렬화 (렌더링 풀 워커들이 같은 파일을 갱신)
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    stats = {}
+                    if os.path.exists(stats_path):
+                        with open(stats_path, 'r', encoding='utf-8') as f:
+                            stats = json.load(f)
+                    stats['hits'] = stats.get('hits', 0) + 1
+                    stats['characters_saved'] = stats.get('characters_saved', 0) + characters
+                    
+                    temp_path = f"{stats_path}.{os.getpid()}.tmp"
+                    with open(temp_path, 'w', encoding='utf-8') as f:
+                        json.dump(stats, f)
+                    os.replace(temp_path, stats_path)
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 통계 저장 실패: {e}")
+    
+    def _entries(self):
+        """캐시 항목 목록 (경로, 크기, 최근 사용 시각)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.mp3'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # 다른 프로세스의 evict()가 목록 조회 후 삭제한 항목
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+    
+    def evict(self, keep=None):
+        """
+        용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+        
+        Args:
+            keep (str): 삭제하지 않을 경로 (방금 사용한 항목)
+        
+        Returns:
+            int: 삭제한 바이트 수
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        freed = 0
+        
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                freed += size
+            except OSError as e:
+                logger.warning(f"TTS 캐시 삭제 실패: {path}, 오류: {e}")
+        
+        if freed:
+            logger.info(f"TTS 캐시 정리: {freed / 1024 ** 2:.1f}MB 삭제")
+        return freed
+    
+    def stats(self):
+        """
+        캐시 사용 현황
+        
+        Returns:
+            dict: 항목 수, 사용 용량, 최대 용량, 이번 프로세스의 적중/실패/절약 글자 수, 누적 절약 글자 수
+        """
+        entries = self._entries()
+        total_saved = 0
+        stats_path = os.path.join(self.cache_dir, STATS_FILE)
+        if os.path.exists(stats_path):
+            try:
+                with open(stats_path, 'r', encoding='utf-8') as f:
+                    total_saved = json.load(f).get('characters_saved', 0)
+            except Exception:
+                pass
+        
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            **self.metrics,
+            'total_characters_saved': total_saved
+        }
+
+
+# 프로세스 공용 캐시 인스턴스
+_shared_cache = None
+
+
+def get_tts_cache():
+    """
+    공용 TTS 캐시 인스턴스 조회
+    
+    Returns:
+        TTSCache: 캐시 인스턴스
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TTSCache()
+    return _shared_cache
@@ -5,22 +5,33 @@
 - 쇼츠 형식에 최적화된 영상을 제작합니다.
 """
 import os
+import re
 import json
 import logging
 import tempfile
 import subprocess
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import ffmpeg
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 설정 파일 임포트
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.config import (
-    ELEVENLABS_API_KEY, DATA_DIR, LOGS_DIR, TEMP_DIR, SHORTS_DURATION
+    ELEVENLABS_API_KEY, DATA_DIR, LOGS_DIR, TEMP_DIR, SHORTS_DURATION, TTS_VOICE_ID, TTS_MODEL_ID,
+    TTS_VOICE_SETTINGS, TTS_MAX_CONCURRENCY, TTS_RETRY_TOTAL, ENCODING_PROFILE
 )
+from src.media_cache import get_media_cache
+from src.ffmpeg_utils import encoding_args, run_ffmpeg
+from src.duration_model import get_duration_model
+from src.tts_cache import get_tts_cache
+from src.asr_backends import probe_duration
+from src.text_utils import split_sentences
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,6 +44,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger('video_producer')
 
+# 자막 스타일 (ASS force_style)
+SUBTITLE_STYLE = 'FontName=Arial,FontSize=24,PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,BackColour=&H00000000,Bold=1,Alignment=10,MarginV=20'
+
+
+def _escape_filter_path(path):
+    """FFmpeg 필터 그래프 안의 필터 인자로 쓸 파일 경로 이스케이프 (필터 인자, 필터 그래프 2단계)"""
+    escaped = re.sub(r"([\\':])", r'\\\1', path)
+    return re.sub(r"([\\'\[\],;])", r'\\\1', escaped)
+
+
 class VideoProducer:
     """영상 제작 클래스"""
     
@@ -47,6 +68,28 @@ class VideoProducer:
         # FFmpeg 설치 확인
         self._check_ffmpeg()
         
+        # 자막 처리 단계와 공유하는 원본 미디어 캐시
+        self.media_cache = get_media_cache()
+        
+        # 측정된 TTS 길이로 보정한 나레이션 길이 모델
+        self.duration_model = get_duration_model()
+        
+        # 반복되는 문장의 합성 결과를 재사용하는 TTS 캐시
+        self.tts_cache = get_tts_cache()
+        
+        # Hook 선행 생성과 구간별 병렬 합성에 사용하는 TTS 작업용 스레드 풀
+        self._tts_executor = ThreadPoolExecutor(max_workers=TTS_MAX_CONCURRENCY)
+        
+        # ElevenLabs 연결 재사용 (keep-alive 연결 풀, 일시적 오류 시 구간별 재시도)
+        self.session = requests.Session()
+        retry = Retry(
+            total=TTS_RETRY_TOTAL,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['POST'])
+        )
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=TTS_MAX_CONCURRENCY, max_retries=retry))
+        
         logger.info("VideoProducer 초기화 완료")
     
     def _check_ffmpeg(self):
@@ -60,7 +103,7 @@ class VideoProducer:
             subprocess.run(['sudo', 'apt', 'install', '-y', 'ffmpeg'], check=True)
             logger.info("FFmpeg 설치 완료")
     
-    def generate_tts_audio(self, text, voice_id="21m00Tcm4TlvDq8ikWAM", filename=None):
+    def generate_tts_audio(self, text, voice_id=TTS_VOICE_ID, filename=None, section=None):
         """
         ElevenLabs API를 사용하여 TTS 오디오 생성
         
@@ -68,6 +111,7 @@ class VideoProducer:
             text (str): 변환할 텍스트
             voice_id (str): ElevenLabs 음성 ID
             filename (str): 저장할 파일 이름 (없으면 자동 생성)
+            section (str): 스크립트 구간 (지정하면 오디오 길이를 측정하여 길이 모델 갱신)
             
         Returns:
             str: 생성된 오디오 파일 경로
@@ -96,14 +140,17 @@ class VideoProducer:
             
             data = {
                 "text": text,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75
-                }
+                "model_id": TTS_MODEL_ID,
+                "voice_settings": TTS_VOICE_SETTINGS
             }
             
-            response = requests.post(url, json=data, headers=headers)
+            # 같은 텍스트/음성/설정으로 합성한 오디오가 있으면 재사용
+            cache_key = self.tts_cache.cache_key(text, voice_id, TTS_MODEL_ID, TTS_VOICE_SETTINGS)
+            if self.tts_cache.get(cache_key, audio_path, characters=len(text)):
+                logger.info(f"TTS 오디오 캐시 사용: {audio_path}")
+                return audio_path
+            
+            response = self.session.post(url, json=data, headers=headers, timeout=60)
             
             if response.status_code == 200:
                 # 오디오 파일 저장
@@ -111,6 +158,11 @@ class VideoProducer:
                     f.write(response.content)
                 
                 logger.info(f"TTS 오디오 생성 완료: {audio_path}")
+                self.tts_cache.put(cache_key, audio_path)
+                
+                if section:
+                    self.duration_model.observe(text, audio_path, voice_id, section)
+                
                 return audio_path
             else:
                 logger.error(f"TTS 오디오 생성 실패: {response.status_code}, {response.text}")
@@ -133,50 +185,24 @@ class VideoProducer:
             str: 다운로드된 영상 파일 경로
         """
         try:
-            # 파일 경로
-            video_path = os.path.join(DATA_DIR, 'videos', f"{video_id}.mp4")
+            # 필요한 구간이 포함된 원본 영상 (자막 처리 단계와 공유하는 캐시, 없으면 구간만 다운로드)
+            video_path, clip_offset = self.media_cache.get_clip(video_id, start_time, duration)
             
-            # youtube-dl 또는 yt-dlp를 사용하여 영상 다운로드
-            youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-            
-            # yt-dlp 설치 확인 및 설치
-            try:
-                subprocess.run(['yt-dlp', '--version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                logger.info("yt-dlp 설치 중...")
-                subprocess.run(['pip', 'install', 'yt-dlp'], check=True)
-            
-            # 영상 다운로드
-            command = [
-                'yt-dlp',
-                '-f', 'bestvideo[height<=720]+bestaudio/best[height<=720]',
-                '--merge-output-format', 'mp4',
-                '-o', video_path,
-                youtube_url
-            ]
-            
-            subprocess.run(command, check=True)
-            
-            if os.path.exists(video_path):
+            if video_path and os.path.exists(video_path):
                 logger.info(f"영상 다운로드 완료: {video_id}")
                 
                 # 영상 자르기
                 trimmed_video_path = os.path.join(DATA_DIR, 'videos', f"{video_id}_trimmed.mp4")
                 
-                # FFmpeg로 영상 자르기
-                command = [
-                    'ffmpeg',
-                    '-i', video_path,
-                    '-ss', str(start_time),
+                # 입력 탐색 후 필요한 구간만 인코딩 프로필로 인코딩
+                run_ffmpeg([
+                    'ffmpeg', '-y',
+                    '-ss', str(clip_offset),
                     '-t', str(duration),
-                    '-c:v', 'libx264',
-                    '-c:a', 'aac',
-                    '-strict', 'experimental',
-                    '-b:a', '192k',
+                    '-i', video_path,
+                    *encoding_args(),
                     trimmed_video_path
-                ]
-                
-                subprocess.run(command, check=True)
+                ])
                 
                 if os.path.exists(trimmed_video_path):
                     logger.info(f"영상 자르기 완료: {trimmed_video_path}")
@@ -192,85 +218,57 @@ class VideoProducer:
             logger.error(f"영상 다운로드 중 오류 발생: {e}")
             return None
     
-    def create_subtitle_file(self, script, output_path):
+    def _script_segments(self, script):
+        """
+        나레이션/자막 구간 목록 (Hook, 전환, 요약 문장별, 배경, 마무리 순)
+        
+        Args:
+            script (dict): 스크립트
+        
+        Returns:
+            list: (구간 이름, 텍스트) 목록
+        """
+        segments = [('hook', script['hook']), ('transition', script['transition'])]
+        segments += [('summary', sentence) for sentence in split_sentences(script['summary'])]
+        segments += [('background', script['background']), ('ending', script['ending'])]
+        return [(section, text) for section, text in segments if text and text.strip()]
+    
+    def create_subtitle_file(self, script, output_path, durations=None):
         """
         자막 파일 생성 (SRT 형식)
         
         Args:
             script (dict): 스크립트
             output_path (str): 저장할 파일 경로
+            durations (list): 구간별 실제 나레이션 길이 (초, _script_segments 순서, 없으면 길이 모델로 추정)
             
         Returns:
             str: 생성된 자막 파일 경로
         """
         try:
-            # 자막 내용 구성
-            hook = script['hook']
-            transition = script['transition']
-            summary = script['summary']
-            background = script['background']
-            ending = script['ending']
-            
-            # 자막 타이밍 계산 (대략적인 추정)
-            # 평균 말하기 속도 (초당 글자 수)
-            chars_per_second = 4
-            
-            hook_duration = len(hook) / chars_per_second
-            transition_duration = len(transition) / chars_per_second
+            segments = self._script_segments(script)
             
-            # 요약은 문장별로 분리
-            summary_sentences = summary.split('. ')
-            summary_sentences = [s + '.' for s in summary_sentences if s]
+            # 자막 타이밍 계산 (측정된 구간 길이, 없으면 구간별 나레이션 길이 모델)
+            if not durations or len(durations) != len(segments):
+                durations = [self.duration_model.estimate(text, section=section) for section, text in segments]
             
             # 자막 파일 내용
-            srt_content = ""
+            entries = []
             
             # 현재 시간 (밀리초)
             current_time = 0
             
-            # Hook 자막
-            srt_content += "1\n"
-            srt_content += self._format_srt_time(current_time, current_time + hook_duration * 1000) + "\n"
-            srt_content += hook + "\n\n"
-            
-            current_time += hook_duration * 1000
-            
-            # 전환 자막
-            srt_content += "2\n"
-            srt_content += self._format_srt_time(current_time, current_time + transition_duration * 1000) + "\n"
-            srt_content += transition + "\n\n"
-            
-            current_time += transition_duration * 1000
-            
-            # 요약 자막 (문장별)
-            for i, sentence in enumerate(summary_sentences):
-                sentence_duration = len(sentence) / chars_per_second
-                
-                srt_content += f"{i+3}\n"
-                srt_content += self._format_srt_time(current_time, current_time + sentence_duration * 1000) + "\n"
-                srt_content += sentence + "\n\n"
-                
-                current_time += sentence_duration * 1000
-            
-            # 배경 자막
-            background_duration = len(background) / chars_per_second
-            
-            srt_content += f"{len(summary_sentences)+3}\n"
-            srt_content += self._format_srt_time(current_time, current_time + background_duration * 1000) + "\n"
-            srt_content += background + "\n\n"
-            
-            current_time += background_duration * 1000
-            
-            # 마무리 자막
-            ending_duration = len(ending) / chars_per_second
-            
-            srt_content += f"{len(summary_sentences)+4}\n"
-            srt_content += self._format_srt_time(current_time, current_time + ending_duration * 1000) + "\n"
-            srt_content += ending + "\n"
+            for i, ((section, text), duration) in enumerate(zip(segments, durations)):
+                entries.append(
+                    f"{i + 1}\n"
+                    + self._format_srt_time(current_time, current_time + duration * 1000) + "\n"
+                    + text + "\n"
+                )
+                current_time += duration * 1000
             
             # 자막 파일 저장
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(srt_content)
+                f.write("\n".join(entries))
             
             logger.info(f"자막 파일 생성 완료: {output_path}")
             return output_path
@@ -291,6 +289,7 @@ class VideoProducer:
             str: SRT 형식의 시간 문자열
         """
         def ms_to_srt(ms):
+            ms = int(round(ms))
             seconds = ms // 1000
             ms = ms % 1000
             minutes = seconds // 60
@@ -301,93 +300,194 @@ class VideoProducer:
         
         return f"{ms_to_srt(start_ms)} --> {ms_to_srt(end_ms)}"
     
-    def create_shorts_video(self, script, video_id):
+    def start_hook_audio(self, hook_text, video_id):
+        """
+        Hook 오디오 생성을 백그라운드에서 시작 (스트리밍으로 Hook 멘트가 완성되는 즉시 호출)
+        
+        Args:
+            hook_text (str): Hook 멘트
+            video_id (str): YouTube 영상 ID
+        
+        Returns:
+            concurrent.futures.Future: 생성된 오디오 파일 경로를 반환하는 작업
+        """
+        logger.info(f"Hook 오디오 선행 생성 시작: {video_id}")
+        return self._tts_executor.submit(
+            self.generate_tts_audio, hook_text, filename=f"{video_id}_hook.mp3", section='hook'
+        )
+    
+    def _build_render_command(self, source_path, narration_path, subtitle_path, output_path,
+                              start_time=0, duration=SHORTS_DURATION, profile=ENCODING_PROFILE, threads=None):
+        """
+        쇼츠 영상 합성 FFmpeg 명령 생성 (단일 필터 그래프)
+        
+        Args:
+            source_path (str): 원본 영상 경로
+            narration_path (str): 나레이션 오디오 경로
+            subtitle_path (str): 자막 파일 경로
+            output_path (str): 저장할 영상 파일 경로
+            start_time (float): 원본에서 사용할 구간 시작 시간 (초)
+            duration (float): 사용할 구간 길이 (초)
+            profile (str): 인코딩 프로필 이름
+            threads (int): 디코딩/필터/인코딩 스레드 수 (없으면 프로필 설정)
+        
+        Returns:
+            list: FFmpeg 명령
+        """
+        # 입력 앞의 -ss/-t로 필요한 구간만 디코딩
+        filter_graph = ';'.join([
+            f"[0:v]scale=-1:1920,crop=1080:1920,subtitles={_escape_filter_path(subtitle_path)}:force_style='{SUBTITLE_STYLE}'[v]",
+            "[0:a]volume=0.3[a1]",
+            "[1:a]adelay=0|0[a2]",
+            "[a1][a2]amix=inputs=2:duration=first[a]"
+        ])
+        
+        # 입력 앞의 -threads로 디코더 스레드도 할당량에 맞춤 (지정하지 않으면 디코더는 모든 코어 사용)
+        input_threads = ['-threads', str(threads)] if threads else []
+        
+        command = [
+            'ffmpeg', '-y',
+            *input_threads,
+            '-ss', str(start_time),
+            '-t', str(duration),
+            '-i', source_path,
+            *input_threads,
+            '-i', narration_path
+        ]
+        
+        if threads:
+            command += ['-filter_complex_threads', str(threads)]
+        
+        return command + [
+            '-filter_complex', filter_graph,
+            '-map', '[v]',
+            '-map', '[a]',
+            *encoding_args(profile, threads=threads),
+            output_path
+        ]
+    
+    def synthesize_narration(self, script, video_id, hook_audio_path=None, threads=None):
+        """
+        스크립트 전체 나레이션 생성 (구간별 병렬 합성 후 이어 붙임)
+        - 나레이션 소요 시간은 구간 길이의 합이 아니라 가장 오래 걸린 구간에 맞춰집니다.
+        
+        Args:
+            script (dict): 스크립트
+            video_id (str): YouTube 영상 ID
+            hook_audio_path (str): 미리 생성한 Hook 오디오 경로 (없으면 함께 생성)
+            threads (int): 이어 붙이기 FFmpeg 스레드 수 (렌더링 풀의 작업별 할당량)
+        
+        Returns:
+            dict: audio_path (이어 붙인 나레이션), durations (구간별 측정 길이, 초), 실패 시 None
+        """
+        segments = self._script_segments(script)
+        started = time.time()
+        
+        futures = []
+        for i, (section, text) in enumerate(segments):
+            if section == 'hook' and hook_audio_path and os.path.exists(hook_audio_path):
+                futures.append(None)
+                continue
+            futures.append(self._tts_executor.submit(
+                self.generate_tts_audio, text, filename=f"{video_id}_{i:02d}_{section}.mp3", section=section
+            ))
+        
+        paths = []
+        for (section, _), future in zip(segments, futures):
+            path = hook_audio_path if future is None else future.result()
+            if not path:
+                logger.error(f"나레이션 구간 생성 실패: {video_id}, {section}")
+                return None
+            paths.append(path)
+        
+        durations = [probe_duration(path) for path in paths]
+        logger.info(f"나레이션 구간 {len(paths)}개 생성 완료: {video_id} ({time.time() - started:.1f}초, 길이 {sum(durations):.1f}초)")
+        
+        # 디코딩 후 이어 붙여 구간 경계를 측정 길이와 일치시킴
+        narration_path = os.path.join(DATA_DIR, 'audio', f"{video_id}_narration.wav")
+        input_threads = ['-threads', str(threads)] if threads else []
+        command = ['ffmpeg', '-y', '-loglevel', 'error']
+        for path in paths:
+            command += [*input_threads, '-i', path]
+        if threads:
+            command += ['-filter_complex_threads', str(threads), *input_threads]
+        command += [
+            '-filter_complex', ''.join(f"[{i}:a]" for i in range(len(paths))) + f"concat=n={len(paths)}:v=0:a=1[a]",
+            '-map', '[a]',
+            '-c:a', 'pcm_s16le',
+            narration_path
+        ]
+        
+        try:
+            subprocess.run(command, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"나레이션 이어 붙이기 실패: {video_id}, 오류: {e}")
+            return None
+        
+        return {'audio_path': narration_path, 'durations': durations}
+    
+    def create_shorts_video(self, script, video_id, hook_audio_path=None, profile=ENCODING_PROFILE,
+                            threads=None, on_progress=None):
         """
         쇼츠 영상 제작
         
         Args:
             script (dict): 스크립트
             video_id (str): YouTube 영상 ID
+            hook_audio_path (str): 미리 생성한 Hook 오디오 경로 (없으면 새로 생성)
+            profile (str): 인코딩 프로필 이름 (draft, publish, archive)
+            threads (int): FFmpeg 스레드 수 (렌더링 풀의 작업별 할당량, 없으면 프로필 설정)
+            on_progress (callable): (단계, 진행률)을 받을 함수 (단계: narration, download, render)
             
         Returns:
             str: 생성된 영상 파일 경로
         """
         try:
-            # 1. 오디오 생성 (Hook 멘트)
-            hook_audio_path = self.generate_tts_audio(script['hook'], filename=f"{video_id}_hook.mp3")
+            report = on_progress or (lambda stage, percent: None)
+            
+            # 1. 나레이션 생성 (전체 스크립트, 구간별 병렬 합성)
+            report('narration', 0)
+            narration = self.synthesize_narration(script, video_id, hook_audio_path=hook_audio_path, threads=threads)
             
-            if not hook_audio_path:
-                logger.error(f"Hook 오디오 생성 실패: {video_id}")
+            if not narration:
+                logger.error(f"나레이션 생성 실패: {video_id}")
                 return None
             
-            # 2. 영상 다운로드
-            video_path = self.download_video(video_id)
+            # 2. 원본 영상 중 필요한 구간 (자막 처리 단계와 공유하는 캐시)
+            report('download', 0)
+            source_path, clip_offset = self.media_cache.get_clip(video_id, script.get('clip_start', 0), SHORTS_DURATION)
             
-            if not video_path:
+            if not source_path:
                 logger.error(f"영상 다운로드 실패: {video_id}")
                 return None
             
             # 3. 자막 파일 생성
             subtitle_path = os.path.join(TEMP_DIR, f"{video_id}_subtitle.srt")
-            self.create_subtitle_file(script, subtitle_path)
+            self.create_subtitle_file(script, subtitle_path, durations=narration['durations'])
             
-            # 4. 영상 합성
+            # 4. 영상 합성 (구간 자르기, 9:16 크기 조정, 자막, 나레이션 믹스를 한 번의 디코딩/인코딩으로 처리)
             output_path = os.path.join(DATA_DIR, 'output', f"{video_id}_shorts.mp4")
+            command = self._build_render_command(
+                source_path, narration['audio_path'], subtitle_path, output_path,
+                start_time=clip_offset, profile=profile, threads=threads
+            )
             
-            # 영상 크기 조정 (9:16 비율)
-            resized_video_path = os.path.join(TEMP_DIR, f"{video_id}_resized.mp4")
-            
-            # FFmpeg로 영상 크기 조정
-            command = [
-                'ffmpeg',
-                '-i', video_path,
-                '-vf', 'scale=-1:1920,crop=1080:1920',
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-strict', 'experimental',
-                '-b:a', '192k',
-                resized_video_path
-            ]
-            
-            subprocess.run(command, check=True)
-            
-            # 자막 추가
-            subtitled_video_path = os.path.join(TEMP_DIR, f"{video_id}_subtitled.mp4")
-            
-            # FFmpeg로 자막 추가
-            command = [
-                'ffmpeg',
-                '-i', resized_video_path,
-                '-vf', f"subtitles={subtitle_path}:force_style='FontName=Arial,FontSize=24,PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,BackColour=&H00000000,Bold=1,Alignment=10,MarginV=20'",
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-strict', 'experimental',
-                '-b:a', '192k',
-                subtitled_video_path
-            ]
-            
-            subprocess.run(command, check=True)
-            
-            # Hook 오디오 추가
-            # FFmpeg로 오디오 추가
-            command = [
-                'ffmpeg',
-                '-i', subtitled_video_path,
-                '-i', hook_audio_path,
-                '-filter_complex', '[0:a]volume=0.3[a1];[1:a]adelay=0|0[a2];[a1][a2]amix=inputs=2:duration=first',
-                '-c:v', 'copy',
-                output_path
-            ]
-            
-            subprocess.run(command, check=True)
+            started = time.time()
+            run_ffmpeg(command, duration=SHORTS_DURATION, on_progress=lambda percent: report('render', percent))
+            logger.info(f"영상 합성 시간: {time.time() - started:.1f}초 (프로필: {profile})")
             
             if os.path.exists(output_path):
                 logger.info(f"쇼츠 영상 제작 완료: {output_path}")
                 
+                tts_stats = self.tts_cache.stats()
+                logger.info(
+                    f"TTS 캐시: 적중 {tts_stats['hits']}회, 절약 {tts_stats['characters_saved']}자 "
+                    f"(누적 {tts_stats['total_characters_saved']}자)"
+                )
+                
                 # 임시 파일 삭제
-                for temp_file in [resized_video_path, subtitled_video_path, subtitle_path]:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
+                if os.path.exists(subtitle_path):
+                    os.remove(subtitle_path)
                 
                 return output_path
             else:
@@ -190,6 +190,67 @@ class YouTubeUploader:
             logger.error(f"영상 업로드 중 오류 발생: {e}")
             return None
     
+    def update_video_metadata(self, video_id, title, tags, description=None):
+        """
+        업로드된 영상의 제목/태그 변경
+        
+        Args:
+            video_id (str): YouTube 영상 ID
+            title (str): 새 영상 제목
+            tags (list): 새 해시태그 목록
+            description (str): 새 영상 설명 (없으면 기존 설명 유지)
+        
+        Returns:
+            bool: 변경 성공 여부
+        """
+        try:
+            if not self.youtube:
+                if not self.authenticate():
+                    logger.error("YouTube API 인증이 필요합니다.")
+                    return False
+            
+            # 기존 snippet 조회 (업데이트 시 categoryId 등 필수 항목 유지)
+            response = self.youtube.videos().list(part='snippet', id=video_id).execute()
+            if not response.get('items'):
+                logger.error(f"영상을 찾을 수 없습니다: {video_id}")
+                return False
+            
+            snippet = response['items'][0]['snippet']
+            snippet['title'] = title
+            snippet['tags'] = tags
+            if description is not None:
+                snippet['description'] = description
+            
+            self.youtube.videos().update(
+                part='snippet',
+                body={'id': video_id, 'snippet': snippet}
+            ).execute()
+            
+            logger.info(f"영상 메타데이터 변경 완료: {video_id}")
+            
+            # 업로드 정보 갱신
+            upload_file = os.path.join(DATA_DIR, 'analytics', f"upload_{video_id}.json")
+            if os.path.exists(upload_file):
+                with open(upload_file, 'r', encoding='utf-8') as f:
+                    upload_info = json.load(f)
+                upload_info.update({
+                    'title': title,
+                    'tags': tags,
+                    'description': snippet.get('description', upload_info.get('description')),
+                    'metadata_updated_at': datetime.now().isoformat()
+                })
+                with open(upload_file, 'w', encoding='utf-8') as f:
+                    json.dump(upload_info, f, ensure_ascii=False, indent=2)
+            
+            return True
+        
+        except HttpError as e:
+            logger.error(f"영상 메타데이터 변경 중 HTTP 오류 발생: {e.resp.status}, {e.content}")
+            return False
+        except Exception as e:
+            logger.error(f"영상 메타데이터 변경 중 오류 발생: {e}")
+            return False
+    
     def get_video_analytics(self, video_id, start_date=None, end_date=None, metrics=None):
         """
         영상 성과 지표 수집